@@ -0,0 +1,152 @@
+"""Reproducible DSP and websocket benchmarks for main.py.
+
+Synthetic gunshot and noise frames are generated at known angles from a fixed seed, so runs are
+comparable across machines and commits. ``--save`` writes a baseline, ``--check`` compares against
+it and exits non-zero on a timing regression beyond ``--tolerance`` or on a localisation miss.
+
+    python bench.py --save bench_baseline.json
+    python bench.py --check bench_baseline.json --tolerance 0.25
+"""
+import os
+os.environ.setdefault("SENTINEL_EVENT_DB", ":memory:")   # never write benchmark shots into the real log
+
+import argparse, asyncio, json, math, socket, statistics, sys, threading, time
+import numpy as np
+import main
+
+SR, SPACING = main.SAMPLE_RATE, 0.5
+ANGLES = (20.0, 45.0, 60.0, 90.0, 120.0, 150.0)
+GATE_BUDGET = 0.5   # a gated (silent) frame must cost under this fraction of analysing it alone
+
+def delay_for(angle, spacing=SPACING, sr=SR):
+    """Samples by which mic A lags mic B for a far-field source at ``angle`` degrees."""
+    return spacing * math.cos(math.radians(angle)) / main.SPEED_OF_SOUND * sr
+
+def shift(x, d):
+    """Fractional delay by ``d`` samples via a linear phase ramp."""
+    n = len(x) * 2
+    X = np.fft.rfft(x, n=n)
+    return np.fft.irfft(X * np.exp(-2j * np.pi * np.fft.rfftfreq(n) * d), n=n)[:len(x)]
+
+def shot_frame(rng, n, angle, noise=0.01):
+    """Decaying broadband burst at ``angle`` on top of independent sensor noise, (2, n) float32."""
+    t = np.arange(n)
+    src = np.zeros(n); k = n // 4
+    src[k:] = rng.standard_normal(n - k) * 0.8 * np.exp(-t[: n - k] / (n / 8))   # decay scales so RMS holds per size
+    a, b = shift(src, delay_for(angle)), src
+    return (np.stack([a, b]) + rng.standard_normal((2, n)) * noise).astype(np.float32)
+
+def noise_frame(rng, n, level=0.01):
+    return (rng.standard_normal((2, n)) * level).astype(np.float32)
+
+def timeit(fn, min_time=0.2, repeat=5):
+    """Median seconds per call over ``repeat`` runs of at least ``min_time`` each."""
+    fn(); t0, calls = time.perf_counter(), 0
+    while time.perf_counter() - t0 < min_time / 10: fn(); calls += 1
+    calls = max(1, int(calls * 10 / repeat))
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(calls): fn()
+        runs.append((time.perf_counter() - t0) / calls)
+    return statistics.median(runs)
+
+def bench_dsp(sizes, batch=32):
+    rng, res, errors = np.random.default_rng(1), {}, []
+    for n in sizes:
+        shots = [shot_frame(rng, n, a) for a in ANGLES]
+        x, y = shots[0]
+        max_lag = int(math.ceil(SPACING / main.SPEED_OF_SOUND * SR)) + 1
+        res[f"gcc_phat/{n}"] = timeit(lambda: main.gcc_phat(x, y, max_lag))
+        res[f"classify/{n}"] = timeit(lambda: main.classify(x, y, main.GUNSHOT_RMS_THRESHOLD))
+        X = np.stack([shots[i % len(shots)] for i in range(batch)])
+        res[f"analyze_batch/{n}"] = timeit(lambda: main.analyze_batch(X[:, 0], X[:, 1], SPACING, SR)) / batch
+        res[f"analyze_frame/{n}"] = timeit(lambda: main.analyze_batch(X[:1, 0], X[:1, 1], SPACING, SR))
+        gate, quiet = main.OnsetGate(), [noise_frame(rng, n) for _ in range(16)]
+        feed = iter(range(1 << 62))
+        res[f"gate/{n}"] = timeit(lambda: gate.feed(quiet[next(feed) % len(quiet)], SR))
+        if gate.onsets: errors.append(f"n={n}: onset gate fired on noise")
+        if res[f"gate/{n}"] > GATE_BUDGET * res[f"analyze_frame/{n}"]:
+            errors.append(f"n={n}: gated frame costs {res[f'gate/{n}'] / res[f'analyze_frame/{n}']:.0%} "
+                          f"of an analysed one (budget {GATE_BUDGET:.0%})")
+        for angle, r in zip(ANGLES, main.analyze_batch(X[:len(ANGLES), 0], X[:len(ANGLES), 1], SPACING, SR)):
+            # integer-lag GCC: the lag may be off by rounding, never by more than a sample
+            if abs(r["lag"] - delay_for(angle)) > 1.0 or not r["is_gunshot"]:
+                errors.append(f"n={n} angle={angle}: lag {r['lag']} (want {delay_for(angle):.2f}), "
+                              f"doa {r['doa']:.1f}, gunshot={r['is_gunshot']}")
+        if main.analyze_batch(*np.stack([noise_frame(rng, n)] * 4).transpose(1, 0, 2), SPACING, SR)[0]["is_gunshot"]:
+            errors.append(f"n={n}: noise frame classified as gunshot")
+    res["tdoa_to_doa"] = timeit(lambda: main.tdoa_to_doa(7, SPACING))
+    return res, errors
+
+def _free_port():
+    with socket.socket() as s: s.bind(("127.0.0.1", 0)); return s.getsockname()[1]
+
+async def _client(url, frames, lat):
+    import websockets
+    async with websockets.connect(url, max_size=None) as ws:
+        for seq, frame in enumerate(frames):
+            hdr = main.FRAME_HDR.pack(main.FRAME_MAGIC, main.FRAME_VERSION, 1, 2, main.FLAG_BINARY_RESULT, seq, SR, SPACING)
+            t0 = time.perf_counter()
+            await ws.send(hdr + frame.T.astype("<f4").tobytes())
+            while main.RESULT_HDR.unpack_from(await ws.recv())[1] != seq: pass   # skip replies dropped behind us
+            lat.append(time.perf_counter() - t0)
+
+def bench_ws(sizes, connections, n_frames, shot_every=25):
+    """Round-trip latency of the /ws/audio loop against an in-process uvicorn server."""
+    import uvicorn
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True); thread.start()
+    while not server.started: time.sleep(0.01)
+    res, rng = {}, np.random.default_rng(2)
+    try:
+        for n in sizes:
+            frames = [shot_frame(rng, n, ANGLES[i % len(ANGLES)]) if i % shot_every == shot_every - 1
+                      else noise_frame(rng, n) for i in range(n_frames)]
+            for conns in connections:
+                lat = []
+                async def run():
+                    await asyncio.gather(*(_client(f"ws://127.0.0.1:{port}/ws/audio", frames, lat)
+                                           for _ in range(conns)))
+                t0 = time.perf_counter(); asyncio.run(run()); wall = time.perf_counter() - t0
+                lat.sort()
+                res[f"ws_p50/{n}x{conns}"] = lat[len(lat) // 2]
+                res[f"ws_p99/{n}x{conns}"] = lat[min(len(lat) - 1, int(len(lat) * 0.99))]
+                res[f"ws_fps/{n}x{conns}"] = len(lat) / wall
+    finally:
+        server.should_exit = True; thread.join()
+    return res
+
+def fmt(name, v):
+    return f"{name:<28} {v:>10.1f} frames/s" if name.startswith("ws_fps") else f"{name:<28} {v * 1e6:>10.1f} us"
+
+def regressions(res, base, tolerance):
+    out = []
+    for k, v in res.items():
+        b = base.get(k)
+        if b is None: continue
+        worse = v < b * (1 - tolerance) if k.startswith("ws_fps") else v > b * (1 + tolerance)
+        if worse: out.append(f"{k}: {fmt('', v).strip()} vs baseline {fmt('', b).strip()}")
+    return out
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Acoustic Sentinel DSP benchmarks")
+    ap.add_argument("--sizes", default="512,1024,2048,4096", help="frame sizes in samples")
+    ap.add_argument("--connections", default="1,8,32", help="concurrent sensor sockets for the ws loop")
+    ap.add_argument("--frames", type=int, default=200, help="frames per sensor socket")
+    ap.add_argument("--no-ws", action="store_true", help="skip the websocket loop")
+    ap.add_argument("--save", metavar="FILE", help="write results as a baseline")
+    ap.add_argument("--check", metavar="FILE", help="compare against a baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown fraction before failing")
+    a = ap.parse_args()
+    sizes = [int(s) for s in a.sizes.split(",")]
+    res, errors = bench_dsp(sizes)
+    if not a.no_ws: res.update(bench_ws(sizes, [int(c) for c in a.connections.split(",")], a.frames))
+    for k, v in res.items(): print(fmt(k, v))
+    if a.save:
+        with open(a.save, "w") as f: json.dump(res, f, indent=1, sort_keys=True)
+    if a.check:
+        with open(a.check) as f: errors += regressions(res, json.load(f), a.tolerance)
+    for e in errors: print("FAIL", e, file=sys.stderr)
+    sys.exit(1 if errors else 0)
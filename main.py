@@ -2,67 +2,760 @@
 ACOUSTIC SENTINEL v3.0 - Full Stack Deploy
 New: Map view, multiple gunshot tracking, sound alarm
 """
-import json, math, time
+import asyncio, bisect, contextlib, functools, json, math, os, shutil, sqlite3, struct, subprocess, sys, tempfile, threading, time
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
 import numpy as np
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, File, HTTPException, Query, UploadFile, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 
 SPEED_OF_SOUND = 343.0
 SAMPLE_RATE    = 44100
 GUNSHOT_RMS_THRESHOLD = 0.12
-COOLDOWN_FRAMES = 30
-MAX_EVENTS = 200
+COOLDOWN_SECONDS = 1.4          # shared by all sensors: one shot heard by several nodes is one event
+MAX_EVENTS = 200                # recent events kept in memory; the full history lives in EVENT_DB
+EVENT_DB = os.environ.get("SENTINEL_EVENT_DB", "sentinel_events.db")
+EVENT_PAGE_MAX = 1000
 
-app = FastAPI(title="Acoustic Sentinel v3")
+# Viewer fan-out on /ws/events: per-client send queue and what to do when it fills up
+VIEWER_QUEUE = 64
+VIEWER_POLICIES = ("drop", "coalesce", "disconnect")   # drop oldest / keep only latest / close the socket
+VIEWER_POLICY = "drop"
+
+# Shared worker state: "local" (single process) or "unix:/path/broker.sock" for gunicorn -w N
+STATE_BACKEND = os.environ.get("SENTINEL_STATE", "local")
+BROKER_CLAIM_TIMEOUT = 1.0
+BROKER_IDLE_EXIT = 5.0        # a worker-spawned broker exits this long after its last worker disconnects
+BROKER_PEER_BUFFER = 1 << 20  # bytes queued for one worker before the broker drops it
+
+# Offline analysis of recorded archives (python main.py analyze, POST /api/analyze)
+ARCHIVE_DIR = os.environ.get("SENTINEL_ARCHIVE_DIR", "recordings")   # server-side paths resolve inside this
+ANALYZE_CHUNK_FRAMES = 512                                          # analysis frames materialised at once
+
+# Instrumentation
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+PROFILE_ENABLED = os.environ.get("SENTINEL_PROFILE") == "1"   # mounts /api/profile; off by default
+PROFILE_MAX_SECONDS = 60
+
+# Binary frame: header + interleaved little-endian PCM (frames x channels)
+# magic, version, dtype code, channels, flags, seq, sample rate, mic spacing
+FRAME_HDR = struct.Struct("<2sBBHHIIf")
+FRAME_MAGIC, FRAME_VERSION = b"AS", 1
+FRAME_DTYPES = {0: np.dtype("<i2"), 1: np.dtype("<f4")}
+FLAG_BINARY_RESULT = 0x1
+FLAG_GEOMETRY = 0x2      # header is followed by channels x (x, y, z) float32 mic positions in metres
+# Binary result: magic, seq, doa, tdoa_ms, rms_a, rms_b, db_a, db_b, snr, gcc_peak, confidence, is_gunshot, timestamp
+RESULT_HDR = struct.Struct("<2sxxI9fBxxxd")
+RESULT_MAGIC = b"AR"
+ARRAY_TAIL = struct.Struct("<3f")   # appended for array frames: elevation, srp_peak, channels
+ARRAY_GRID_DEG = 2                  # SRP-PHAT steering grid resolution
+
+# Streaming onset gate: full analysis only runs on windows centred on an STA/LTA onset
+ONSET_SHORT_S, ONSET_LONG_S, ONSET_PEAK_S = 0.002, 0.5, 0.01   # EMA time constants
+ONSET_RATIO = 6.0                                              # short/long-term energy ratio
+ONSET_MIN_RMS = GUNSHOT_RMS_THRESHOLD / 2                      # short-term level floor
+EMA_BLOCK = 512
+
+# DSP execution: "thread" (NumPy releases the GIL) or "process" (shared-memory hand-off)
+DSP_MODE = os.environ.get("SENTINEL_DSP_MODE", "thread")
+DSP_WORKERS = int(os.environ.get("SENTINEL_DSP_WORKERS", os.cpu_count() or 2))
+DSP_QUEUE_DEPTH = int(os.environ.get("SENTINEL_DSP_QUEUE", 4))   # in-flight frames per connection
+DSP_BATCH_WINDOW = 0.002                                         # seconds to gather a micro-batch
+DSP_MAX_BATCH = 64
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    store.open()
+    await state.start()
+    yield
+    dsp.shutdown(); await state.stop()
+
+app = FastAPI(title="Acoustic Sentinel v3", lifespan=lifespan)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
-events: list[dict] = []
+class EventStore:
+    """Append-only SQLite event log with monotonic ids, fronted by a ring of the newest events.
+
+    The database is opened by the app's lifespan (or on first use), so importing main, e.g. in
+    DSP pool children, the analyze CLI or bench.py, never creates the file.
+    """
+    def __init__(self, path=EVENT_DB, ring=MAX_EVENTS):
+        self.path, self._db, self._readers = path, None, threading.local()
+        self.recent = deque(maxlen=ring)
+
+    @property
+    def db(self):
+        if self._db is None: self.open()
+        return self._db
+
+    def open(self):
+        if self._db is not None: return
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL"); db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp REAL NOT NULL,
+                doa REAL, confidence REAL, data TEXT NOT NULL);
+            DROP INDEX IF EXISTS events_ts; DROP INDEX IF EXISTS events_conf;
+            CREATE INDEX IF NOT EXISTS events_ts_id ON events(timestamp, id);
+            CREATE INDEX IF NOT EXISTS events_doa ON events(doa);
+            CREATE INDEX IF NOT EXISTS events_conf_id ON events(confidence, id);""")
+        rows = db.execute("SELECT id, data FROM events ORDER BY id DESC LIMIT ?", (self.recent.maxlen,)).fetchall()
+        for r in reversed(rows): self.remember(self._row(r))
+        self._db = db
+
+    def reader(self):
+        """This thread's read connection: queries run in the threadpool and, under WAL, never wait on add()."""
+        db = self.db
+        if self.path == ":memory:": return db   # a private in-memory database only exists on its own connection
+        conn = getattr(self._readers, "db", None)
+        if conn is None: conn = self._readers.db = sqlite3.connect(self.path, check_same_thread=False)
+        return conn
+
+    @staticmethod
+    def _row(r): return {"id": r[0], **json.loads(r[1])}
+
+    def add(self, event):
+        """Persist an event, assigning its id; returns the stored event."""
+        event = {k: v for k, v in event.items() if k != "id"}
+        cur = self.db.execute("INSERT INTO events (timestamp, doa, confidence, data) VALUES (?, ?, ?, ?)",
+                              (event["timestamp"], event.get("doa"), event.get("confidence"), json.dumps(event)))
+        return {"id": cur.lastrowid, **event}
+
+    def remember(self, event):
+        """Put a stored event (from any worker) into the recent ring, keeping id order."""
+        if self.recent and event["id"] <= self.recent[-1]["id"]:
+            if any(e["id"] == event["id"] for e in self.recent): return
+            self.recent = deque(sorted([*self.recent, event], key=lambda e: e["id"]), maxlen=self.recent.maxlen)
+        else: self.recent.append(event)
+
+    def query(self, since_id=None, cursor=None, start=None, end=None, doa_min=None, doa_max=None,
+              min_confidence=None, limit=100):
+        """Filtered page of events and the cursor for the next one.
+
+        since_id pages forward (oldest first) for incremental polling; otherwise pages run newest
+        first and ``cursor`` is the last event id of the previous page. Time windows page in
+        (timestamp, id) order along their index. A doa_min > doa_max range wraps through 0.
+        """
+        limit = max(1, min(int(limit), EVENT_PAGE_MAX))
+        plain = cursor is None and start is None and end is None and doa_min is None and doa_max is None \
+            and min_confidence is None
+        recent = list(self.recent)   # one atomic snapshot: the loop keeps appending while we read
+        first = self._ring_first(recent) if plain else None
+        if first is not None and since_id is not None and since_id >= recent[0]["id"] - 1:
+            page = [e for e in recent if e["id"] > since_id][:limit]
+            return page, (page[-1]["id"] if page else since_id)
+        # newest page straight from the ring when it either covers the page or holds the whole log
+        if first is not None and since_id is None and (len(recent) > limit or first == recent[0]["id"]):
+            page = recent[::-1][:limit]
+            return page, (page[-1]["id"] if len(recent) > limit else None)
+        db, where, args = self.reader(), [], []
+        if start is not None: where.append("timestamp >= ?"); args.append(start)
+        if end is not None: where.append("timestamp < ?"); args.append(end)
+        doa, doa_args = [], []
+        if doa_min is not None and doa_max is not None and doa_min > doa_max:
+            doa.append("(doa >= ? OR doa <= ?)"); doa_args += [doa_min, doa_max]
+        else:
+            if doa_min is not None: doa.append("doa >= ?"); doa_args.append(doa_min)
+            if doa_max is not None: doa.append("doa <= ?"); doa_args.append(doa_max)
+        conf = ["confidence >= ?"] if min_confidence is not None else []
+        where += doa + conf; args += doa_args + [min_confidence] * len(conf)
+        if since_id is not None:
+            where.append("id > ?"); args.append(since_id); order, hint = "id ASC", ""
+        else:
+            # the confidence or doa index, when the probe finds it selective
+            hint = next((f" INDEXED BY {ix}" for ix, c, a in (("events_conf_id", conf, [min_confidence]),
+                         ("events_doa", doa, doa_args)) if c and self._narrow(db, ix, " AND ".join(c), a, limit)), "")
+            if start is not None or end is not None:
+                if cursor is not None:
+                    where.append("(timestamp, id) < (SELECT timestamp, id FROM events WHERE id = ?)"); args.append(cursor)
+                order, hint = "timestamp DESC, id DESC", hint or " INDEXED BY events_ts_id"
+            else:
+                if cursor is not None: where.append("id < ?"); args.append(cursor)
+                # a broad filter walks ids newest first and fills the page almost at once
+                order, hint = "id DESC", hint or (" NOT INDEXED" if conf or doa else "")
+        sql = f"SELECT id, data FROM events{hint}" + (" WHERE " + " AND ".join(where) if where else "") + \
+              f" ORDER BY {order} LIMIT ?"
+        page = [self._row(r) for r in db.execute(sql, args + [limit + 1])]
+        more = len(page) > limit
+        page = page[:limit]
+        if since_id is not None: return page, (page[-1]["id"] if page else since_id)
+        return page, (page[-1]["id"] if more else None)
+
+    def _ring_first(self, recent):
+        """The log's first id if the ring is exactly its newest events, else None.
+
+        Ids are handed out without gaps and only clear() deletes, so a ring that ends at the last
+        id, runs without gaps and starts no earlier than the log is current. Other workers' events
+        (gunicorn -w N without a broker, or ones the broker has yet to relay) and clears made
+        elsewhere show up as a gap, a short tail or a missing head.
+        """
+        if not recent or recent[-1]["id"] - recent[0]["id"] != len(recent) - 1: return None
+        first, last = self.reader().execute(
+            "SELECT MIN(id), (SELECT seq FROM sqlite_sequence WHERE name = 'events') FROM events").fetchone()
+        return first if last == recent[-1]["id"] and first is not None and first <= recent[0]["id"] else None
+
+    @staticmethod
+    def _narrow(db, index, clause, args, limit):
+        # SQLite can't tell a selective filter from a broad one and guesses wrong both ways, so
+        # count the hits on the index, up to a few pages' worth, and sort them only if they are few
+        cap = 16 * (limit + 1)
+        return db.execute(f"SELECT COUNT(*) FROM (SELECT 1 FROM events INDEXED BY {index} WHERE {clause} LIMIT ?)",
+                          args + [cap]).fetchone()[0] < cap
+
+    def count(self): return self.db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    def last_id(self):
+        row = self.reader().execute("SELECT seq FROM sqlite_sequence WHERE name = 'events'").fetchone()
+        return row[0] if row else 0
+
+    def clear(self):
+        # AUTOINCREMENT keeps sqlite_sequence, so ids never repeat after a clear
+        self.db.execute("DELETE FROM events"); self.recent.clear()
+
+store = EventStore()
+class Histogram:
+    """Cumulative-at-render latency histogram; observe() is a bisect and three adds."""
+    def __init__(self): self.counts, self.sum, self.n = [0] * (len(LATENCY_BUCKETS) + 1), 0.0, 0
+    def observe(self, v, n=1):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, v)] += n; self.sum += v * n; self.n += n
+    def merge(self, counts, total, n):
+        for i, c in enumerate(counts): self.counts[i] += c
+        self.sum += total; self.n += n
+
+class Metrics:
+    """Hot-path counters, per-second frame rate and per-stage latencies, rendered as Prometheus text.
+
+    Counters and the frame rate are only touched on the event loop. Stage histograms are also fed
+    from DSP pool threads, so they sit behind a lock.
+    """
+    def __init__(self):
+        self.stages, self.lock = {}, threading.Lock()
+        self.counters = Counter(dict.fromkeys(("frames", "frames_gated", "onsets", "frames_dropped",
+                                               "viewer_dropped", "dsp_batches"), 0))
+        self.started, self.sec, self.in_sec, self.fps = time.time(), 0, 0, 0
+
+    def observe(self, stage, seconds, n=1):
+        """Record ``n`` samples of ``seconds``: batched stages pass their per-frame mean once per frame."""
+        with self.lock:
+            h = self.stages.get(stage)
+            if h is None: h = self.stages[stage] = Histogram()
+            h.observe(seconds, n)
+
+    def frame(self):
+        sec = int(time.monotonic())
+        if sec != self.sec: self.fps, self.sec, self.in_sec = (self.in_sec if sec == self.sec + 1 else 0), sec, 0
+        self.in_sec += 1; self.counters["frames"] += 1
+
+    def drain(self):
+        """Hand this process's stage histograms to the parent (process-pool DSP) and reset them."""
+        with self.lock:
+            out = {k: (h.counts, h.sum, h.n) for k, h in self.stages.items()}
+            self.stages = {}
+        return out
+
+    def merge(self, drained):
+        with self.lock:
+            for k, v in drained.items():
+                h = self.stages.get(k)
+                if h is None: h = self.stages[k] = Histogram()
+                h.merge(*v)
+
+    def render(self, gauges):
+        with self.lock: stages = {k: (list(h.counts), h.sum, h.n) for k, h in self.stages.items()}
+        out = ["# HELP sentinel_stage_seconds Per-frame stage latency (batched DSP stages: batch mean per frame).",
+               "# TYPE sentinel_stage_seconds histogram"]
+        for stage, (counts, total, n) in sorted(stages.items()):
+            acc = 0
+            for le, c in zip(LATENCY_BUCKETS + ("+Inf",), counts):
+                acc += c; out.append(f'sentinel_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {acc}')
+            out += [f'sentinel_stage_seconds_sum{{stage="{stage}"}} {total}',
+                    f'sentinel_stage_seconds_count{{stage="{stage}"}} {n}']
+        for name, v in sorted(self.counters.items()):
+            out += [f"# TYPE sentinel_{name}_total counter", f"sentinel_{name}_total {v}"]
+        stale = int(time.monotonic()) > self.sec + 1
+        for name, v in sorted({**gauges, "frames_per_second": 0 if stale else self.fps}.items()):
+            out += [f"# TYPE sentinel_{name} gauge", f"sentinel_{name} {v}"]
+        return "\n".join(out) + "\n"
+
+metrics = Metrics()
+
+class SamplingProfiler:
+    """Optional sampling profiler: a thread snapshots every stack at ``hz``; output is collapsed stacks."""
+    def __init__(self, hz=100): self.hz, self.samples, self.running = hz, Counter(), False
+
+    def _loop(self):
+        me = threading.get_ident()
+        while self.running:
+            for tid, frame in sys._current_frames().items():
+                if tid == me: continue
+                stack = []
+                while frame is not None:
+                    stack.append(f"{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)})")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+            time.sleep(1.0 / self.hz)
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True); self.thread.start()
+
+    def stop(self):
+        self.running = False; self.thread.join()
+        return "".join(f"{k} {v}\n" for k, v in self.samples.most_common())
 
 def rms(s): return float(np.sqrt(np.mean(s**2)))
 def db(s):  return 20 * math.log10(max(rms(s), 1e-10))
 
+def _blocks(x, p):
+    # frame as (blocks, len(p)) scaled by a**-k; zero padding past the end never reaches out[:len(x)]
+    nb = -(-len(x) // len(p))
+    xb = np.zeros((nb, len(p))); xb.ravel()[:len(x)] = x
+    xb /= p
+    return xb
+
+def _ema(x, a, y0, p):
+    """y[k] = a*y[k-1] + (1-a)*x[k] over a whole frame; p = a**(1..EMA_BLOCK).
+
+    Blocks keep a**-k well inside float64. All in-block sums are one cumsum; only the
+    carried-in value steps from block to block.
+    """
+    cs = np.cumsum(_blocks(x, p), axis=1); cs *= 1 - a
+    y = np.empty(len(cs))
+    for b in range(len(cs)): y[b] = y0; y0 = p[-1] * (y0 + cs[b, -1])
+    cs += y[:, None]; cs *= p
+    return cs.ravel()[:len(x)]
+
+def _peak_env(x, a, y0, p):
+    """Decaying peak hold y[k] = max(x[k], a*y[k-1]), blockwise like _ema."""
+    m = np.maximum.accumulate(_blocks(x, p), axis=1)
+    for b in range(len(m)): np.maximum(m[b], y0, out=m[b]); y0 = p[-1] * m[b, -1]
+    m *= p
+    return m.ravel()[:len(x)]
+
+FFTPlan = namedtuple("FFTPlan", "n max_lag n_fft window")
+
+def _fast_len(n):
+    """Smallest 2^a * 3^b * 5^c >= n; pocketfft is fastest on these sizes."""
+    best, p5 = 1 << (n - 1).bit_length(), 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            m = p35
+            while m < n: m *= 2
+            best = min(best, m); p35 *= 3
+        p5 *= 5
+    return best
+
+@functools.lru_cache(maxsize=256)
+def fft_plan(n, max_lag):
+    # Only lags within +-max_lag are searched, so the padded size just has to keep
+    # those lags free of circular wrap-around (n + max_lag), not hold the full 2n-1.
+    max_lag = max(0, min(int(max_lag), n - 1))
+    n_fft = _fast_len(n + max_lag)
+    return FFTPlan(n, max_lag, n_fft, np.r_[n_fft-max_lag:n_fft, 0:max_lag+1])
+
+def frame_plan(n, sr, spacing):
+    return fft_plan(n, int((spacing / SPEED_OF_SOUND) * sr) + 10)
+
+_tls = threading.local()
+
+def _scratch(rows, cols):
+    # per-thread float64 buffer, grown on demand and reused across frames
+    bufs = _tls.__dict__.setdefault("bufs", {})
+    buf = bufs.get(cols)
+    if buf is None or buf.shape[0] < rows: buf = bufs[cols] = np.empty((rows, cols))
+    return buf[:rows]
+
+class FrameAnalysis:
+    """Spectra and energy stats for a block of 2-channel frames (one row per frame), each computed once.
+
+    ``spec_a`` (channel A at the plan's padded length) feeds both GCC-PHAT and the flatness
+    measure; callers that already hold it, like the array path, pass it in.
+    """
+    def __init__(self, A, B, plan=None, spec_a=None):
+        self.A, self.B = np.atleast_2d(A), np.atleast_2d(B)
+        self.plan = plan or frame_plan(self.A.shape[1], SAMPLE_RATE, 0.5)
+        if spec_a is not None: self.spec_a = spec_a
+
+    @functools.cached_property
+    def spec_a(self): return np.fft.rfft(self.A, n=self.plan.n_fft, axis=1)
+
+    @functools.cached_property
+    def rms_a(self): return np.sqrt(np.einsum("ij,ij->i", self.A, self.A, dtype=np.float64) / self.A.shape[1])
+    @functools.cached_property
+    def rms_b(self): return np.sqrt(np.einsum("ij,ij->i", self.B, self.B, dtype=np.float64) / self.B.shape[1])
+    @property
+    def db_a(self): return 20 * np.log10(np.maximum(self.rms_a, 1e-10))
+    @property
+    def db_b(self): return 20 * np.log10(np.maximum(self.rms_b, 1e-10))
+
+    def gcc(self):
+        """GCC-PHAT peak lag and height per row, searched over the plan's lag window."""
+        p = self.plan
+        G = np.conj(np.fft.rfft(self.B, n=p.n_fft, axis=1))
+        G *= self.spec_a
+        denom = np.abs(G, out=_scratch(*G.shape))
+        np.maximum(denom, 1e-10, out=denom)
+        G /= denom
+        cc = np.fft.irfft(G, n=p.n_fft, axis=1)[:, p.window]
+        idx = np.argmax(cc, axis=1)
+        return idx - p.max_lag, cc[np.arange(len(idx)), idx]
+
+    def classify(self, threshold):
+        """(is_gunshot, confidence) arrays; the flatness spectrum is only taken for rows over threshold."""
+        r = self.rms_a
+        hit = r >= threshold
+        conf = np.zeros(len(r))
+        if hit.any():
+            # reuse the GCC spectrum when it exists; classify-only callers transform just the hits
+            spec = np.abs(self.spec_a[hit] if "spec_a" in self.__dict__ else
+                          np.fft.rfft(self.A[hit], n=self.plan.n_fft, axis=1))
+            flat = np.exp(np.mean(np.log(spec + 1e-10), axis=1)) / (np.mean(spec, axis=1) + 1e-10)
+            conf[hit] = 0.6 * np.minimum(r[hit] / (threshold * 3), 1.0) + 0.4 * np.minimum(flat / 0.3, 1.0)
+        return hit, conf
+
 def gcc_phat(x, y, max_lag=None):
-    n = len(x) + len(y) - 1
-    n_fft = 1 << (n - 1).bit_length()
-    X, Y = np.fft.rfft(x, n=n_fft), np.fft.rfft(y, n=n_fft)
-    G = X * np.conj(Y)
-    denom = np.abs(G); denom[denom < 1e-10] = 1e-10
-    G /= denom
-    cc = np.fft.irfft(G, n=n_fft)
     if max_lag is None: max_lag = len(x) // 2
-    cc = np.concatenate([cc[-max_lag:], cc[:max_lag+1]])
-    lag = int(np.argmax(cc)) - max_lag
-    return lag, float(np.max(cc))
+    lag, peak = FrameAnalysis(x, y, fft_plan(len(x), max_lag)).gcc()
+    return int(lag[0]), float(peak[0])
 
-def tdoa_to_doa(lag, spacing):
-    tau = lag / SAMPLE_RATE
+def tdoa_to_doa(lag, spacing, sr=SAMPLE_RATE):
+    tau = lag / sr
     c = max(-1.0, min(1.0, (SPEED_OF_SOUND * tau) / spacing))
     return math.degrees(math.acos(c))
 
-def classify(sig_a, sig_b, threshold):
-    r = rms(sig_a)
-    if r < threshold: return False, 0.0
-    spec = np.abs(np.fft.rfft(sig_a))
-    geo = np.exp(np.mean(np.log(spec + 1e-10)))
-    arith = np.mean(spec)
-    conf = 0.6 * min(r / (threshold * 3), 1.0) + 0.4 * min((geo / (arith + 1e-10)) / 0.3, 1.0)
-    return True, float(conf)
+def round_deg(x, nd):
+    """Round a bearing and wrap it into [0, 360): 359.996 rounds to 0.0, not 360.0."""
+    return round(x, nd) % 360.0
+
+def classify(sig_a, sig_b, threshold, spacing=0.5, sr=SAMPLE_RATE):
+    # flatness is measured at the plan's padded length: use the live path's plan so the scores agree
+    hit, conf = FrameAnalysis(sig_a, sig_b, frame_plan(len(sig_a), sr, spacing)).classify(threshold)
+    return bool(hit[0]), float(conf[0])
+
+def decode_frame(msg):
+    """Turn a websocket message into (channels x samples, spacing, sr, seq, binary_reply, geometry)."""
+    if msg.get("bytes") is not None:
+        buf = msg["bytes"]
+        if len(buf) < FRAME_HDR.size: raise ValueError("short frame")
+        magic, ver, code, n_ch, flags, seq, sr, spacing = FRAME_HDR.unpack_from(buf)
+        if magic != FRAME_MAGIC or ver != FRAME_VERSION: raise ValueError("bad frame header")
+        dt = FRAME_DTYPES.get(code)
+        if dt is None or n_ch < 2: raise ValueError("unsupported frame format")
+        off, geometry = FRAME_HDR.size, None
+        if flags & FLAG_GEOMETRY:
+            pos = np.frombuffer(buf, dtype="<f4", count=n_ch * 3, offset=off).reshape(n_ch, 3)
+            geometry, off = tuple(map(tuple, pos.tolist())), off + pos.nbytes
+        n, rest = divmod(len(buf) - off, dt.itemsize * n_ch)
+        if rest: raise ValueError("frame payload is not a whole number of samples")
+        pcm = np.frombuffer(buf, dtype=dt, count=n * n_ch, offset=off).reshape(n, n_ch)
+        if dt.kind == "i": pcm = pcm * np.float32(1.0 / 32768)
+        return (pcm.T, *_frame_params(spacing, sr, geometry), seq, bool(flags & FLAG_BINARY_RESULT), geometry)
+    frame = json.loads(msg.get("text") or "{}")
+    if not isinstance(frame, dict): raise ValueError("frame must be a JSON object")
+    try:
+        if "channels" in frame:
+            chans = np.array(frame["channels"], dtype=np.float32)
+            if chans.ndim != 2 or len(chans) < 2: raise ValueError("channels must be a list of >= 2 sample lists")
+        else:
+            chans = np.array([frame.get("mic_a", []), frame.get("mic_b", [])], dtype=np.float32)
+        geometry = frame.get("geometry")
+        if geometry is not None:
+            geometry = tuple(tuple(float(v) for v in (list(p) + [0.0, 0.0])[:3]) for p in geometry)
+            if len(geometry) != len(chans): raise ValueError("geometry needs one position per channel")
+        spacing, sr = float(frame.get("mic_spacing", 0.5)), int(frame.get("sample_rate", SAMPLE_RATE))
+        seq = int(frame.get("seq", 0))
+    except (TypeError, OverflowError): raise ValueError("malformed JSON frame") from None
+    return (chans, *_frame_params(spacing, sr, geometry), seq, False, geometry)
+
+def _frame_params(spacing, sr, geometry):
+    """Checked (spacing, sr); array frames locate from geometry, so only pairs need a spacing."""
+    if sr <= 0: raise ValueError("sample_rate must be positive")
+    if not math.isfinite(spacing) or (geometry is None and spacing <= 0):
+        raise ValueError("mic_spacing must be a positive number")
+    return float(spacing), int(sr)
+
+def encode_result(r, seq):
+    f = lambda k: math.nan if r[k] is None else r[k]   # gated frames carry no localisation
+    out = RESULT_HDR.pack(RESULT_MAGIC, seq & 0xFFFFFFFF, f("doa"), f("tdoa_ms"), r["rms_a"], r["rms_b"],
+                          r["db_a"], r["db_b"], r["snr"], f("gcc_peak"), r["confidence"],
+                          int(r["is_gunshot"]), r["timestamp"])
+    if "elevation" in r: out += ARRAY_TAIL.pack(r["elevation"], r["srp_peak"], r["channels"])
+    return out
+
+def analyze_batch(A, B, spacing, sr, threshold=GUNSHOT_RMS_THRESHOLD):
+    """Measure stacked 2-channel frames sharing one plan; one result dict per row (cooldown not applied)."""
+    fa = FrameAnalysis(A, B, frame_plan(A.shape[1], sr, spacing))
+    t0 = time.perf_counter()
+    lags, peaks = fa.gcc()
+    t1 = time.perf_counter()
+    hit, conf = fa.classify(threshold)
+    t2 = time.perf_counter()
+    metrics.observe("gcc_phat", (t1 - t0) / len(A), len(A)); metrics.observe("classify", (t2 - t1) / len(A), len(A))
+    out = []
+    for lag, peak, ra, rb, da, d_b, g, c in zip(lags.tolist(), peaks.tolist(), fa.rms_a.tolist(), fa.rms_b.tolist(),
+                                                 fa.db_a.tolist(), fa.db_b.tolist(), hit.tolist(), conf.tolist()):
+        out.append({"lag": lag, "doa": tdoa_to_doa(lag, spacing, sr), "tdoa_ms": (lag / sr) * 1000.0,
+                    "gcc_peak": peak, "rms_a": ra, "rms_b": rb, "db_a": da, "db_b": d_b,
+                    "is_gunshot": g, "confidence": c})
+    return out
+
+ArrayPlan = namedtuple("ArrayPlan", "fft pair_i pair_j az el steer_k steer_w")
+
+@functools.lru_cache(maxsize=64)
+def array_plan(n, sr, geometry, grid_deg=ARRAY_GRID_DEG):
+    """FFT plan, channel pairs and far-field SRP-PHAT steering table for one array geometry."""
+    pos = np.asarray(geometry, dtype=np.float64)
+    pi, pj = np.triu_indices(len(pos), 1)
+    d = pos[pi] - pos[pj]
+    plan = fft_plan(n, int(np.ceil(np.linalg.norm(d, axis=1).max() / SPEED_OF_SOUND * sr)) + 2)
+    az = np.radians(np.arange(0, 360, grid_deg))
+    # a planar array cannot tell up from down, so only search elevations for 3D geometries
+    el = np.radians(np.arange(-90, 90 + grid_deg, grid_deg)) if np.ptp(pos[:, 2]) > 1e-6 else np.zeros(1)
+    ee, aa = np.meshgrid(el, az, indexing="ij")
+    dirs = np.stack([np.cos(ee) * np.cos(aa), np.cos(ee) * np.sin(aa), np.sin(ee)], -1).reshape(-1, 3)
+    # expected lag (samples) of pair (i, j) for a plane wave arriving from each direction
+    lags = -(dirs @ d.T) / SPEED_OF_SOUND * sr + plan.max_lag
+    W = len(plan.window)
+    k = np.clip(np.floor(lags), 0, W - 2).astype(np.intp)
+    w = np.clip(lags - k, 0.0, 1.0)
+    return ArrayPlan(plan, pi, pj, az, el, k + np.arange(len(pi)) * W, w)
+
+def _parabolic(y0, y1, y2):
+    den = y0 - 2 * y1 + y2
+    return np.where(np.abs(den) > 1e-12, 0.5 * (y0 - y2) / np.where(den == 0, 1, den), 0.0)
+
+def analyze_array_batch(X, geometry, sr, threshold=GUNSHOT_RMS_THRESHOLD):
+    """All-pairs GCC-PHAT + SRP-PHAT direction for stacked (frames, channels, samples) blocks."""
+    ap = array_plan(X.shape[2], sr, geometry)
+    p = ap.fft
+    t0 = time.perf_counter()
+    S = np.fft.rfft(X, n=p.n_fft, axis=-1)
+    G = S[:, ap.pair_i] * np.conj(S[:, ap.pair_j])
+    denom = np.abs(G); np.maximum(denom, 1e-10, out=denom)
+    G /= denom
+    cc = np.fft.irfft(G, n=p.n_fft, axis=-1)[..., p.window]
+    # per-pair TDOA with sub-sample parabolic refinement
+    k = np.clip(np.argmax(cc, axis=-1), 1, cc.shape[-1] - 2)
+    y0, y1, y2 = (np.take_along_axis(cc, (k + o)[..., None], -1)[..., 0] for o in (-1, 0, 1))
+    lags = k + _parabolic(y0, y1, y2) - p.max_lag
+    t1 = time.perf_counter()
+    fa = FrameAnalysis(X[:, 0], X[:, 1], p, spec_a=S[:, 0])
+    hit, conf = fa.classify(threshold)
+    t2 = time.perf_counter()
+    metrics.observe("gcc_phat", (t1 - t0) / len(X), len(X)); metrics.observe("classify", (t2 - t1) / len(X), len(X))
+    n_el, n_az = len(ap.el), len(ap.az)
+    out = []
+    for b in range(len(X)):
+        flat = cc[b].ravel()
+        srp = ((1 - ap.steer_w) * flat[ap.steer_k] + ap.steer_w * flat[ap.steer_k + 1]).sum(-1) / len(ap.pair_i)
+        srp = srp.reshape(n_el, n_az)
+        e, a = np.unravel_index(int(np.argmax(srp)), srp.shape)
+        step = ap.az[1] - ap.az[0]
+        az = ap.az[a] + step * float(_parabolic(srp[e, a-1], srp[e, a], srp[e, (a+1) % n_az]))
+        el = ap.el[e]
+        if 0 < e < n_el - 1: el += step * float(_parabolic(srp[e-1, a], srp[e, a], srp[e+1, a]))
+        lag01 = float(lags[b, 0])
+        az = math.degrees(az) % 360.0
+        az = 0.0 if az >= 360.0 else az   # a tiny negative offset wraps to exactly 360.0 in float
+        out.append({"lag": lag01, "doa": az, "tdoa_ms": lag01 / sr * 1000.0,
+                    "azimuth": az, "elevation": math.degrees(el),
+                    "srp_peak": float(srp[e, a]), "channels": X.shape[1],
+                    "gcc_peak": float(y1[b].mean()), "rms_a": float(fa.rms_a[b]), "rms_b": float(fa.rms_b[b]),
+                    "db_a": float(fa.db_a[b]), "db_b": float(fa.db_b[b]),
+                    "is_gunshot": bool(hit[b]), "confidence": float(conf[b])})
+    metrics.observe("srp_phat", (time.perf_counter() - t2) / len(X), len(X))
+    return out
+
+def analyze_frames(X, spacing, sr, geometry=None):
+    """Dispatch a (frames, channels, samples) block to the 2-mic or array pipeline."""
+    if geometry is None and X.shape[1] == 2: return analyze_batch(X[:, 0], X[:, 1], spacing, sr)
+    if geometry is None: geometry = tuple((k * spacing, 0.0, 0.0) for k in range(X.shape[1]))   # uniform linear
+    return analyze_array_batch(X, geometry, sr)
+
+def _pool_init():
+    # a forked worker inherits the parent's histograms (and maybe a held lock); start it empty
+    metrics.stages, metrics.lock = {}, threading.Lock()
+
+def _analyze_shm(name, shape, spacing, sr, geometry):
+    # process-pool worker: attach to the parent's frame block instead of unpickling arrays
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        X = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        return analyze_frames(X, spacing, sr, geometry), metrics.drain()
+    finally:
+        del X; shm.close()
+
+WAV_FORMATS = {(1, 16): np.dtype("<i2"), (3, 32): np.dtype("<f4")}
+RAW_DTYPES = {d.str: d for d in WAV_FORMATS.values()}   # headerless PCM: the same two sample formats
+
+def open_pcm(path, sample_rate=None, channels=None, dtype=None):
+    """Memory-map a WAV (16-bit PCM / 32-bit float) or headerless PCM file as (samples, channels)."""
+    if dtype is None:
+        with open(path, "rb") as f:
+            riff = f.read(12)
+            if riff[:4] != b"RIFF" or riff[8:12] != b"WAVE": raise ValueError(f"{path}: not a WAV file")
+            fmt = None
+            while True:
+                hdr = f.read(8)
+                if len(hdr) < 8: raise ValueError(f"{path}: no data chunk")
+                cid, size = hdr[:4], struct.unpack("<I", hdr[4:])[0]
+                if cid == b"fmt ":
+                    body = f.read(size + (size & 1))
+                    if len(body) < 16: raise ValueError(f"{path}: truncated fmt chunk")
+                    tag, channels, sample_rate = struct.unpack_from("<HHI", body)
+                    if not sample_rate: raise ValueError(f"{path}: zero sample rate")
+                    bits = struct.unpack_from("<H", body, 14)[0]
+                    if tag == 0xFFFE:   # WAVE_FORMAT_EXTENSIBLE
+                        if len(body) < 26: raise ValueError(f"{path}: truncated fmt chunk")
+                        tag = struct.unpack_from("<H", body, 24)[0]
+                    fmt = WAV_FORMATS.get((tag, bits))
+                    if fmt is None: raise ValueError(f"{path}: unsupported WAV format {tag}/{bits}-bit")
+                elif cid == b"data":
+                    if fmt is None: raise ValueError(f"{path}: data before fmt chunk")
+                    if channels < 2: raise ValueError(f"{path}: need at least 2 channels, got {channels}")
+                    # a recording cut short mid-write declares more data than the file holds
+                    size = min(size, os.path.getsize(path) - f.tell())
+                    offset, n = f.tell(), size // (fmt.itemsize * channels)
+                    break
+                else: f.seek(size + (size & 1), 1)
+        dtype = fmt
+    else:
+        if not sample_rate or not channels: raise ValueError("raw PCM needs sample_rate and channels")
+        if sample_rate <= 0: raise ValueError("sample_rate must be positive")
+        if channels < 2: raise ValueError(f"{path}: need at least 2 channels, got {channels}")
+        if str(dtype) not in RAW_DTYPES: raise ValueError(f"dtype must be one of {', '.join(RAW_DTYPES)}")
+        dtype, offset = RAW_DTYPES[str(dtype)], 0
+        n = os.path.getsize(path) // (dtype.itemsize * channels)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(n, channels)), int(sample_rate)
+
+def analyze_file(path, spacing=0.5, frame=2048, hop=None, geometry=None, start=None,
+                 sample_rate=None, channels=None, dtype=None, threshold=GUNSHOT_RMS_THRESHOLD):
+    """Scan a recording with the live pipeline's classify/gcc_phat semantics; returns (summary, events).
+
+    Frames are strided views over the memory map; each chunk is classified in one batch and
+    only the frames that pass (and clear the cooldown) go through localisation.
+    """
+    if frame <= 0 or (hop is not None and hop <= 0): raise ValueError("frame and hop must be positive")
+    pcm, sr = open_pcm(path, sample_rate, channels, dtype)
+    spacing, sr = _frame_params(spacing, sr, geometry)
+    hop = hop or max(1, frame // 2)
+    n_frames = max(0, (len(pcm) - frame) // hop + 1)
+    if start is None: start = os.path.getmtime(path) - len(pcm) / sr
+    scale = np.float32(1.0 / 32768) if pcm.dtype.kind == "i" else np.float32(1.0)
+    events, next_ok = [], -math.inf
+    for f0 in range(0, n_frames, ANALYZE_CHUNK_FRAMES):
+        f1 = min(f0 + ANALYZE_CHUNK_FRAMES, n_frames)
+        view = np.lib.stride_tricks.sliding_window_view(pcm[f0*hop:(f1-1)*hop+frame], frame, axis=0)[::hop]
+        X = np.multiply(view, scale, dtype=np.float32)   # (frames, channels, samples)
+        hit, _ = FrameAnalysis(X[:, 0], X[:, 1], frame_plan(frame, sr, spacing)).classify(threshold)
+        keep = []
+        for i in np.flatnonzero(hit):
+            t = (f0 + i) * hop / sr
+            if t >= next_ok: keep.append(i); next_ok = t + COOLDOWN_SECONDS
+        if not keep: continue
+        for i, r in zip(keep, analyze_frames(X[keep], spacing, sr, geometry)):
+            t = (f0 + i) * hop / sr
+            ev = {"timestamp": start + t, "timestamp_iso": time.strftime("%H:%M:%S", time.gmtime(start + t)),
+                  "doa": round_deg(r["doa"],1), "tdoa_ms": round(r["tdoa_ms"],4),
+                  "confidence": round(r["confidence"],3), "db_a": round(r["db_a"],1),
+                  "source": os.path.basename(path), "offset_s": round(t, 4)}
+            if "elevation" in r: ev["elevation"] = round(r["elevation"],1)
+            events.append(ev)
+    return {"path": path, "sample_rate": sr, "channels": pcm.shape[1], "duration_s": len(pcm) / sr,
+            "frames": n_frames, "events": len(events)}, events
+
+def analyze_files(paths, workers=None, **kw):
+    """analyze_file over many recordings, one file per process."""
+    if len(paths) <= 1 or workers == 1: results = [analyze_file(p, **kw) for p in paths]
+    else:
+        # forked from a threaded server: start the children's metrics (and their lock) fresh
+        with ProcessPoolExecutor(max_workers=workers, initializer=_pool_init) as pool:
+            results = list(pool.map(functools.partial(analyze_file, **kw), paths))
+    return [s for s, _ in results], [e for _, evs in results for e in evs]
 
 import base64 as _b
-HTML=_b.b64decode("SFRNTCA9IDwhRE9DVFlQRSBodG1sPgo8aHRtbCBsYW5nPSJlbiI+CjxoZWFkPgo8bWV0YSBjaGFyc2V0PSJVVEYtOCI+CjxtZXRhIG5hbWU9InZpZXdwb3J0IiBjb250ZW50PSJ3aWR0aD1kZXZpY2Utd2lkdGgsaW5pdGlhbC1zY2FsZT0xLjAsbWF4aW11bS1zY2FsZT0xLjAiPgo8dGl0bGU+QUNPVVNUSUMgU0VOVElORUwgdjM8L3RpdGxlPgo8bGluayBocmVmPSJodHRwczovL2ZvbnRzLmdvb2dsZWFwaXMuY29tL2NzczI/ZmFtaWx5PVNoYXJlK1RlY2grTW9ubyZmYW1pbHk9T3JiaXRyb246d2dodEA0MDA7NzAwOzkwMCZkaXNwbGF5PXN3YXAiIHJlbD0ic3R5bGVzaGVldCI+CjxsaW5rIHJlbD0ic3R5bGVzaGVldCIgaHJlZj0iaHR0cHM6Ly91bnBrZy5jb20vbGVhZmxldEAxLjkuNC9kaXN0L2xlYWZsZXQuY3NzIi8+CjxzY3JpcHQgc3JjPSJodHRwczovL3VucGtnLmNvbS9sZWFmbGV0QDEuOS40L2Rpc3QvbGVhZmxldC5qcyI+PC9zY3JpcHQ+CjxzdHlsZT4KOnJvb3R7LS1iZzojMDgwYjBmOy0tcGFuZWw6IzBkMTExNzstLWJvcmRlcjojMWEyNTM1Oy0tYWNjZW50OiMwMGZmODg7LS1hY2NlbnQyOiNmZjNjM2M7LS1hY2NlbnQzOiNmZmI4MDA7LS1kaW06IzFlMmQzZDstLXRleHQ6I2M4ZDhlODstLXRleHQtZGltOiM0YTYwNzB9Cip7bWFyZ2luOjA7cGFkZGluZzowO2JveC1zaXppbmc6Ym9yZGVyLWJveH0KYm9keXtiYWNrZ3JvdW5kOnZhcigtLWJnKTtjb2xvcjp2YXIoLS10ZXh0KTtmb250LWZhbWlseTonU2hhcmUgVGVjaCBNb25vJyxtb25vc3BhY2U7bWluLWhlaWdodDoxMDB2aH0KaGVhZGVye2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OnNwYWNlLWJldHdlZW47cGFkZGluZzoxMnB4IDE2cHg7Ym9yZGVyLWJvdHRvbToxcHggc29saWQgdmFyKC0tYm9yZGVyKTtiYWNrZ3JvdW5kOnJnYmEoMTMsMTcsMjMsLjk3KTtwb3NpdGlvbjpzdGlja3k7dG9wOjA7ei1pbmRleDoxMDAwO2ZsZXgtd3JhcDp3cmFwO2dhcDo4cHh9Ci5sb2dve2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjEycHh9Ci5sb2dvLWljb257d2lkdGg6MzJweDtoZWlnaHQ6MzJweDtib3JkZXI6MnB4IHNvbGlkIHZhcigtLWFjY2VudCk7Ym9yZGVyLXJhZGl1czo1MCU7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtqdXN0aWZ5LWNvbnRlbnQ6Y2VudGVyO3Bvc2l0aW9uOnJlbGF0aXZlO2JveC1zaGFkb3c6MCAwIDIwcHggcmdiYSgwLDI1NSwxMzYsLjMpO2ZsZXgtc2hyaW5rOjB9Ci5sb2dvLWljb246OmJlZm9yZXtjb250ZW50OicnO3dpZHRoOjdweDtoZWlnaHQ6N3B4O2JhY2tncm91bmQ6dmFyKC0tYWNjZW50KTtib3JkZXItcmFkaXVzOjUwJTthbmltYXRpb246cHVsc2UgMnMgaW5maW5pdGV9Ci5sb2dvLWljb246OmFmdGVye2NvbnRlbnQ6Jyc7cG9zaXRpb246YWJzb2x1dGU7d2lkdGg6NDRweDtoZWlnaHQ6NDRweDtib3JkZXI6MXB4IHNvbGlkIHJnYmEoMCwyNTUsMTM2LC4yKTtib3JkZXItcmFkaXVzOjUwJTthbmltYXRpb246cmFkYXItcmluZyAycyBpbmZpbml0ZX0KQGtleWZyYW1lcyByYWRhci1yaW5nezAle3RyYW5zZm9ybTpzY2FsZSguNyk7b3BhY2l0eTouOH0xMDAle3RyYW5zZm9ybTpzY2FsZSgxLjQpO29wYWNpdHk6MH19CkBrZXlmcmFtZXMgcHVsc2V7MCUsMTAwJXtvcGFjaXR5OjF9NTAle29wYWNpdHk6LjN9fQpAa2V5ZnJhbWVzIGZsYXNoe2Zyb217b3BhY2l0eToxfXRve29wYWNpdHk6LjR9fQpAa2V5ZnJhbWVzIGFsYXJtUHVsc2V7MCUsMTAwJXtiYWNrZ3JvdW5kOnJnYmEoMjU1LDYwLDYwLDApfTUwJXtiYWNrZ3JvdW5kOnJnYmEoMjU1LDYwLDYwLDAuMTUpfX0KLmxvZ28tdGV4dHtmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXdlaWdodDo5MDA7Zm9udC1zaXplOjE0cHg7bGV0dGVyLXNwYWNpbmc6M3B4O2NvbG9yOnZhcigtLWFjY2VudCl9Ci5sb2dvLXN1Yntmb250LXNpemU6OHB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoycHh9Ci5oZHItcmlnaHR7ZGlzcGxheTpmbGV4O2dhcDoxMnB4O2FsaWduLWl0ZW1zOmNlbnRlcjtmbGV4LXdyYXA6d3JhcH0KLnN0YXR1cy1pdGVte3RleHQtYWxpZ246Y2VudGVyO2ZvbnQtc2l6ZTo5cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pfQouc3RhdHVzLXZhbHtkaXNwbGF5OmJsb2NrO2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMnB4O2NvbG9yOnZhcigtLWFjY2VudCl9CiNzeXN0ZW0tc3RhdHVze2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjZweDtmb250LXNpemU6MTBweDtsZXR0ZXItc3BhY2luZzoycHh9Ci5kb3R7d2lkdGg6N3B4O2hlaWdodDo3cHg7Ym9yZGVyLXJhZGl1czo1MCU7YmFja2dyb3VuZDp2YXIoLS10ZXh0LWRpbSk7dHJhbnNpdGlvbjphbGwgLjNzO2ZsZXgtc2hyaW5rOjB9Ci5kb3QuYWN0aXZle2JhY2tncm91bmQ6dmFyKC0tYWNjZW50KTtib3gtc2hhZG93OjAgMCAyMHB4IHJnYmEoMCwyNTUsMTM2LC4zKTthbmltYXRpb246cHVsc2UgMS41cyBpbmZpbml0ZX0KLmRvdC5hbGVydHtiYWNrZ3JvdW5kOnZhcigtLWFjY2VudDIpO2JveC1zaGFkb3c6MCAwIDIwcHggcmdiYSgyNTUsNjAsNjAsLjUpO2FuaW1hdGlvbjpwdWxzZSAuNXMgaW5maW5pdGV9Ci5kb3Qud2FybntiYWNrZ3JvdW5kOnZhcigtLWFjY2VudDMpO2FuaW1hdGlvbjpwdWxzZSAxcyBpbmZpbml0ZX0KCi8qIFRBQlMgKi8KLnRhYnN7ZGlzcGxheTpmbGV4O2JvcmRlci1ib3R0b206MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7YmFja2dyb3VuZDp2YXIoLS1wYW5lbCk7cG9zaXRpb246c3RpY2t5O3RvcDo2NXB4O3otaW5kZXg6OTk5fQoudGFie2ZsZXg6MTtwYWRkaW5nOjEycHggNHB4O3RleHQtYWxpZ246Y2VudGVyO2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7bGV0dGVyLXNwYWNpbmc6MnB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtjdXJzb3I6cG9pbnRlcjtib3JkZXItYm90dG9tOjJweCBzb2xpZCB0cmFuc3BhcmVudDt0cmFuc2l0aW9uOmFsbCAuMnM7LXdlYmtpdC10YXAtaGlnaGxpZ2h0LWNvbG9yOnRyYW5zcGFyZW50fQoudGFiLmFjdGl2ZXtjb2xvcjp2YXIoLS1hY2NlbnQpO2JvcmRlci1ib3R0b20tY29sb3I6dmFyKC0tYWNjZW50KX0KLnRhYi1jb250ZW50e2Rpc3BsYXk6bm9uZX0KLnRhYi1jb250ZW50LmFjdGl2ZXtkaXNwbGF5OmJsb2NrfQoKLyogQUxBUk0gT1ZFUkxBWSAqLwojYWxhcm0tb3ZlcmxheXtkaXNwbGF5Om5vbmU7cG9zaXRpb246Zml4ZWQ7aW5zZXQ6MDt6LWluZGV4Ojk5OTk7cG9pbnRlci1ldmVudHM6bm9uZTthbmltYXRpb246YWxhcm1QdWxzZSAuNHMgaW5maW5pdGV9CiNhbGFybS1vdmVybGF5LmFjdGl2ZXtkaXNwbGF5OmJsb2NrfQoKLyogUEFORUxTICovCi5wYW5lbHtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7YmFja2dyb3VuZDp2YXIoLS1wYW5lbCk7cG9zaXRpb246cmVsYXRpdmU7b3ZlcmZsb3c6aGlkZGVufQoucGFuZWw6OmJlZm9yZXtjb250ZW50OicnO3Bvc2l0aW9uOmFic29sdXRlO3RvcDowO2xlZnQ6MDtyaWdodDowO2hlaWdodDoxcHg7YmFja2dyb3VuZDpsaW5lYXItZ3JhZGllbnQoOTBkZWcsdHJhbnNwYXJlbnQsdmFyKC0tYWNjZW50KSx0cmFuc3BhcmVudCk7b3BhY2l0eTouNH0KLnBhbmVsLWxhYmVse3Bvc2l0aW9uOmFic29sdXRlO3RvcDoxMHB4O2xlZnQ6MTRweDtmb250LXNpemU6OXB4O2xldHRlci1zcGFjaW5nOjNweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7ei1pbmRleDoyfQoucGFuZWwtbGFiZWwgc3Bhbntjb2xvcjp2YXIoLS1hY2NlbnQpfQoKLyogRE9BIFRBQiAqLwouZG9hLXBhbmVse2Rpc3BsYXk6ZmxleDtmbGV4LWRpcmVjdGlvbjpjb2x1bW47YWxpZ24taXRlbXM6Y2VudGVyO3BhZGRpbmc6NDBweCAxNnB4IDIwcHg7Z2FwOjE2cHh9Ci5wb2xhci13cmFwe3Bvc2l0aW9uOnJlbGF0aXZlO3dpZHRoOm1pbigzMjBweCw4OHZ3KTtoZWlnaHQ6bWluKDMyMHB4LDg4dncpfQojcG9sYXJ7d2lkdGg6MTAwJTtoZWlnaHQ6MTAwJX0KLmRvYS1yZWFkb3V0e3RleHQtYWxpZ246Y2VudGVyO3dpZHRoOjEwMCV9Ci5kb2EtYW5nbGV7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjQ0cHg7Zm9udC13ZWlnaHQ6OTAwO2NvbG9yOnZhcigtLWFjY2VudCk7bGluZS1oZWlnaHQ6MX0KLmRvYS1sYWJlbHtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzozcHg7bWFyZ2luLXRvcDo0cHh9Ci50ZG9hLWRpc3BsYXl7ZGlzcGxheTpmbGV4O2dhcDoyMHB4O21hcmdpbi10b3A6MTBweDtqdXN0aWZ5LWNvbnRlbnQ6Y2VudGVyfQoudGRvYS1pdGVte3RleHQtYWxpZ246Y2VudGVyfQoudGRvYS12YWx7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjEzcHg7Y29sb3I6dmFyKC0tYWNjZW50Myl9Ci50ZG9hLWxibHtmb250LXNpemU6OHB4O2NvbG9yOnZhcigtLXRleHQtZGltKX0KCi8qIERFVEVDVCAqLwouZGV0ZWN0LXBhbmVse3BhZGRpbmc6NDBweCAxNnB4IDE2cHh9Ci5kZXRlY3Qtc3RhdHVze2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OnNwYWNlLWJldHdlZW47bWFyZ2luLWJvdHRvbToxMnB4fQouZGV0ZWN0LWJhZGdle2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMHB4O2xldHRlci1zcGFjaW5nOjJweDtwYWRkaW5nOjVweCAxMnB4O2JvcmRlcjoxcHggc29saWQgdmFyKC0tdGV4dC1kaW0pO2NvbG9yOnZhcigtLXRleHQtZGltKTt0cmFuc2l0aW9uOmFsbCAuM3N9Ci5kZXRlY3QtYmFkZ2UuZ3Vuc2hvdHtib3JkZXItY29sb3I6dmFyKC0tYWNjZW50Mik7Y29sb3I6dmFyKC0tYWNjZW50Mik7Ym94LXNoYWRvdzowIDAgMjBweCByZ2JhKDI1NSw2MCw2MCwuNSk7YW5pbWF0aW9uOmZsYXNoIC4zcyBlYXNlIGluZmluaXRlIGFsdGVybmF0ZX0KLmRldGVjdC1iYWRnZS5jbGVhcntib3JkZXItY29sb3I6dmFyKC0tYWNjZW50KTtjb2xvcjp2YXIoLS1hY2NlbnQpfQouY29uZmlkZW5jZS1iYXJ7aGVpZ2h0OjRweDtiYWNrZ3JvdW5kOnZhcigtLWRpbSk7Ym9yZGVyLXJhZGl1czoycHg7b3ZlcmZsb3c6aGlkZGVuO21hcmdpbi1ib3R0b206MTBweH0KLmNvbmZpZGVuY2UtZmlsbHtoZWlnaHQ6MTAwJTtiYWNrZ3JvdW5kOmxpbmVhci1ncmFkaWVudCg5MGRlZyx2YXIoLS1hY2NlbnQpLHZhcigtLWFjY2VudDMpKTt3aWR0aDowJTt0cmFuc2l0aW9uOndpZHRoIC40cyBlYXNlO2JvcmRlci1yYWRpdXM6MnB4fQouY29uZi1sYWJlbHtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoycHh9Ci5jb25mLXZhbHtmbG9hdDpyaWdodDtjb2xvcjp2YXIoLS1hY2NlbnQzKX0KI3dhdmVmb3Jte3dpZHRoOjEwMCU7aGVpZ2h0OjY1cHg7ZGlzcGxheTpibG9jaztib3JkZXI6MXB4IHNvbGlkIHZhcigtLWRpbSk7Ym9yZGVyLXJhZGl1czoycHg7bWFyZ2luLXRvcDoxMHB4fQoKLyogTUlDICovCi5taWMtcGFuZWx7cGFkZGluZzo0MHB4IDE2cHggMTZweH0KLm1pYy1hcnJheXtkaXNwbGF5OmZsZXg7Z2FwOjEwcHg7YWxpZ24taXRlbXM6Y2VudGVyO21hcmdpbi1ib3R0b206MTRweH0KLm1pYy11bml0e2ZsZXg6MTtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWRpbSk7cGFkZGluZzoxMHB4O3RleHQtYWxpZ246Y2VudGVyO3RyYW5zaXRpb246YWxsIC4zc30KLm1pYy11bml0LmFjdGl2ZXtib3JkZXItY29sb3I6dmFyKC0tYWNjZW50KTtib3gtc2hhZG93OjAgMCAyMHB4IHJnYmEoMCwyNTUsMTM2LC4zKX0KLm1pYy1uYW1le2ZvbnQtc2l6ZTo5cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pO2xldHRlci1zcGFjaW5nOjJweH0KLm1pYy1sZXZlbHtmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXNpemU6MTVweDtjb2xvcjp2YXIoLS1hY2NlbnQpO21hcmdpbjo0cHggMH0KLm1pYy1iYXJ7aGVpZ2h0OjNweDtiYWNrZ3JvdW5kOnZhcigtLWRpbSk7Ym9yZGVyLXJhZGl1czoycHg7b3ZlcmZsb3c6aGlkZGVufQoubWljLWJhci1maWxse2hlaWdodDoxMDAlO2JhY2tncm91bmQ6dmFyKC0tYWNjZW50KTt3aWR0aDowJTt0cmFuc2l0aW9uOndpZHRoIC4xcztib3JkZXItcmFkaXVzOjJweH0KLm1pYy1hcnJvd3tmb250LXNpemU6MThweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7ZmxleC1zaHJpbms6MH0KLnNwYWNpbmctY29udHJvbHtkaXNwbGF5OmZsZXg7YWxpZ24taXRlbXM6Y2VudGVyO2dhcDoxMHB4O2ZvbnQtc2l6ZToxMHB4O2NvbG9yOnZhcigtLXRleHQtZGltKTttYXJnaW4tYm90dG9tOjEycHh9Ci5zcGFjaW5nLWNvbnRyb2wgaW5wdXRbdHlwZT1yYW5nZV17ZmxleDoxOy13ZWJraXQtYXBwZWFyYW5jZTpub25lO2hlaWdodDoycHg7YmFja2dyb3VuZDp2YXIoLS1kaW0pO291dGxpbmU6bm9uZTtib3JkZXItcmFkaXVzOjJweH0KLnNwYWNpbmctY29udHJvbCBpbnB1dFt0eXBlPXJhbmdlXTo6LXdlYmtpdC1zbGlkZXItdGh1bWJ7LXdlYmtpdC1hcHBlYXJhbmNlOm5vbmU7d2lkdGg6MTRweDtoZWlnaHQ6MTRweDtiYWNrZ3JvdW5kOnZhcigtLWFjY2VudCk7Ym9yZGVyLXJhZGl1czo1MCU7Y3Vyc29yOnBvaW50ZXJ9Ci5zcGFjaW5nLXZhbHtjb2xvcjp2YXIoLS1hY2NlbnQpO21pbi13aWR0aDo1MHB4fQouYnRue3dpZHRoOjEwMCU7cGFkZGluZzoxMnB4O2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMHB4O2xldHRlci1zcGFjaW5nOjNweDtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWFjY2VudCk7YmFja2dyb3VuZDp0cmFuc3BhcmVudDtjb2xvcjp2YXIoLS1hY2NlbnQpO2N1cnNvcjpwb2ludGVyO3RyYW5zaXRpb246YWxsIC4yczt0b3VjaC1hY3Rpb246bWFuaXB1bGF0aW9uO21hcmdpbi1ib3R0b206NnB4fQouYnRuLmFjdGl2ZXtiYWNrZ3JvdW5kOnJnYmEoMCwyNTUsMTM2LC4xKX0KLmJ0bi5kYW5nZXJ7Ym9yZGVyLWNvbG9yOnZhcigtLWFjY2VudDIpO2NvbG9yOnZhcigtLWFjY2VudDIpfQouYnRuLndhcm57Ym9yZGVyLWNvbG9yOnZhcigtLWFjY2VudDMpO2NvbG9yOnZhcigtLWFjY2VudDMpfQouYnRuLm9ue2JhY2tncm91bmQ6cmdiYSgyNTUsMTg0LDAsLjE1KTtib3JkZXItY29sb3I6dmFyKC0tYWNjZW50Myk7Y29sb3I6dmFyKC0tYWNjZW50Myl9Ci5zaW0tcm93e2Rpc3BsYXk6ZmxleDtnYXA6NnB4O21hcmdpbi10b3A6NHB4fQouYnRuLXNte3BhZGRpbmc6MTBweCA0cHg7Zm9udC1zaXplOjhweDtmbGV4OjE7bWFyZ2luLWJvdHRvbTowfQoKLyogTUFQIFRBQiAqLwojbWFwe2hlaWdodDozNTBweDt3aWR0aDoxMDAlO3otaW5kZXg6MX0KLm1hcC1wYW5lbHtwYWRkaW5nOjQwcHggMCAwfQoubWFwLWNvbnRyb2xze3BhZGRpbmc6MTJweCAxNnB4O2Rpc3BsYXk6ZmxleDtnYXA6OHB4O2ZsZXgtd3JhcDp3cmFwfQoubWFwLWJ0bntmbGV4OjE7cGFkZGluZzo4cHg7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjhweDtsZXR0ZXItc3BhY2luZzoycHg7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO2JhY2tncm91bmQ6dmFyKC0tcGFuZWwpO2NvbG9yOnZhcigtLXRleHQtZGltKTtjdXJzb3I6cG9pbnRlcjttaW4td2lkdGg6ODBweDt0b3VjaC1hY3Rpb246bWFuaXB1bGF0aW9ufQoubWFwLWJ0bi5hY3RpdmV7Ym9yZGVyLWNvbG9yOnZhcigtLWFjY2VudCk7Y29sb3I6dmFyKC0tYWNjZW50KX0KLnNob3QtY291bnQtYmFkZ2V7ZGlzcGxheTppbmxpbmUtYmxvY2s7YmFja2dyb3VuZDp2YXIoLS1hY2NlbnQyKTtjb2xvcjojZmZmO2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7cGFkZGluZzoycHggOHB4O2JvcmRlci1yYWRpdXM6MnB4O21hcmdpbi1sZWZ0OjhweH0KCi8qIFRSQUNLRVIgVEFCICovCi50cmFja2VyLXBhbmVse3BhZGRpbmc6MTZweH0KLnRyYWNrZXItZ3JpZHtkaXNwbGF5OmdyaWQ7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmciAxZnI7Z2FwOjhweDttYXJnaW4tYm90dG9tOjEycHh9Ci50cmFja2VyLWNhcmR7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO3BhZGRpbmc6MTJweDt0ZXh0LWFsaWduOmNlbnRlcjtwb3NpdGlvbjpyZWxhdGl2ZTt0cmFuc2l0aW9uOmFsbCAuM3N9Ci50cmFja2VyLWNhcmQuYWN0aXZle2JvcmRlci1jb2xvcjp2YXIoLS1hY2NlbnQyKTtib3gtc2hhZG93OjAgMCAxNXB4IHJnYmEoMjU1LDYwLDYwLC4yKX0KLnRyYWNrZXItY2FyZC5pbmFjdGl2ZXtvcGFjaXR5Oi40fQoudGMtaWR7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjE4cHg7Zm9udC13ZWlnaHQ6OTAwO2NvbG9yOnZhcigtLWFjY2VudDIpfQoudGMtYW5nbGV7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjI0cHg7Zm9udC13ZWlnaHQ6OTAwO2NvbG9yOnZhcigtLWFjY2VudCl9Ci50Yy10aW1le2ZvbnQtc2l6ZTo4cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pO21hcmdpbi10b3A6NHB4fQoudGMtY29uZntmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLWFjY2VudDMpfQoudHJhY2tlci1zdGF0c3tkaXNwbGF5OmdyaWQ7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOnJlcGVhdCgzLDFmcik7Z2FwOjhweDttYXJnaW4tYm90dG9tOjEycHh9Ci5zdGF0LWNhcmR7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO3BhZGRpbmc6MTBweDt0ZXh0LWFsaWduOmNlbnRlcn0KLnN0YXQtdmFse2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToyMHB4O2NvbG9yOnZhcigtLWFjY2VudCl9Ci5zdGF0LWxibHtmb250LXNpemU6OHB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoxcHg7bWFyZ2luLXRvcDoycHh9Ci5zdGF0LWNhcmQuZGFuZ2VyIC5zdGF0LXZhbHtjb2xvcjp2YXIoLS1hY2NlbnQyKX0KLnN0YXQtY2FyZC53YXJuIC5zdGF0LXZhbHtjb2xvcjp2YXIoLS1hY2NlbnQzKX0KCi8qIExPRyAqLwoubG9nLXBhbmVse3BhZGRpbmc6NDBweCAwIDB9Ci5sb2ctaGVhZGVye3BhZGRpbmc6MCAxNnB4IDEycHg7ZGlzcGxheTpmbGV4O2p1c3RpZnktY29udGVudDpzcGFjZS1iZXR3ZWVuO2FsaWduLWl0ZW1zOmNlbnRlcjtib3JkZXItYm90dG9tOjFweCBzb2xpZCB2YXIoLS1kaW0pfQoubG9nLWNvdW50e2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToyMHB4O2NvbG9yOnZhcigtLWFjY2VudDIpfQoubG9nLWNvdW50LWxibHtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoycHg7ZGlzcGxheTpibG9ja30KLmxvZy1saXN0e21heC1oZWlnaHQ6MzAwcHg7b3ZlcmZsb3cteTphdXRvfQoubG9nLWVudHJ5e3BhZGRpbmc6MTBweCAxNnB4O2JvcmRlci1ib3R0b206MXB4IHNvbGlkIHJnYmEoMjYsMzcsNTMsLjUpO2Rpc3BsYXk6Z3JpZDtncmlkLXRlbXBsYXRlLWNvbHVtbnM6MWZyIGF1dG87Z2FwOjRweDthbmltYXRpb246c2xpZGVJbiAuM3MgZWFzZX0KQGtleWZyYW1lcyBzbGlkZUlue2Zyb217b3BhY2l0eTowO3RyYW5zZm9ybTp0cmFuc2xhdGVYKDhweCl9dG97b3BhY2l0eToxO3RyYW5zZm9ybTp0cmFuc2xhdGVYKDApfX0KLmxvZy1lbnRyeS5ndW5zaG90e2JvcmRlci1sZWZ0OjNweCBzb2xpZCB2YXIoLS1hY2NlbnQyKX0KLmxvZy10eXBle2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMHB4O2xldHRlci1zcGFjaW5nOjJweDtjb2xvcjp2YXIoLS1hY2NlbnQyKX0KLmxvZy1kZXRhaWxze2ZvbnQtc2l6ZTo5cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pO21hcmdpbi10b3A6MnB4fQoubG9nLXRpbWV7Zm9udC1zaXplOjlweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7dGV4dC1hbGlnbjpyaWdodH0KLmxvZy1hbmdsZXtmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXNpemU6MTFweDtjb2xvcjp2YXIoLS1hY2NlbnQzKX0KCi53cy1iYXJ7cG9zaXRpb246Zml4ZWQ7Ym90dG9tOjA7bGVmdDowO3JpZ2h0OjA7YmFja2dyb3VuZDp2YXIoLS1wYW5lbCk7Ym9yZGVyLXRvcDoxcHggc29saWQgdmFyKC0tYm9yZGVyKTtwYWRkaW5nOjhweCAxNnB4O2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjhweDtmb250LXNpemU6OXB4O2xldHRlci1zcGFjaW5nOjJweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7ei1pbmRleDo5OTh9CgovKiBMZWFmbGV0IGRhcmsgb3ZlcnJpZGUgKi8KLmxlYWZsZXQtY29udGFpbmVye2JhY2tncm91bmQ6IzBkMTExNyFpbXBvcnRhbnR9Ci5sZWFmbGV0LXRpbGV7ZmlsdGVyOmludmVydCgxKSBodWUtcm90YXRlKDE4MGRlZykgYnJpZ2h0bmVzcygwLjcpIGNvbnRyYXN0KDEuMil9Cjwvc3R5bGU+CjwvaGVhZD4KPGJvZHk+Cgo8ZGl2IGlkPSJhbGFybS1vdmVybGF5Ij48L2Rpdj4KCjxoZWFkZXI+CiAgPGRpdiBjbGFzcz0ibG9nbyI+CiAgICA8ZGl2IGNsYXNzPSJsb2dvLWljb24iPjwvZGl2PgogICAgPGRpdj4KICAgICAgPGRpdiBjbGFzcz0ibG9nby10ZXh0Ij5BQ09VU1RJQyBTRU5USU5FTCA8c3BhbiBzdHlsZT0iY29sb3I6dmFyKC0tYWNjZW50Myk7Zm9udC1zaXplOjEwcHgiPnYzPC9zcGFuPjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJsb2dvLXN1YiI+RE9BIMK3IE1BUCDCtyBNVUxUSS1UUkFDSyDCtyBBTEFSTTwvZGl2PgogICAgPC9kaXY+CiAgPC9kaXY+CiAgPGRpdiBjbGFzcz0iaGRyLXJpZ2h0Ij4KICAgIDxkaXYgY2xhc3M9InN0YXR1cy1pdGVtIj48c3BhbiBjbGFzcz0ic3RhdHVzLXZhbCIgaWQ9Imhkci10aW1lIj4tLTotLTotLTwvc3Bhbj5VVEM8L2Rpdj4KICAgIDxkaXYgY2xhc3M9InN0YXR1cy1pdGVtIj48c3BhbiBjbGFzcz0ic3RhdHVzLXZhbCIgaWQ9Imhkci1ldmVudHMiPjA8L3NwYW4+U0hPVFM8L2Rpdj4KICAgIDxkaXYgaWQ9InN5c3RlbS1zdGF0dXMiPjxkaXYgY2xhc3M9ImRvdCIgaWQ9InN5cy1kb3QiPjwvZGl2PjxzcGFuIGlkPSJzeXMtbGFiZWwiPlNUQU5EQlk8L3NwYW4+PC9kaXY+CiAgPC9kaXY+CjwvaGVhZGVyPgoKPCEtLSBUQUJTIC0tPgo8ZGl2IGNsYXNzPSJ0YWJzIj4KICA8ZGl2IGNsYXNzPSJ0YWIgYWN0aXZlIiBvbmNsaWNrPSJzd2l0Y2hUYWIoJ2RvYScpIj7wn5OhIERPQTwvZGl2PgogIDxkaXYgY2xhc3M9InRhYiIgb25jbGljaz0ic3dpdGNoVGFiKCdtYXAnKSI+8J+XuiBNQVA8L2Rpdj4KICA8ZGl2IGNsYXNzPSJ0YWIiIG9uY2xpY2s9InN3aXRjaFRhYigndHJhY2tlcicpIj7wn46vIFRSQUNLRVI8L2Rpdj4KICA8ZGl2IGNsYXNzPSJ0YWIiIG9uY2xpY2s9InN3aXRjaFRhYignbG9nJykiPvCfk4sgTE9HPC9kaXY+CjwvZGl2PgoKPCEtLSDilZDilZDilZAgVEFCIDE6IERPQSDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi1kb2EiIGNsYXNzPSJ0YWItY29udGVudCBhY3RpdmUiPgogIDxkaXYgY2xhc3M9InBhbmVsIGRvYS1wYW5lbCI+CiAgICA8ZGl2IGNsYXNzPSJwYW5lbC1sYWJlbCI+PHNwYW4+MDE8L3NwYW4+IC8gUE9MQVIgRE9BPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJwb2xhci13cmFwIj48Y2FudmFzIGlkPSJwb2xhciIgd2lkdGg9IjMyMCIgaGVpZ2h0PSIzMjAiPjwvY2FudmFzPjwvZGl2PgogICAgPGRpdiBjbGFzcz0iZG9hLXJlYWRvdXQiPgogICAgICA8ZGl2IGNsYXNzPSJkb2EtYW5nbGUiIGlkPSJkb2EtYW5nbGUiPi0tLcKwPC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9ImRvYS1sYWJlbCI+RElSRUNUSU9OIE9GIEFSUklWQUw8L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idGRvYS1kaXNwbGF5Ij4KICAgICAgICA8ZGl2IGNsYXNzPSJ0ZG9hLWl0ZW0iPjxkaXYgY2xhc3M9InRkb2EtdmFsIiBpZD0idGRvYS12YWwiPjAuMDAwPC9kaXY+PGRpdiBjbGFzcz0idGRvYS1sYmwiPlRET0EgbXM8L2Rpdj48L2Rpdj4KICAgICAgICA8ZGl2IGNsYXNzPSJ0ZG9hLWl0ZW0iPjxkaXYgY2xhc3M9InRkb2EtdmFsIiBpZD0ic25yLXZhbCI+LS08L2Rpdj48ZGl2IGNsYXNzPSJ0ZG9hLWxibCI+U05SIGRCPC9kaXY+PC9kaXY+CiAgICAgICAgPGRpdiBjbGFzcz0idGRvYS1pdGVtIj48ZGl2IGNsYXNzPSJ0ZG9hLXZhbCIgaWQ9ImRpc3QtdmFsIj4wLjUwPC9kaXY+PGRpdiBjbGFzcz0idGRvYS1sYmwiPk1JQyBtPC9kaXY+PC9kaXY+CiAgICAgIDwvZGl2PgogICAgPC9kaXY+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9InBhbmVsIGRldGVjdC1wYW5lbCI+CiAgICA8ZGl2IGNsYXNzPSJwYW5lbC1sYWJlbCI+PHNwYW4+MDI8L3NwYW4+IC8gQ0xBU1NJRklDQVRJT048L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImRldGVjdC1zdGF0dXMiPgogICAgICA8ZGl2IGNsYXNzPSJkZXRlY3QtYmFkZ2UiIGlkPSJkZXRlY3QtYmFkZ2UiPk1PTklUT1JJTkc8L2Rpdj4KICAgICAgPGRpdiBzdHlsZT0idGV4dC1hbGlnbjpyaWdodDtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKSI+CiAgICAgICAgPGRpdj5MQVNUOiA8c3BhbiBpZD0ibGFzdC1kZXRlY3QiIHN0eWxlPSJjb2xvcjp2YXIoLS10ZXh0KSI+LS08L3NwYW4+PC9kaXY+CiAgICAgICAgPGRpdj5QRUFLOiA8c3BhbiBpZD0icGVhay1kYiIgc3R5bGU9ImNvbG9yOnZhcigtLWFjY2VudDMpIj4tLSBkQjwvc3Bhbj48L2Rpdj4KICAgICAgPC9kaXY+CiAgICA8L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImNvbmYtbGFiZWwiPkNPTkZJREVOQ0UgPHNwYW4gY2xhc3M9ImNvbmYtdmFsIiBpZD0iY29uZi1wY3QiPjAlPC9zcGFuPjwvZGl2PgogICAgPGRpdiBjbGFzcz0iY29uZmlkZW5jZS1iYXIiPjxkaXYgY2xhc3M9ImNvbmZpZGVuY2UtZmlsbCIgaWQ9ImNvbmYtZmlsbCI+PC9kaXY+PC9kaXY+CiAgICA8Y2FudmFzIGlkPSJ3YXZlZm9ybSIgd2lkdGg9IjM0MCIgaGVpZ2h0PSI2NSI+PC9jYW52YXM+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9InBhbmVsIG1pYy1wYW5lbCI+CiAgICA8ZGl2IGNsYXNzPSJwYW5lbC1sYWJlbCI+PHNwYW4+MDM8L3NwYW4+IC8gQVJSQVkgJiBDT05UUk9MUzwvZGl2PgogICAgPGRpdiBjbGFzcz0ibWljLWFycmF5Ij4KICAgICAgPGRpdiBjbGFzcz0ibWljLXVuaXQiIGlkPSJtaWMwIj48ZGl2IGNsYXNzPSJtaWMtbmFtZSI+TUlDIEE8L2Rpdj48ZGl2IGNsYXNzPSJtaWMtbGV2ZWwiIGlkPSJtaWMwLWx2bCI+LeKInjwvZGl2PjxkaXYgY2xhc3M9Im1pYy1iYXIiPjxkaXYgY2xhc3M9Im1pYy1iYXItZmlsbCIgaWQ9Im1pYzAtYmFyIj48L2Rpdj48L2Rpdj48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0ibWljLWFycm93Ij7in7c8L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0ibWljLXVuaXQiIGlkPSJtaWMxIj48ZGl2IGNsYXNzPSJtaWMtbmFtZSI+TUlDIEI8L2Rpdj48ZGl2IGNsYXNzPSJtaWMtbGV2ZWwiIGlkPSJtaWMxLWx2bCI+LeKInjwvZGl2PjxkaXYgY2xhc3M9Im1pYy1iYXIiPjxkaXYgY2xhc3M9Im1pYy1iYXItZmlsbCIgaWQ9Im1pYzEtYmFyIj48L2Rpdj48L2Rpdj48L2Rpdj4KICAgIDwvZGl2PgogICAgPGRpdiBjbGFzcz0ic3BhY2luZy1jb250cm9sIj5TUEFDSU5HIDxpbnB1dCB0eXBlPSJyYW5nZSIgaWQ9InNwYWNpbmctc2xpZGVyIiBtaW49IjAuMSIgbWF4PSIyLjAiIHN0ZXA9IjAuMDUiIHZhbHVlPSIwLjUiPiA8c3BhbiBjbGFzcz0ic3BhY2luZy12YWwiIGlkPSJzcGFjaW5nLXZhbCI+MC41MCBtPC9zcGFuPjwvZGl2PgogICAgPGJ1dHRvbiBjbGFzcz0iYnRuIiBpZD0ic3RhcnQtYnRuIiBvbmNsaWNrPSJ0b2dnbGVMaXN0ZW5pbmcoKSI+4pa2IFNUQVJUIExJU1RFTklORzwvYnV0dG9uPgogICAgPGJ1dHRvbiBjbGFzcz0iYnRuIHdhcm4iIGlkPSJhbGFybS1idG4iIG9uY2xpY2s9InRvZ2dsZUFsYXJtKCkiPvCflJQgQUxBUk06IE9GRjwvYnV0dG9uPgogICAgPGRpdiBjbGFzcz0ic2ltLXJvdyI+CiAgICAgIDxidXR0b24gY2xhc3M9ImJ0bi1zbSBidG4iIG9uY2xpY2s9InNpbUd1bnNob3QoNDUpIj5TSU0gNDXCsDwvYnV0dG9uPgogICAgICA8YnV0dG9uIGNsYXNzPSJidG4tc20gYnRuIiBvbmNsaWNrPSJzaW1HdW5zaG90KDkwKSI+U0lNIDkwwrA8L2J1dHRvbj4KICAgICAgPGJ1dHRvbiBjbGFzcz0iYnRuLXNtIGJ0biIgb25jbGljaz0ic2ltR3Vuc2hvdCgxMzUpIj5TSU0gMTM1wrA8L2J1dHRvbj4KICAgICAgPGJ1dHRvbiBjbGFzcz0iYnRuLXNtIGJ0biBkYW5nZXIiIG9uY2xpY2s9ImNsZWFyQWxsKCkiPkNMUjwvYnV0dG9uPgogICAgPC9kaXY+CiAgPC9kaXY+CjwvZGl2PgoKPCEtLSDilZDilZDilZAgVEFCIDI6IE1BUCDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi1tYXAiIGNsYXNzPSJ0YWItY29udGVudCI+CiAgPGRpdiBjbGFzcz0icGFuZWwgbWFwLXBhbmVsIj4KICAgIDxkaXYgY2xhc3M9InBhbmVsLWxhYmVsIj48c3Bhbj4wMjwvc3Bhbj4gLyBHVU5TSE9UIE1BUCA8c3BhbiBpZD0ibWFwLXNob3QtY291bnQiIGNsYXNzPSJzaG90LWNvdW50LWJhZGdlIj4wIFNIT1RTPC9zcGFuPjwvZGl2PgogICAgPGRpdiBpZD0ibWFwIj48L2Rpdj4KICAgIDxkaXYgY2xhc3M9Im1hcC1jb250cm9scyI+CiAgICAgIDxidXR0b24gY2xhc3M9Im1hcC1idG4gYWN0aXZlIiBpZD0ibWFwLWNlbnRlci1idG4iIG9uY2xpY2s9ImNlbnRlck1hcCgpIj7wn5ONIE1ZIExPQ0FUSU9OPC9idXR0b24+CiAgICAgIDxidXR0b24gY2xhc3M9Im1hcC1idG4iIG9uY2xpY2s9ImNsZWFyTWFwTWFya2VycygpIj7wn5eRIENMRUFSIFBJTlM8L2J1dHRvbj4KICAgICAgPGJ1dHRvbiBjbGFzcz0ibWFwLWJ0biIgb25jbGljaz0ic2ltR3Vuc2hvdChNYXRoLnJhbmRvbSgpKjE4MCkiPvCfkqUgU0lNIFNIT1Q8L2J1dHRvbj4KICAgIDwvZGl2PgogICAgPGRpdiBzdHlsZT0icGFkZGluZzowIDE2cHggMTJweDtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoxcHgiPgogICAgICDimqAgTWFwIHBpbnMgc2hvdyBlc3RpbWF0ZWQgZGlyZWN0aW9uIGZyb20geW91ciBsb2NhdGlvbi4gRGlzdGFuY2UgaXMgYXBwcm94aW1hdGUgYmFzZWQgb24gc291bmQgbGV2ZWwuCiAgICA8L2Rpdj4KICA8L2Rpdj4KPC9kaXY+Cgo8IS0tIOKVkOKVkOKVkCBUQUIgMzogVFJBQ0tFUiDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi10cmFja2VyIiBjbGFzcz0idGFiLWNvbnRlbnQiPgogIDxkaXYgc3R5bGU9InBhZGRpbmc6MTZweCAxNnB4IDhweCI+CiAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLXN0YXRzIj4KICAgICAgPGRpdiBjbGFzcz0ic3RhdC1jYXJkIGRhbmdlciI+PGRpdiBjbGFzcz0ic3RhdC12YWwiIGlkPSJzdGF0LXRvdGFsIj4wPC9kaXY+PGRpdiBjbGFzcz0ic3RhdC1sYmwiPlRPVEFMIFNIT1RTPC9kaXY+PC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InN0YXQtY2FyZCB3YXJuIj48ZGl2IGNsYXNzPSJzdGF0LXZhbCIgaWQ9InN0YXQtbGFzdC1hbmdsZSI+LS08L2Rpdj48ZGl2IGNsYXNzPSJzdGF0LWxibCI+TEFTVCBBTkdMRTwvZGl2PjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJzdGF0LWNhcmQiPjxkaXYgY2xhc3M9InN0YXQtdmFsIiBpZD0ic3RhdC1hdmctY29uZiI+LS0lPC9kaXY+PGRpdiBjbGFzcz0ic3RhdC1sYmwiPkFWRyBDT05GPC9kaXY+PC9kaXY+CiAgICA8L2Rpdj4KICAgIDxkaXYgc3R5bGU9ImZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7bGV0dGVyLXNwYWNpbmc6M3B4O2NvbG9yOnZhcigtLXRleHQtZGltKTttYXJnaW4tYm90dG9tOjEwcHgiPlJFQ0VOVCBERVRFQ1RJT05TPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLWdyaWQiIGlkPSJ0cmFja2VyLWdyaWQiPgogICAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLWNhcmQgaW5hY3RpdmUiIGlkPSJ0Yy0wIj48ZGl2IGNsYXNzPSJ0Yy1pZCI+Iy0tPC9kaXY+PGRpdiBjbGFzcz0idGMtYW5nbGUiPi0tLcKwPC9kaXY+PGRpdiBjbGFzcz0idGMtY29uZiI+LS0lPC9kaXY+PGRpdiBjbGFzcz0idGMtdGltZSI+LS08L2Rpdj48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idHJhY2tlci1jYXJkIGluYWN0aXZlIiBpZD0idGMtMSI+PGRpdiBjbGFzcz0idGMtaWQiPiMtLTwvZGl2PjxkaXYgY2xhc3M9InRjLWFuZ2xlIj4tLS3CsDwvZGl2PjxkaXYgY2xhc3M9InRjLWNvbmYiPi0tJTwvZGl2PjxkaXYgY2xhc3M9InRjLXRpbWUiPi0tPC9kaXY+PC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InRyYWNrZXItY2FyZCBpbmFjdGl2ZSIgaWQ9InRjLTIiPjxkaXYgY2xhc3M9InRjLWlkIj4jLS08L2Rpdj48ZGl2IGNsYXNzPSJ0Yy1hbmdsZSI+LS0twrA8L2Rpdj48ZGl2IGNsYXNzPSJ0Yy1jb25mIj4tLSU8L2Rpdj48ZGl2IGNsYXNzPSJ0Yy10aW1lIj4tLTwvZGl2PjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLWNhcmQgaW5hY3RpdmUiIGlkPSJ0Yy0zIj48ZGl2IGNsYXNzPSJ0Yy1pZCI+Iy0tPC9kaXY+PGRpdiBjbGFzcz0idGMtYW5nbGUiPi0tLcKwPC9kaXY+PGRpdiBjbGFzcz0idGMtY29uZiI+LS0lPC9kaXY+PGRpdiBjbGFzcz0idGMtdGltZSI+LS08L2Rpdj48L2Rpdj4KICAgIDwvZGl2PgoKICAgIDxkaXYgc3R5bGU9ImZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7bGV0dGVyLXNwYWNpbmc6M3B4O2NvbG9yOnZhcigtLXRleHQtZGltKTttYXJnaW4tYm90dG9tOjEwcHgiPkRJUkVDVElPTiBISVNUT0dSQU08L2Rpdj4KICAgIDxjYW52YXMgaWQ9Imhpc3RvZ3JhbSIgd2lkdGg9IjM0MCIgaGVpZ2h0PSIxMjAiIHN0eWxlPSJ3aWR0aDoxMDAlO2JvcmRlcjoxcHggc29saWQgdmFyKC0tZGltKTtib3JkZXItcmFkaXVzOjJweCI+PC9jYW52YXM+CiAgPC9kaXY+CjwvZGl2PgoKPCEtLSDilZDilZDilZAgVEFCIDQ6IExPRyDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi1sb2ciIGNsYXNzPSJ0YWItY29udGVudCI+CiAgPGRpdiBjbGFzcz0icGFuZWwgbG9nLXBhbmVsIj4KICAgIDxkaXYgY2xhc3M9InBhbmVsLWxhYmVsIj48c3Bhbj4wNDwvc3Bhbj4gLyBFVkVOVCBMT0c8L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImxvZy1oZWFkZXIiPgogICAgICA8ZGl2PjxzcGFuIGNsYXNzPSJsb2ctY291bnQtbGJsIj5UT1RBTCBERVRFQ1RJT05TPC9zcGFuPjxzcGFuIGNsYXNzPSJsb2ctY291bnQiIGlkPSJsb2ctY291bnQiPjA8L3NwYW4+PC9kaXY+CiAgICAgIDxidXR0b24gb25jbGljaz0iZXhwb3J0Q1NWKCkiIHN0eWxlPSJmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXNpemU6OHB4O2xldHRlci1zcGFjaW5nOjJweDtwYWRkaW5nOjRweCAxMHB4O2JvcmRlcjoxcHggc29saWQgdmFyKC0tYWNjZW50KTtiYWNrZ3JvdW5kOnRyYW5zcGFyZW50O2NvbG9yOnZhcigtLWFjY2VudCk7Y3Vyc29yOnBvaW50ZXIiPuKshyBDU1Y8L2J1dHRvbj4KICAgIDwvZGl2PgogICAgPGRpdiBjbGFzcz0ibG9nLWxpc3QiIGlkPSJsb2ctbGlzdCI+PC9kaXY+CiAgPC9kaXY+CjwvZGl2PgoKPGRpdiBjbGFzcz0id3MtYmFyIj4KICA8ZGl2IGNsYXNzPSJkb3QiIGlkPSJ3cy1kb3QiPjwvZGl2PgogIDxzcGFuIGlkPSJ3cy1sYWJlbCI+Q09OTkVDVElORy4uLjwvc3Bhbj4KPC9kaXY+Cgo8c2NyaXB0PgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gU1RBVEUKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmNvbnN0IFNQRUVEPTM0MywgQVBJPXdpbmRvdy5sb2NhdGlvbi5vcmlnaW47CmNvbnN0IFdTX1VSTD0obG9jYXRpb24ucHJvdG9jb2w9PT0naHR0cHM6Jz8nd3NzOic6J3dzOicpKycvLycrbG9jYXRpb24uaG9zdCsnL3dzL2F1ZGlvJzsKbGV0IHdzLCBhdWRpb0N0eCwgYW5hbHlzZXJBLCBhbmFseXNlckIsIHN0cmVhbTsKbGV0IGlzTGlzdGVuaW5nPWZhbHNlLCBhbmltRnJhbWUsIG1pY1NwYWNpbmc9LjU7CmxldCBkb2FBbmdsZT1udWxsLCB0ZG9hTXM9MCwgZGV0ZWN0aW5nPWZhbHNlLCBkZXRlY3RUaW1lb3V0OwpsZXQgZXZlbnRDb3VudD0wLCBsYXN0UGluZz1EYXRlLm5vdygpOwpjb25zdCBkb2FIaXN0b3J5PVtdLCBISVNUPTgsIHBhcnRpY2xlcz1bXTsKbGV0IGFsYXJtRW5hYmxlZD1mYWxzZSwgYWxhcm1DdHg9bnVsbDsKbGV0IHVzZXJMYXQ9bnVsbCwgdXNlckxuZz1udWxsOwpsZXQgbWFwT2JqPW51bGwsIG1hcE1hcmtlcnM9W10sIHVzZXJNYXJrZXI9bnVsbDsKbGV0IGFsbEV2ZW50cz1bXTsKY29uc3QgaGlzdG9ncmFtRGF0YT1uZXcgQXJyYXkoMTgpLmZpbGwoMCk7IC8vIDE4IGJpbnMgb2YgMTDCsAoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIFRBQlMKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmZ1bmN0aW9uIHN3aXRjaFRhYihuYW1lKXsKICBkb2N1bWVudC5xdWVyeVNlbGVjdG9yQWxsKCcudGFiJykuZm9yRWFjaCgodCxpKT0+ewogICAgY29uc3QgbmFtZXM9Wydkb2EnLCdtYXAnLCd0cmFja2VyJywnbG9nJ107CiAgICB0LmNsYXNzTGlzdC50b2dnbGUoJ2FjdGl2ZScsIG5hbWVzW2ldPT09bmFtZSk7CiAgfSk7CiAgZG9jdW1lbnQucXVlcnlTZWxlY3RvckFsbCgnLnRhYi1jb250ZW50JykuZm9yRWFjaChjPT5jLmNsYXNzTGlzdC5yZW1vdmUoJ2FjdGl2ZScpKTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgndGFiLScrbmFtZSkuY2xhc3NMaXN0LmFkZCgnYWN0aXZlJyk7CiAgaWYobmFtZT09PSdtYXAnKSBzZXRUaW1lb3V0KCgpPT5tYXBPYmomJm1hcE9iai5pbnZhbGlkYXRlU2l6ZSgpLDEwMCk7CiAgaWYobmFtZT09PSd0cmFja2VyJykgZHJhd0hpc3RvZ3JhbSgpOwp9CgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gTUFQIElOSVQKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmZ1bmN0aW9uIGluaXRNYXAoKXsKICBtYXBPYmo9TC5tYXAoJ21hcCcse3pvb21Db250cm9sOnRydWV9KS5zZXRWaWV3KFswLDBdLDIpOwogIEwudGlsZUxheWVyKCdodHRwczovL3tzfS50aWxlLm9wZW5zdHJlZXRtYXAub3JnL3t6fS97eH0ve3l9LnBuZycsewogICAgYXR0cmlidXRpb246J8KpIE9wZW5TdHJlZXRNYXAnLG1heFpvb206MTkKICB9KS5hZGRUbyhtYXBPYmopOwogIC8vIEdldCB1c2VyIGxvY2F0aW9uCiAgaWYobmF2aWdhdG9yLmdlb2xvY2F0aW9uKXsKICAgIG5hdmlnYXRvci5nZW9sb2NhdGlvbi5nZXRDdXJyZW50UG9zaXRpb24ocG9zPT57CiAgICAgIHVzZXJMYXQ9cG9zLmNvb3Jkcy5sYXRpdHVkZTsgdXNlckxuZz1wb3MuY29vcmRzLmxvbmdpdHVkZTsKICAgICAgbWFwT2JqLnNldFZpZXcoW3VzZXJMYXQsdXNlckxuZ10sMTUpOwogICAgICB1c2VyTWFya2VyPUwuY2lyY2xlTWFya2VyKFt1c2VyTGF0LHVzZXJMbmddLHsKICAgICAgICByYWRpdXM6MTAsY29sb3I6JyMwMGZmODgnLGZpbGxDb2xvcjonIzAwZmY4OCcsZmlsbE9wYWNpdHk6Ljgsd2VpZ2h0OjIKICAgICAgfSkuYWRkVG8obWFwT2JqKS5iaW5kUG9wdXAoJ/Cfk40gWU9VUiBMT0NBVElPTiAoTUlDIEFSUkFZKScpOwogICAgfSwoKT0+e30pOwogIH0KfQppbml0TWFwKCk7CgpmdW5jdGlvbiBjZW50ZXJNYXAoKXsKICBpZih1c2VyTGF0JiZ1c2VyTG5nKSBtYXBPYmouc2V0VmlldyhbdXNlckxhdCx1c2VyTG5nXSwxNSk7Cn0KCmZ1bmN0aW9uIGFkZE1hcE1hcmtlcihhbmdsZSwgY29uZmlkZW5jZSwgZXZlbnRJZCl7CiAgaWYoIXVzZXJMYXR8fCF1c2VyTG5nKSByZXR1cm47CiAgLy8gRXN0aW1hdGUgZGlzdGFuY2UgZnJvbSBjb25maWRlbmNlL2RiIChyb3VnaCBoZXVyaXN0aWM6IDIwLTUwMG0pCiAgY29uc3QgZGlzdCA9IDUwICsgKDEtY29uZmlkZW5jZSkqMjAwOwogIGNvbnN0IHJhZD0oYW5nbGUtOTApKk1hdGguUEkvMTgwOyAvLyBjb252ZXJ0IHRvIG1hcCBiZWFyaW5nCiAgY29uc3QgbGF0T2ZmPWRpc3QvMTExMDAwKk1hdGguY29zKHJhZCk7CiAgY29uc3QgbG5nT2ZmPWRpc3QvKDExMTAwMCpNYXRoLmNvcyh1c2VyTGF0Kk1hdGguUEkvMTgwKSkqTWF0aC5zaW4ocmFkKTsKICBjb25zdCBsYXQ9dXNlckxhdCtsYXRPZmYsIGxuZz11c2VyTG5nK2xuZ09mZjsKICBjb25zdCBtYXJrZXI9TC5jaXJjbGVNYXJrZXIoW2xhdCxsbmddLHsKICAgIHJhZGl1czo4K2NvbmZpZGVuY2UqNiwKICAgIGNvbG9yOicjZmYzYzNjJyxmaWxsQ29sb3I6JyNmZjNjM2MnLAogICAgZmlsbE9wYWNpdHk6MC42K2NvbmZpZGVuY2UqLjMsd2VpZ2h0OjIKICB9KS5hZGRUbyhtYXBPYmopCiAgICAuYmluZFBvcHVwKGDwn5KlIFNIT1QgIyR7ZXZlbnRJZH08YnI+RGlyZWN0aW9uOiAke01hdGgucm91bmQoYW5nbGUpfcKwPGJyPkNvbmZpZGVuY2U6ICR7TWF0aC5yb3VuZChjb25maWRlbmNlKjEwMCl9JWApOwogIC8vIERyYXcgZGlyZWN0aW9uIGxpbmUKICBjb25zdCBsaW5lPUwucG9seWxpbmUoW1t1c2VyTGF0LHVzZXJMbmddLFtsYXQsbG5nXV0sewogICAgY29sb3I6J3JnYmEoMjU1LDYwLDYwLDAuNCknLHdlaWdodDoxLGRhc2hBcnJheTonNCw2JwogIH0pLmFkZFRvKG1hcE9iaik7CiAgbWFwTWFya2Vycy5wdXNoKG1hcmtlcixsaW5lKTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbWFwLXNob3QtY291bnQnKS50ZXh0Q29udGVudD1tYXBNYXJrZXJzLmZpbHRlcigoXyxpKT0+aSUyPT09MCkubGVuZ3RoKycgU0hPVFMnOwogIG1hcE9iai5wYW5UbyhbbGF0LGxuZ10pOwp9CgpmdW5jdGlvbiBjbGVhck1hcE1hcmtlcnMoKXsKICBtYXBNYXJrZXJzLmZvckVhY2gobT0+bWFwT2JqLnJlbW92ZUxheWVyKG0pKTsKICBtYXBNYXJrZXJzPVtdOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdtYXAtc2hvdC1jb3VudCcpLnRleHRDb250ZW50PScwIFNIT1RTJzsKfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIEFMQVJNCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkApmdW5jdGlvbiB0b2dnbGVBbGFybSgpewogIGFsYXJtRW5hYmxlZD0hYWxhcm1FbmFibGVkOwogIGNvbnN0IGJ0bj1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnYWxhcm0tYnRuJyk7CiAgYnRuLnRleHRDb250ZW50PWFsYXJtRW5hYmxlZD8n8J+UlCBBTEFSTTogT04nOifwn5SUIEFMQVJNOiBPRkYnOwogIGJ0bi5jbGFzc0xpc3QudG9nZ2xlKCdvbicsYWxhcm1FbmFibGVkKTsKfQoKZnVuY3Rpb24gdHJpZ2dlckFsYXJtU291bmQoKXsKICBpZighYWxhcm1FbmFibGVkKSByZXR1cm47CiAgdHJ5ewogICAgaWYoIWFsYXJtQ3R4KSBhbGFybUN0eD1uZXcod2luZG93LkF1ZGlvQ29udGV4dHx8d2luZG93LndlYmtpdEF1ZGlvQ29udGV4dCkoKTsKICAgIC8vIFRocmVlIHNoYXJwIGJlZXBzCiAgICBbMCwuMywuNl0uZm9yRWFjaChkZWxheT0+ewogICAgICBjb25zdCBvc2M9YWxhcm1DdHguY3JlYXRlT3NjaWxsYXRvcigpOwogICAgICBjb25zdCBnYWluPWFsYXJtQ3R4LmNyZWF0ZUdhaW4oKTsKICAgICAgb3NjLmNvbm5lY3QoZ2Fpbik7IGdhaW4uY29ubmVjdChhbGFybUN0eC5kZXN0aW5hdGlvbik7CiAgICAgIG9zYy5mcmVxdWVuY3kudmFsdWU9ODgwOwogICAgICBvc2MudHlwZT0nc3F1YXJlJzsKICAgICAgZ2Fpbi5nYWluLnNldFZhbHVlQXRUaW1lKDAsYWxhcm1DdHguY3VycmVudFRpbWUrZGVsYXkpOwogICAgICBnYWluLmdhaW4ubGluZWFyUmFtcFRvVmFsdWVBdFRpbWUoLjMsYWxhcm1DdHguY3VycmVudFRpbWUrZGVsYXkrLjAyKTsKICAgICAgZ2Fpbi5nYWluLmxpbmVhclJhbXBUb1ZhbHVlQXRUaW1lKDAsYWxhcm1DdHguY3VycmVudFRpbWUrZGVsYXkrLjE4KTsKICAgICAgb3NjLnN0YXJ0KGFsYXJtQ3R4LmN1cnJlbnRUaW1lK2RlbGF5KTsKICAgICAgb3NjLnN0b3AoYWxhcm1DdHguY3VycmVudFRpbWUrZGVsYXkrLjIpOwogICAgfSk7CiAgICAvLyBGbGFzaCBvdmVybGF5CiAgICBjb25zdCBvdmVybGF5PWRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdhbGFybS1vdmVybGF5Jyk7CiAgICBvdmVybGF5LmNsYXNzTGlzdC5hZGQoJ2FjdGl2ZScpOwogICAgc2V0VGltZW91dCgoKT0+b3ZlcmxheS5jbGFzc0xpc3QucmVtb3ZlKCdhY3RpdmUnKSwyMDAwKTsKICB9Y2F0Y2goZSl7fQp9CgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gV0VCU09DS0VUCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkApmdW5jdGlvbiBjb25uZWN0V1MoKXsKICB3cz1uZXcgV2ViU29ja2V0KFdTX1VSTCk7CiAgd3Mub25vcGVuPSgpPT57c2V0KCd3cy1kb3QnLCdkb3QgYWN0aXZlJyk7c2V0KCd3cy1sYWJlbCcsJ1dTOiBDT05ORUNURUQnKX07CiAgd3Mub25jbG9zZT0oKT0+e3NldCgnd3MtZG90JywnZG90Jyk7c2V0KCd3cy1sYWJlbCcsJ1dTOiBSRUNPTk5FQ1RJTkcuLi4nKTtzZXRUaW1lb3V0KGNvbm5lY3RXUywzMDAwKX07CiAgd3Mub25lcnJvcj0oKT0+e3NldCgnd3MtZG90JywnZG90IHdhcm4nKTtzZXQoJ3dzLWxhYmVsJywnV1M6IEVSUk9SJyl9OwogIHdzLm9ubWVzc2FnZT1lPT57CiAgICBjb25zdCBkPUpTT04ucGFyc2UoZS5kYXRhKTsKICAgIGlmKGQuZG9hIT1udWxsKXtkb2FIaXN0b3J5LnB1c2goZC5kb2EpO2lmKGRvYUhpc3RvcnkubGVuZ3RoPkhJU1QpZG9hSGlzdG9yeS5zaGlmdCgpO2RvYUFuZ2xlPWRvYUhpc3RvcnkucmVkdWNlKChhLGIpPT5hK2IsMCkvZG9hSGlzdG9yeS5sZW5ndGh9CiAgICBpZihkLnRkb2FfbXMhPW51bGwpdGRvYU1zPWQudGRvYV9tczsKICAgIGlmKGQuc25yIT1udWxsKWRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzbnItdmFsJykudGV4dENvbnRlbnQ9ZC5zbnIudG9GaXhlZCgxKTsKICAgIGlmKGQuZGJfYSE9bnVsbCl7ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3BlYWstZGInKS50ZXh0Q29udGVudD1kLmRiX2EudG9GaXhlZCgxKSsnIGRCJzt1cGRhdGVNaWNCYXIoMCxkLmRiX2EpO3VwZGF0ZU1pY0JhcigxLGQuZGJfYil9CiAgICB1cGRhdGVDb25mKGQuY29uZmlkZW5jZXx8MCk7IHVwZGF0ZVJlYWRvdXQoKTsKICAgIGlmKGQuaXNfZ3Vuc2hvdCkgdHJpZ2dlckRldGVjdChkb2FBbmdsZSxkLmNvbmZpZGVuY2UpOwogIH07Cn0KY29ubmVjdFdTKCk7CgpmdW5jdGlvbiBzZXQoaWQsY2xzKXtjb25zdCBlbD1kb2N1bWVudC5nZXRFbGVtZW50QnlJZChpZCk7aWYoZWwpZWwuY2xhc3NOYW1lPWNsc30Kc2V0SW50ZXJ2YWwoKCk9PmRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdoZHItdGltZScpLnRleHRDb250ZW50PW5ldyBEYXRlKCkudG9VVENTdHJpbmcoKS5zcGxpdCgnICcpWzRdLDEwMDApOwpkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3BhY2luZy1zbGlkZXInKS5hZGRFdmVudExpc3RlbmVyKCdpbnB1dCcsZnVuY3Rpb24oKXsKICBtaWNTcGFjaW5nPXBhcnNlRmxvYXQodGhpcy52YWx1ZSk7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3NwYWNpbmctdmFsJykudGV4dENvbnRlbnQ9bWljU3BhY2luZy50b0ZpeGVkKDIpKycgbSc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2Rpc3QtdmFsJykudGV4dENvbnRlbnQ9bWljU3BhY2luZy50b0ZpeGVkKDIpOwp9KTsKCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBBVURJTwovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKYXN5bmMgZnVuY3Rpb24gdG9nZ2xlTGlzdGVuaW5nKCl7aXNMaXN0ZW5pbmc/c3RvcExpc3RlbmluZygpOmF3YWl0IHN0YXJ0TGlzdGVuaW5nKCl9CmFzeW5jIGZ1bmN0aW9uIHN0YXJ0TGlzdGVuaW5nKCl7CiAgdHJ5ewogICAgYXVkaW9DdHg9bmV3KHdpbmRvdy5BdWRpb0NvbnRleHR8fHdpbmRvdy53ZWJraXRBdWRpb0NvbnRleHQpKHtzYW1wbGVSYXRlOjQ0MTAwfSk7CiAgICBzdHJlYW09YXdhaXQgbmF2aWdhdG9yLm1lZGlhRGV2aWNlcy5nZXRVc2VyTWVkaWEoe2F1ZGlvOntlY2hvQ2FuY2VsbGF0aW9uOmZhbHNlLG5vaXNlU3VwcHJlc3Npb246ZmFsc2UsYXV0b0dhaW5Db250cm9sOmZhbHNlfX0pOwogICAgY29uc3Qgc3JjPWF1ZGlvQ3R4LmNyZWF0ZU1lZGlhU3RyZWFtU291cmNlKHN0cmVhbSk7CiAgICBhbmFseXNlckE9YXVkaW9DdHguY3JlYXRlQW5hbHlzZXIoKTthbmFseXNlckEuZmZ0U2l6ZT0yMDQ4O2FuYWx5c2VyQS5zbW9vdGhpbmdUaW1lQ29uc3RhbnQ9LjI7CiAgICBhbmFseXNlckI9YXVkaW9DdHguY3JlYXRlQW5hbHlzZXIoKTthbmFseXNlckIuZmZ0U2l6ZT0yMDQ4O2FuYWx5c2VyQi5zbW9vdGhpbmdUaW1lQ29uc3RhbnQ9LjI7CiAgICBjb25zdCBkZWxheT1hdWRpb0N0eC5jcmVhdGVEZWxheSguMDUpOwogICAgc3JjLmNvbm5lY3QoYW5hbHlzZXJBKTtzcmMuY29ubmVjdChkZWxheSk7ZGVsYXkuY29ubmVjdChhbmFseXNlckIpOwogICAgaXNMaXN0ZW5pbmc9dHJ1ZTsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGFydC1idG4nKS50ZXh0Q29udGVudD0n4pagIFNUT1AgTElTVEVOSU5HJzsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGFydC1idG4nKS5jbGFzc0xpc3QuYWRkKCdhY3RpdmUnKTsKICAgIHNldCgnc3lzLWRvdCcsJ2RvdCBhY3RpdmUnKTtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3lzLWxhYmVsJykudGV4dENvbnRlbnQ9J01PTklUT1JJTkcnOwogICAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ21pYzAnKS5jbGFzc0xpc3QuYWRkKCdhY3RpdmUnKTtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbWljMScpLmNsYXNzTGlzdC5hZGQoJ2FjdGl2ZScpOwogICAgYXVkaW9Mb29wKCk7CiAgfWNhdGNoKGUpe2FsZXJ0KCdNaWMgYWNjZXNzIGRlbmllZC4gVXNlIFNJTSBidXR0b25zLicpfQp9CmZ1bmN0aW9uIHN0b3BMaXN0ZW5pbmcoKXsKICBpc0xpc3RlbmluZz1mYWxzZTtpZihhbmltRnJhbWUpY2FuY2VsQW5pbWF0aW9uRnJhbWUoYW5pbUZyYW1lKTsKICBzdHJlYW0/LmdldFRyYWNrcygpLmZvckVhY2godD0+dC5zdG9wKCkpO2F1ZGlvQ3R4Py5jbG9zZSgpOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGFydC1idG4nKS50ZXh0Q29udGVudD0n4pa2IFNUQVJUIExJU1RFTklORyc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3N0YXJ0LWJ0bicpLmNsYXNzTGlzdC5yZW1vdmUoJ2FjdGl2ZScpOwogIHNldCgnc3lzLWRvdCcsJ2RvdCcpO2RvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzeXMtbGFiZWwnKS50ZXh0Q29udGVudD0nU1RBTkRCWSc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ21pYzAnKS5jbGFzc0xpc3QucmVtb3ZlKCdhY3RpdmUnKTtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbWljMScpLmNsYXNzTGlzdC5yZW1vdmUoJ2FjdGl2ZScpOwp9CmZ1bmN0aW9uIGF1ZGlvTG9vcCgpewogIGlmKCFpc0xpc3RlbmluZylyZXR1cm47CiAgYW5pbUZyYW1lPXJlcXVlc3RBbmltYXRpb25GcmFtZShhdWRpb0xvb3ApOwogIGNvbnN0IGRBPW5ldyBGbG9hdDMyQXJyYXkoMjA0OCksZEI9bmV3IEZsb2F0MzJBcnJheSgyMDQ4KTsKICBhbmFseXNlckEuZ2V0RmxvYXRUaW1lRG9tYWluRGF0YShkQSk7YW5hbHlzZXJCLmdldEZsb2F0VGltZURvbWFpbkRhdGEoZEIpOwogIGRyYXdXYXZlZm9ybShkQSk7CiAgaWYod3M/LnJlYWR5U3RhdGU9PT0xKXtsYXN0UGluZz1EYXRlLm5vdygpO3dzLnNlbmQoSlNPTi5zdHJpbmdpZnkoe21pY19hOkFycmF5LmZyb20oZEEpLG1pY19iOkFycmF5LmZyb20oZEIpLG1pY19zcGFjaW5nOm1pY1NwYWNpbmcsc2FtcGxlX3JhdGU6NDQxMDB9KSl9Cn0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBTSU1VTEFUSU9OCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAphc3luYyBmdW5jdGlvbiBzaW1HdW5zaG90KGFuZ2xlKXsKICB0cnl7CiAgICBjb25zdCByPWF3YWl0IGZldGNoKGAke0FQSX0vYXBpL3NpbXVsYXRlP2FuZ2xlPSR7YW5nbGV9Jm1pY19zcGFjaW5nPSR7bWljU3BhY2luZ31gLHttZXRob2Q6J1BPU1QnfSk7CiAgICBjb25zdCBkPWF3YWl0IHIuanNvbigpOwogICAgZG9hQW5nbGU9ZC5kb2E7IHRkb2FNcz1kLnRkb2FfbXM7CiAgICB0cmlnZ2VyRGV0ZWN0KGQuZG9hLGQuY29uZmlkZW5jZSk7IHVwZGF0ZVJlYWRvdXQoKTsKICAgIGNvbnN0IHNpbT1uZXcgRmxvYXQzMkFycmF5KDIwNDgpOwogICAgZm9yKGxldCBpPTA7aTwyMDQ4O2krKyl7c2ltW2ldPShNYXRoLnJhbmRvbSgpLS41KSouMDQ7aWYoaT40MDAmJmk8NjAwKXNpbVtpXT0oTWF0aC5yYW5kb20oKS0uNSkqLjg1Kk1hdGguZXhwKC0oaS01MDApLzgwKX0KICAgIGRyYXdXYXZlZm9ybShzaW0pOyBhZGRFdmVudChkKTsKICB9Y2F0Y2goZSl7CiAgICBjb25zdCBjb3M9TWF0aC5jb3MoYW5nbGUqTWF0aC5QSS8xODApOwogICAgZG9hQW5nbGU9YW5nbGU7IHRkb2FNcz1taWNTcGFjaW5nKmNvcy9TUEVFRCoxMDAwOwogICAgdHJpZ2dlckRldGVjdChhbmdsZSwuODgpOyB1cGRhdGVSZWFkb3V0KCk7CiAgICBhZGRFdmVudCh7ZG9hOmFuZ2xlLHRkb2FfbXM6dGRvYU1zLGNvbmZpZGVuY2U6Ljg4LGRiX2E6LTIyLHRpbWVzdGFtcF9pc286bmV3IERhdGUoKS50b1VUQ1N0cmluZygpLnNwbGl0KCcgJylbNF0sc2ltdWxhdGVkOnRydWV9KTsKICB9Cn0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBERVRFQ1RJT04KLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmZ1bmN0aW9uIHRyaWdnZXJEZXRlY3QoYW5nbGUsY29uZil7CiAgZGV0ZWN0aW5nPXRydWU7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2RldGVjdC1iYWRnZScpLmNsYXNzTmFtZT0nZGV0ZWN0LWJhZGdlIGd1bnNob3QnOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdkZXRlY3QtYmFkZ2UnKS50ZXh0Q29udGVudD0n4pqgIEdVTlNIT1QnOwogIHNldCgnc3lzLWRvdCcsJ2RvdCBhbGVydCcpOyBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3lzLWxhYmVsJykudGV4dENvbnRlbnQ9J0FMRVJUJzsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbGFzdC1kZXRlY3QnKS50ZXh0Q29udGVudD1uZXcgRGF0ZSgpLnRvVVRDU3RyaW5nKCkuc3BsaXQoJyAnKVs0XTsKICB1cGRhdGVDb25mKGNvbmYpOwogIHRyaWdnZXJBbGFybVNvdW5kKCk7CiAgY2xlYXJUaW1lb3V0KGRldGVjdFRpbWVvdXQpOwogIGRldGVjdFRpbWVvdXQ9c2V0VGltZW91dCgoKT0+ewogICAgZGV0ZWN0aW5nPWZhbHNlOwogICAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2RldGVjdC1iYWRnZScpLmNsYXNzTmFtZT1pc0xpc3RlbmluZz8nZGV0ZWN0LWJhZGdlIGNsZWFyJzonZGV0ZWN0LWJhZGdlJzsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdkZXRlY3QtYmFkZ2UnKS50ZXh0Q29udGVudD0nTU9OSVRPUklORyc7CiAgICBzZXQoJ3N5cy1kb3QnLGlzTGlzdGVuaW5nPydkb3QgYWN0aXZlJzonZG90Jyk7CiAgICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3lzLWxhYmVsJykudGV4dENvbnRlbnQ9aXNMaXN0ZW5pbmc/J01PTklUT1JJTkcnOidTVEFOREJZJzsKICAgIHVwZGF0ZUNvbmYoMCk7CiAgfSw0MDAwKTsKfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIEVWRU5UIE1BTkFHRU1FTlQKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmZ1bmN0aW9uIGFkZEV2ZW50KGQpewogIGV2ZW50Q291bnQrKzsKICBhbGxFdmVudHMudW5zaGlmdChkKTsKICBpZihhbGxFdmVudHMubGVuZ3RoPjIwMCkgYWxsRXZlbnRzLnBvcCgpOwoKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbG9nLWNvdW50JykudGV4dENvbnRlbnQ9ZXZlbnRDb3VudDsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnaGRyLWV2ZW50cycpLnRleHRDb250ZW50PWV2ZW50Q291bnQ7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3N0YXQtdG90YWwnKS50ZXh0Q29udGVudD1ldmVudENvdW50OwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGF0LWxhc3QtYW5nbGUnKS50ZXh0Q29udGVudD0oZC5kb2EhPW51bGw/TWF0aC5yb3VuZChkLmRvYSkrJ8KwJzonLS0nKTsKCiAgLy8gQXZnIGNvbmZpZGVuY2UKICBjb25zdCBhdmdDb25mPWFsbEV2ZW50cy5yZWR1Y2UoKHMsZSk9PnMrKGUuY29uZmlkZW5jZXx8MCksMCkvYWxsRXZlbnRzLmxlbmd0aDsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3RhdC1hdmctY29uZicpLnRleHRDb250ZW50PU1hdGgucm91bmQoYXZnQ29uZioxMDApKyclJzsKCiAgLy8gSGlzdG9ncmFtCiAgaWYoZC5kb2EhPW51bGwpewogICAgY29uc3QgYmluPU1hdGgubWluKDE3LE1hdGguZmxvb3IoZC5kb2EvMTApKTsKICAgIGhpc3RvZ3JhbURhdGFbYmluXSsrOwogICAgZHJhd0hpc3RvZ3JhbSgpOwogIH0KCiAgLy8gVHJhY2tlciBjYXJkcyAoc2hvdyBsYXN0IDQpCiAgY29uc3QgcmVjZW50PWFsbEV2ZW50cy5zbGljZSgwLDQpOwogIHJlY2VudC5mb3JFYWNoKChldixpKT0+ewogICAgY29uc3QgY2FyZD1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgndGMtJytpKTsKICAgIGlmKCFjYXJkKSByZXR1cm47CiAgICBjYXJkLmNsYXNzTmFtZT0ndHJhY2tlci1jYXJkIGFjdGl2ZSc7CiAgICBjYXJkLmlubmVySFRNTD1gPGRpdiBjbGFzcz0idGMtaWQiPiMke2V2ZW50Q291bnQtaX08L2Rpdj48ZGl2IGNsYXNzPSJ0Yy1hbmdsZSI+JHtldi5kb2EhPW51bGw/TWF0aC5yb3VuZChldi5kb2EpKyfCsCc6Jy0tJ308L2Rpdj48ZGl2IGNsYXNzPSJ0Yy1jb25mIj4ke01hdGgucm91bmQoKGV2LmNvbmZpZGVuY2V8fDApKjEwMCl9JTwvZGl2PjxkaXYgY2xhc3M9InRjLXRpbWUiPiR7ZXYudGltZXN0YW1wX2lzb3x8Jy0tJ308L2Rpdj5gOwogICAgc2V0VGltZW91dCgoKT0+Y2FyZC5jbGFzc0xpc3QucmVtb3ZlKCdhY3RpdmUnKSwzMDAwKTsKICB9KTsKICBmb3IobGV0IGk9cmVjZW50Lmxlbmd0aDtpPDQ7aSsrKSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgndGMtJytpKS5jbGFzc05hbWU9J3RyYWNrZXItY2FyZCBpbmFjdGl2ZSc7CgogIC8vIE1hcCBwaW4KICBpZihkLmRvYSE9bnVsbCkgYWRkTWFwTWFya2VyKGQuZG9hLCBkLmNvbmZpZGVuY2V8fDAuNSwgZXZlbnRDb3VudCk7CgogIC8vIExvZyBlbnRyeQogIGNvbnN0IGxpc3Q9ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2xvZy1saXN0JyksIGU9ZG9jdW1lbnQuY3JlYXRlRWxlbWVudCgnZGl2Jyk7CiAgZS5jbGFzc05hbWU9J2xvZy1lbnRyeSBndW5zaG90JzsKICBlLmlubmVySFRNTD1gPGRpdj48ZGl2IGNsYXNzPSJsb2ctdHlwZSI+R1VOU0hPVCR7ZC5zaW11bGF0ZWQ/JyBbU0lNXSc6Jyd9PC9kaXY+PGRpdiBjbGFzcz0ibG9nLWRldGFpbHMiPkNPTkY6JHtNYXRoLnJvdW5kKChkLmNvbmZpZGVuY2V8fDApKjEwMCl9JSDCtyBURE9BOiR7KGQudGRvYV9tc3x8MCkudG9GaXhlZCgzKX1tcyDCtyAke2QuZGJfYSE9bnVsbD9kLmRiX2EudG9GaXhlZCgxKSsnIGRCJzonJ308L2Rpdj48L2Rpdj48ZGl2PjxkaXYgY2xhc3M9ImxvZy1hbmdsZSI+JHtkLmRvYSE9bnVsbD9NYXRoLnJvdW5kKGQuZG9hKSsnwrAnOictLSd9PC9kaXY+PGRpdiBjbGFzcz0ibG9nLXRpbWUiPiR7ZC50aW1lc3RhbXBfaXNvfHwnLS0nfTwvZGl2PjwvZGl2PmA7CiAgbGlzdC5wcmVwZW5kKGUpOwp9CgpmdW5jdGlvbiBjbGVhckFsbCgpewogIGZldGNoKGAke0FQSX0vYXBpL2V2ZW50c2Ase21ldGhvZDonREVMRVRFJ30pLmNhdGNoKCgpPT57fSk7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2xvZy1saXN0JykuaW5uZXJIVE1MPScnOwogIGV2ZW50Q291bnQ9MDsgYWxsRXZlbnRzPVtdOwogIGhpc3RvZ3JhbURhdGEuZmlsbCgwKTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbG9nLWNvdW50JykudGV4dENvbnRlbnQ9JzAnOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdoZHItZXZlbnRzJykudGV4dENvbnRlbnQ9JzAnOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGF0LXRvdGFsJykudGV4dENvbnRlbnQ9JzAnOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGF0LWxhc3QtYW5nbGUnKS50ZXh0Q29udGVudD0nLS0nOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGF0LWF2Zy1jb25mJykudGV4dENvbnRlbnQ9Jy0tJSc7CiAgZm9yKGxldCBpPTA7aTw0O2krKyl7Y29uc3QgYz1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgndGMtJytpKTtpZihjKXtjLmNsYXNzTmFtZT0ndHJhY2tlci1jYXJkIGluYWN0aXZlJztjLmlubmVySFRNTD0nPGRpdiBjbGFzcz0idGMtaWQiPiMtLTwvZGl2PjxkaXYgY2xhc3M9InRjLWFuZ2xlIj4tLS3CsDwvZGl2PjxkaXYgY2xhc3M9InRjLWNvbmYiPi0tJTwvZGl2PjxkaXYgY2xhc3M9InRjLXRpbWUiPi0tPC9kaXY+J319CiAgY2xlYXJNYXBNYXJrZXJzKCk7CiAgZHJhd0hpc3RvZ3JhbSgpOwp9CgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gQ1NWIEVYUE9SVAovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKZnVuY3Rpb24gZXhwb3J0Q1NWKCl7CiAgY29uc3Qgcm93cz1bWydJRCcsJ1RpbWUnLCdET0EgKGRlZyknLCdURE9BIChtcyknLCdDb25maWRlbmNlJywnUGVhayBkQicsJ1NpbXVsYXRlZCddXTsKICBhbGxFdmVudHMuZm9yRWFjaCgoZSxpKT0+cm93cy5wdXNoKFthbGxFdmVudHMubGVuZ3RoLWksZS50aW1lc3RhbXBfaXNvfHwnJyxlLmRvYSE9bnVsbD9lLmRvYS50b0ZpeGVkKDEpOicnLGUudGRvYV9tcyE9bnVsbD9lLnRkb2FfbXMudG9GaXhlZCg0KTonJyxlLmNvbmZpZGVuY2UhPW51bGw/ZS5jb25maWRlbmNlLnRvRml4ZWQoMyk6JycsZS5kYl9hIT1udWxsP2UuZGJfYS50b0ZpeGVkKDEpOicnLGUuc2ltdWxhdGVkPyd5ZXMnOidubyddKSk7CiAgY29uc3QgY3N2PXJvd3MubWFwKHI9PnIuam9pbignLCcpKS5qb2luKCdcbicpOwogIGNvbnN0IGE9ZG9jdW1lbnQuY3JlYXRlRWxlbWVudCgnYScpOwogIGEuaHJlZj0nZGF0YTp0ZXh0L2NzdjtjaGFyc2V0PXV0Zi04LCcrZW5jb2RlVVJJQ29tcG9uZW50KGNzdik7CiAgYS5kb3dubG9hZD0nYWNvdXN0aWNfc2VudGluZWxfbG9nLmNzdic7IGEuY2xpY2soKTsKfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIFVJIEhFTFBFUlMKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmZ1bmN0aW9uIHVwZGF0ZUNvbmYodil7Y29uc3QgcD1NYXRoLnJvdW5kKHYqMTAwKTtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnY29uZi1maWxsJykuc3R5bGUud2lkdGg9cCsnJSc7ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2NvbmYtcGN0JykudGV4dENvbnRlbnQ9cCsnJSd9CmZ1bmN0aW9uIHVwZGF0ZU1pY0JhcihpLGRiKXtkb2N1bWVudC5nZXRFbGVtZW50QnlJZChgbWljJHtpfS1sdmxgKS50ZXh0Q29udGVudD1pc0Zpbml0ZShkYik/ZGIudG9GaXhlZCgxKTonLeKInic7ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoYG1pYyR7aX0tYmFyYCkuc3R5bGUud2lkdGg9TWF0aC5tYXgoMCxNYXRoLm1pbigxMDAsKGRiKzYwKSoxLjUpKSsnJSd9CmZ1bmN0aW9uIHVwZGF0ZVJlYWRvdXQoKXtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnZG9hLWFuZ2xlJykudGV4dENvbnRlbnQ9ZG9hQW5nbGUhPT1udWxsP01hdGgucm91bmQoZG9hQW5nbGUpKyfCsCc6Jy0tLcKwJztkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgndGRvYS12YWwnKS50ZXh0Q29udGVudD10ZG9hTXMudG9GaXhlZCgzKX0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBISVNUT0dSQU0KLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmZ1bmN0aW9uIGRyYXdIaXN0b2dyYW0oKXsKICBjb25zdCBjYW52YXM9ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2hpc3RvZ3JhbScpOwogIGlmKCFjYW52YXMpIHJldHVybjsKICBjb25zdCBXPWNhbnZhcy5vZmZzZXRXaWR0aHx8MzQwLCBIPTEyMDsKICBjYW52YXMud2lkdGg9VzsKICBjb25zdCBjdHg9Y2FudmFzLmdldENvbnRleHQoJzJkJyk7CiAgY3R4LmZpbGxTdHlsZT0nIzA4MGIwZic7IGN0eC5maWxsUmVjdCgwLDAsVyxIKTsKICBjb25zdCBtYXhWYWw9TWF0aC5tYXgoLi4uaGlzdG9ncmFtRGF0YSwxKTsKICBjb25zdCBidz1XLzE4OwogIGhpc3RvZ3JhbURhdGEuZm9yRWFjaCgodixpKT0+ewogICAgY29uc3QgYmg9KHYvbWF4VmFsKSooSC0yMCk7CiAgICBjb25zdCB4PWkqYncsIHk9SC1iaC0xNTsKICAgIGNvbnN0IGdyYWQ9Y3R4LmNyZWF0ZUxpbmVhckdyYWRpZW50KDAseSwwLEgtMTUpOwogICAgZ3JhZC5hZGRDb2xvclN0b3AoMCwnI2ZmM2MzYycpOyBncmFkLmFkZENvbG9yU3RvcCgxLCdyZ2JhKDI1NSw2MCw2MCwwLjIpJyk7CiAgICBjdHguZmlsbFN0eWxlPXY+MD9ncmFkOidyZ2JhKDI2LDM3LDUzLDAuNSknOwogICAgY3R4LmZpbGxSZWN0KHgrMSx5LGJ3LTIsYmgpOwogICAgY3R4LmZpbGxTdHlsZT0ncmdiYSg3NCw5NiwxMTIsMC44KSc7CiAgICBjdHguZm9udD0nN3B4IFNoYXJlIFRlY2ggTW9ubyc7CiAgICBjdHgudGV4dEFsaWduPSdjZW50ZXInOwogICAgY3R4LmZpbGxUZXh0KChpKjEwKSsnwrAnLHgrYncvMixILTMpOwogIH0pOwogIGN0eC5zdHJva2VTdHlsZT0ncmdiYSgyNiwzNyw1MywwLjgpJzsgY3R4LmxpbmVXaWR0aD0wLjU7CiAgY3R4LmJlZ2luUGF0aCgpOyBjdHgubW92ZVRvKDAsSC0xNSk7IGN0eC5saW5lVG8oVyxILTE1KTsgY3R4LnN0cm9rZSgpOwp9CgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gV0FWRUZPUk0KLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmNvbnN0IHdDPWRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd3YXZlZm9ybScpLHdYPXdDLmdldENvbnRleHQoJzJkJyk7CmZ1bmN0aW9uIGRyYXdXYXZlZm9ybShkYXRhKXsKICBjb25zdCBXPXdDLm9mZnNldFdpZHRofHwzNDAsSD02NTsgd0Mud2lkdGg9VzsKICB3WC5maWxsU3R5bGU9JyMwODBiMGYnOyB3WC5maWxsUmVjdCgwLDAsVyxIKTsKICB3WC5iZWdpblBhdGgoKTsgd1guc3Ryb2tlU3R5bGU9ZGV0ZWN0aW5nPycjZmYzYzNjJzonIzAwZmY4OCc7IHdYLmxpbmVXaWR0aD0xOwogIHdYLnNoYWRvd0JsdXI9ZGV0ZWN0aW5nPzg6NDsgd1guc2hhZG93Q29sb3I9ZGV0ZWN0aW5nPycjZmYzYzNjJzonIzAwZmY4OCc7CiAgY29uc3Qgc3RlcD1NYXRoLmZsb29yKGRhdGEubGVuZ3RoL1cpOwogIGZvcihsZXQgaT0wO2k8VztpKyspe2NvbnN0IHk9SC8yKyhkYXRhW2kqc3RlcF18fDApKjI4O2k9PT0wP3dYLm1vdmVUbyhpLHkpOndYLmxpbmVUbyhpLHkpfQogIHdYLnN0cm9rZSgpOyB3WC5zaGFkb3dCbHVyPTA7CiAgd1guYmVnaW5QYXRoKCk7IHdYLnN0cm9rZVN0eWxlPSdyZ2JhKDI2LDM3LDUzLC44KSc7IHdYLmxpbmVXaWR0aD0uNTsgd1gubW92ZVRvKDAsSC8yKTsgd1gubGluZVRvKFcsSC8yKTsgd1guc3Ryb2tlKCk7Cn0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBQT0xBUiBQTE9UCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkApjb25zdCBwQz1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncG9sYXInKSxwWD1wQy5nZXRDb250ZXh0KCcyZCcpOwpmdW5jdGlvbiBzeigpe3JldHVybiBwQy5vZmZzZXRXaWR0aHx8MzIwfQpmdW5jdGlvbiBkcmF3R3JpZCgpewogIGNvbnN0IFM9c3ooKSxjeD1TLzIsY3k9Uy8yLHI9Uy8yLTIyOwogIHBYLmNsZWFyUmVjdCgwLDAsUyxTKTsgcEMud2lkdGg9UzsgcEMuaGVpZ2h0PVM7CiAgcFguZmlsbFN0eWxlPSdyZ2JhKDgsMTEsMTUsLjk1KSc7IHBYLmZpbGxSZWN0KDAsMCxTLFMpOwogIGZvcihsZXQgaT0xO2k8PTQ7aSsrKXtwWC5iZWdpblBhdGgoKTtwWC5hcmMoY3gsY3kscippLzQsMCxNYXRoLlBJKjIpO3BYLnN0cm9rZVN0eWxlPWByZ2JhKDI2LDM3LDUzLCR7aT09PTQ/Ljg6LjR9KWA7cFgubGluZVdpZHRoPWk9PT00PzEuNTouNTtwWC5zdHJva2UoKX0KICBmb3IobGV0IGE9MDthPDM2MDthKz0zMCl7CiAgICBjb25zdCByYWQ9KGEtOTApKk1hdGguUEkvMTgwOwogICAgcFguYmVnaW5QYXRoKCk7cFgubW92ZVRvKGN4LGN5KTtwWC5saW5lVG8oY3grcipNYXRoLmNvcyhyYWQpLGN5K3IqTWF0aC5zaW4ocmFkKSk7cFguc3Ryb2tlU3R5bGU9J3JnYmEoMjYsMzcsNTMsLjYpJztwWC5saW5lV2lkdGg9LjU7cFguc3Ryb2tlKCk7CiAgICBwWC5maWxsU3R5bGU9J3JnYmEoNzQsOTYsMTEyLC44KSc7cFguZm9udD1gJHtNYXRoLm1heCg3LFMvNDgpfXB4IFNoYXJlIFRlY2ggTW9ub2A7cFgudGV4dEFsaWduPSdjZW50ZXInO3BYLnRleHRCYXNlbGluZT0nbWlkZGxlJzsKICAgIHBYLmZpbGxUZXh0KGErJ8KwJyxjeCsocisxMykqTWF0aC5jb3MocmFkKSxjeSsocisxMykqTWF0aC5zaW4ocmFkKSk7CiAgfQp9CmZ1bmN0aW9uIHJlbmRlclBvbGFyKCl7CiAgY29uc3QgUz1zeigpLGN4PVMvMixjeT1TLzIscj1TLzItMjI7CiAgZHJhd0dyaWQoKTsKICBjb25zdCBub3c9RGF0ZS5ub3coKS8xMDAwLCBzd2VlcD0obm93Ki40JTEpKk1hdGguUEkqMi1NYXRoLlBJLzI7CiAgcFguc2F2ZSgpO3BYLmdsb2JhbEFscGhhPS4xMjtwWC5iZWdpblBhdGgoKTtwWC5tb3ZlVG8oY3gsY3kpO3BYLmFyYyhjeCxjeSxyLHN3ZWVwLS44LHN3ZWVwKTtwWC5jbG9zZVBhdGgoKTtwWC5maWxsU3R5bGU9J3JnYmEoMCwyNTUsMTM2LC4zKSc7cFguZmlsbCgpO3BYLnJlc3RvcmUoKTsKICBwWC5zYXZlKCk7cFguZ2xvYmFsQWxwaGE9LjU7cFguYmVnaW5QYXRoKCk7cFgubW92ZVRvKGN4LGN5KTtwWC5saW5lVG8oY3grcipNYXRoLmNvcyhzd2VlcCksY3krcipNYXRoLnNpbihzd2VlcCkpO3BYLnN0cm9rZVN0eWxlPScjMDBmZjg4JztwWC5saW5lV2lkdGg9MTtwWC5zdHJva2UoKTtwWC5yZXN0b3JlKCk7CgogIC8vIERyYXcgYWxsIHJlY2VudCBzaG90cyBhcyBmYWRpbmcgbGluZXMKICBhbGxFdmVudHMuc2xpY2UoMCw2KS5mb3JFYWNoKChldixpKT0+ewogICAgaWYoZXYuZG9hPT1udWxsKSByZXR1cm47CiAgICBjb25zdCByYWQ9ZXYuZG9hKk1hdGguUEkvMTgwLU1hdGguUEkvMjsKICAgIGNvbnN0IGFscGhhPU1hdGgubWF4KDAuMSwoNi1pKS82KjAuNCk7CiAgICBwWC5iZWdpblBhdGgoKTtwWC5tb3ZlVG8oY3gsY3kpO3BYLmxpbmVUbyhjeCtyKk1hdGguY29zKHJhZCksY3krcipNYXRoLnNpbihyYWQpKTsKICAgIHBYLnN0cm9rZVN0eWxlPWByZ2JhKDI1NSw2MCw2MCwke2FscGhhfSlgO3BYLmxpbmVXaWR0aD0xO3BYLnN0cm9rZSgpOwogIH0pOwoKICBmb3IobGV0IGk9cGFydGljbGVzLmxlbmd0aC0xO2k+PTA7aS0tKXsKICAgIGNvbnN0IHA9cGFydGljbGVzW2ldO3AucmFkaXVzKz0yLjU7cC5saWZlLT0uMDI1OwogICAgaWYocC5saWZlPD0wKXtwYXJ0aWNsZXMuc3BsaWNlKGksMSk7Y29udGludWV9CiAgICBwWC5iZWdpblBhdGgoKTtwWC5hcmMoY3grcC5yYWRpdXMqTWF0aC5jb3MocC5hbmdsZStwLnNwcmVhZCksY3krcC5yYWRpdXMqTWF0aC5zaW4ocC5hbmdsZStwLnNwcmVhZCksMiwwLE1hdGguUEkqMik7CiAgICBwWC5maWxsU3R5bGU9YHJnYmEoMjU1LDYwLDYwLCR7cC5saWZlKi44fSlgO3BYLmZpbGwoKTsKICB9CgogIGlmKGRvYUFuZ2xlIT09bnVsbCl7CiAgICBjb25zdCByYWQ9ZG9hQW5nbGUqTWF0aC5QSS8xODAtTWF0aC5QSS8yOwogICAgY29uc3QgZz1wWC5jcmVhdGVMaW5lYXJHcmFkaWVudChjeCxjeSxjeCtyKk1hdGguY29zKHJhZCksY3krcipNYXRoLnNpbihyYWQpKTsKICAgIGcuYWRkQ29sb3JTdG9wKDAsJ3JnYmEoMjU1LDYwLDYwLDApJyk7Zy5hZGRDb2xvclN0b3AoMSxkZXRlY3Rpbmc/J3JnYmEoMjU1LDYwLDYwLC45NSknOidyZ2JhKDAsMjU1LDEzNiwuNzUpJyk7CiAgICBwWC5iZWdpblBhdGgoKTtwWC5tb3ZlVG8oY3gsY3kpO3BYLmxpbmVUbyhjeCtyKk1hdGguY29zKHJhZCksY3krcipNYXRoLnNpbihyYWQpKTsKICAgIHBYLnN0cm9rZVN0eWxlPWc7cFgubGluZVdpZHRoPWRldGVjdGluZz8zOjEuNTtwWC5zdHJva2UoKTsKICAgIGNvbnN0IHNwPTE1Kk1hdGguUEkvMTgwOwogICAgcFguYmVnaW5QYXRoKCk7cFgubW92ZVRvKGN4LGN5KTtwWC5hcmMoY3gsY3kscixyYWQtc3AscmFkK3NwKTtwWC5jbG9zZVBhdGgoKTsKICAgIHBYLmZpbGxTdHlsZT1kZXRlY3Rpbmc/J3JnYmEoMjU1LDYwLDYwLC4wNyknOidyZ2JhKDAsMjU1LDEzNiwuMDQpJztwWC5maWxsKCk7CiAgICBwWC5iZWdpblBhdGgoKTtwWC5hcmMoY3grcipNYXRoLmNvcyhyYWQpLGN5K3IqTWF0aC5zaW4ocmFkKSxkZXRlY3Rpbmc/Njo0LDAsTWF0aC5QSSoyKTsKICAgIHBYLmZpbGxTdHlsZT1kZXRlY3Rpbmc/JyNmZjNjM2MnOicjMDBmZjg4JztwWC5maWxsKCk7CiAgICBpZihkZXRlY3RpbmcpZm9yKGxldCBpPTA7aTwzO2krKylwYXJ0aWNsZXMucHVzaCh7YW5nbGU6cmFkLHJhZGl1czowLGxpZmU6MSxzcHJlYWQ6KE1hdGgucmFuZG9tKCktLjUpKi4zNX0pOwogIH0KICByZXF1ZXN0QW5pbWF0aW9uRnJhbWUocmVuZGVyUG9sYXIpOwp9CnJlbmRlclBvbGFyKCk7CmRyYXdIaXN0b2dyYW0oKTsKPC9zY3JpcHQ+CjwvYm9keT4KPC9odG1sPgo=").decode("utf-8")
+HTML=_b.b64decode("SFRNTCA9IDwhRE9DVFlQRSBodG1sPgo8aHRtbCBsYW5nPSJlbiI+CjxoZWFkPgo8bWV0YSBjaGFyc2V0PSJVVEYtOCI+CjxtZXRhIG5hbWU9InZpZXdwb3J0IiBjb250ZW50PSJ3aWR0aD1kZXZpY2Utd2lkdGgsaW5pdGlhbC1zY2FsZT0xLjAsbWF4aW11bS1zY2FsZT0xLjAiPgo8dGl0bGU+QUNPVVNUSUMgU0VOVElORUwgdjM8L3RpdGxlPgo8bGluayBocmVmPSJodHRwczovL2ZvbnRzLmdvb2dsZWFwaXMuY29tL2NzczI/ZmFtaWx5PVNoYXJlK1RlY2grTW9ubyZmYW1pbHk9T3JiaXRyb246d2dodEA0MDA7NzAwOzkwMCZkaXNwbGF5PXN3YXAiIHJlbD0ic3R5bGVzaGVldCI+CjxsaW5rIHJlbD0ic3R5bGVzaGVldCIgaHJlZj0iaHR0cHM6Ly91bnBrZy5jb20vbGVhZmxldEAxLjkuNC9kaXN0L2xlYWZsZXQuY3NzIi8+CjxzY3JpcHQgc3JjPSJodHRwczovL3VucGtnLmNvbS9sZWFmbGV0QDEuOS40L2Rpc3QvbGVhZmxldC5qcyI+PC9zY3JpcHQ+CjxzdHlsZT4KOnJvb3R7LS1iZzojMDgwYjBmOy0tcGFuZWw6IzBkMTExNzstLWJvcmRlcjojMWEyNTM1Oy0tYWNjZW50OiMwMGZmODg7LS1hY2NlbnQyOiNmZjNjM2M7LS1hY2NlbnQzOiNmZmI4MDA7LS1kaW06IzFlMmQzZDstLXRleHQ6I2M4ZDhlODstLXRleHQtZGltOiM0YTYwNzB9Cip7bWFyZ2luOjA7cGFkZGluZzowO2JveC1zaXppbmc6Ym9yZGVyLWJveH0KYm9keXtiYWNrZ3JvdW5kOnZhcigtLWJnKTtjb2xvcjp2YXIoLS10ZXh0KTtmb250LWZhbWlseTonU2hhcmUgVGVjaCBNb25vJyxtb25vc3BhY2U7bWluLWhlaWdodDoxMDB2aH0KaGVhZGVye2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OnNwYWNlLWJldHdlZW47cGFkZGluZzoxMnB4IDE2cHg7Ym9yZGVyLWJvdHRvbToxcHggc29saWQgdmFyKC0tYm9yZGVyKTtiYWNrZ3JvdW5kOnJnYmEoMTMsMTcsMjMsLjk3KTtwb3NpdGlvbjpzdGlja3k7dG9wOjA7ei1pbmRleDoxMDAwO2ZsZXgtd3JhcDp3cmFwO2dhcDo4cHh9Ci5sb2dve2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjEycHh9Ci5sb2dvLWljb257d2lkdGg6MzJweDtoZWlnaHQ6MzJweDtib3JkZXI6MnB4IHNvbGlkIHZhcigtLWFjY2VudCk7Ym9yZGVyLXJhZGl1czo1MCU7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtqdXN0aWZ5LWNvbnRlbnQ6Y2VudGVyO3Bvc2l0aW9uOnJlbGF0aXZlO2JveC1zaGFkb3c6MCAwIDIwcHggcmdiYSgwLDI1NSwxMzYsLjMpO2ZsZXgtc2hyaW5rOjB9Ci5sb2dvLWljb246OmJlZm9yZXtjb250ZW50OicnO3dpZHRoOjdweDtoZWlnaHQ6N3B4O2JhY2tncm91bmQ6dmFyKC0tYWNjZW50KTtib3JkZXItcmFkaXVzOjUwJTthbmltYXRpb246cHVsc2UgMnMgaW5maW5pdGV9Ci5sb2dvLWljb246OmFmdGVye2NvbnRlbnQ6Jyc7cG9zaXRpb246YWJzb2x1dGU7d2lkdGg6NDRweDtoZWlnaHQ6NDRweDtib3JkZXI6MXB4IHNvbGlkIHJnYmEoMCwyNTUsMTM2LC4yKTtib3JkZXItcmFkaXVzOjUwJTthbmltYXRpb246cmFkYXItcmluZyAycyBpbmZpbml0ZX0KQGtleWZyYW1lcyByYWRhci1yaW5nezAle3RyYW5zZm9ybTpzY2FsZSguNyk7b3BhY2l0eTouOH0xMDAle3RyYW5zZm9ybTpzY2FsZSgxLjQpO29wYWNpdHk6MH19CkBrZXlmcmFtZXMgcHVsc2V7MCUsMTAwJXtvcGFjaXR5OjF9NTAle29wYWNpdHk6LjN9fQpAa2V5ZnJhbWVzIGZsYXNoe2Zyb217b3BhY2l0eToxfXRve29wYWNpdHk6LjR9fQpAa2V5ZnJhbWVzIGFsYXJtUHVsc2V7MCUsMTAwJXtiYWNrZ3JvdW5kOnJnYmEoMjU1LDYwLDYwLDApfTUwJXtiYWNrZ3JvdW5kOnJnYmEoMjU1LDYwLDYwLDAuMTUpfX0KLmxvZ28tdGV4dHtmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXdlaWdodDo5MDA7Zm9udC1zaXplOjE0cHg7bGV0dGVyLXNwYWNpbmc6M3B4O2NvbG9yOnZhcigtLWFjY2VudCl9Ci5sb2dvLXN1Yntmb250LXNpemU6OHB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoycHh9Ci5oZHItcmlnaHR7ZGlzcGxheTpmbGV4O2dhcDoxMnB4O2FsaWduLWl0ZW1zOmNlbnRlcjtmbGV4LXdyYXA6d3JhcH0KLnN0YXR1cy1pdGVte3RleHQtYWxpZ246Y2VudGVyO2ZvbnQtc2l6ZTo5cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pfQouc3RhdHVzLXZhbHtkaXNwbGF5OmJsb2NrO2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMnB4O2NvbG9yOnZhcigtLWFjY2VudCl9CiNzeXN0ZW0tc3RhdHVze2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjZweDtmb250LXNpemU6MTBweDtsZXR0ZXItc3BhY2luZzoycHh9Ci5kb3R7d2lkdGg6N3B4O2hlaWdodDo3cHg7Ym9yZGVyLXJhZGl1czo1MCU7YmFja2dyb3VuZDp2YXIoLS10ZXh0LWRpbSk7dHJhbnNpdGlvbjphbGwgLjNzO2ZsZXgtc2hyaW5rOjB9Ci5kb3QuYWN0aXZle2JhY2tncm91bmQ6dmFyKC0tYWNjZW50KTtib3gtc2hhZG93OjAgMCAyMHB4IHJnYmEoMCwyNTUsMTM2LC4zKTthbmltYXRpb246cHVsc2UgMS41cyBpbmZpbml0ZX0KLmRvdC5hbGVydHtiYWNrZ3JvdW5kOnZhcigtLWFjY2VudDIpO2JveC1zaGFkb3c6MCAwIDIwcHggcmdiYSgyNTUsNjAsNjAsLjUpO2FuaW1hdGlvbjpwdWxzZSAuNXMgaW5maW5pdGV9Ci5kb3Qud2FybntiYWNrZ3JvdW5kOnZhcigtLWFjY2VudDMpO2FuaW1hdGlvbjpwdWxzZSAxcyBpbmZpbml0ZX0KCi8qIFRBQlMgKi8KLnRhYnN7ZGlzcGxheTpmbGV4O2JvcmRlci1ib3R0b206MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7YmFja2dyb3VuZDp2YXIoLS1wYW5lbCk7cG9zaXRpb246c3RpY2t5O3RvcDo2NXB4O3otaW5kZXg6OTk5fQoudGFie2ZsZXg6MTtwYWRkaW5nOjEycHggNHB4O3RleHQtYWxpZ246Y2VudGVyO2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7bGV0dGVyLXNwYWNpbmc6MnB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtjdXJzb3I6cG9pbnRlcjtib3JkZXItYm90dG9tOjJweCBzb2xpZCB0cmFuc3BhcmVudDt0cmFuc2l0aW9uOmFsbCAuMnM7LXdlYmtpdC10YXAtaGlnaGxpZ2h0LWNvbG9yOnRyYW5zcGFyZW50fQoudGFiLmFjdGl2ZXtjb2xvcjp2YXIoLS1hY2NlbnQpO2JvcmRlci1ib3R0b20tY29sb3I6dmFyKC0tYWNjZW50KX0KLnRhYi1jb250ZW50e2Rpc3BsYXk6bm9uZX0KLnRhYi1jb250ZW50LmFjdGl2ZXtkaXNwbGF5OmJsb2NrfQoKLyogQUxBUk0gT1ZFUkxBWSAqLwojYWxhcm0tb3ZlcmxheXtkaXNwbGF5Om5vbmU7cG9zaXRpb246Zml4ZWQ7aW5zZXQ6MDt6LWluZGV4Ojk5OTk7cG9pbnRlci1ldmVudHM6bm9uZTthbmltYXRpb246YWxhcm1QdWxzZSAuNHMgaW5maW5pdGV9CiNhbGFybS1vdmVybGF5LmFjdGl2ZXtkaXNwbGF5OmJsb2NrfQoKLyogUEFORUxTICovCi5wYW5lbHtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7YmFja2dyb3VuZDp2YXIoLS1wYW5lbCk7cG9zaXRpb246cmVsYXRpdmU7b3ZlcmZsb3c6aGlkZGVufQoucGFuZWw6OmJlZm9yZXtjb250ZW50OicnO3Bvc2l0aW9uOmFic29sdXRlO3RvcDowO2xlZnQ6MDtyaWdodDowO2hlaWdodDoxcHg7YmFja2dyb3VuZDpsaW5lYXItZ3JhZGllbnQoOTBkZWcsdHJhbnNwYXJlbnQsdmFyKC0tYWNjZW50KSx0cmFuc3BhcmVudCk7b3BhY2l0eTouNH0KLnBhbmVsLWxhYmVse3Bvc2l0aW9uOmFic29sdXRlO3RvcDoxMHB4O2xlZnQ6MTRweDtmb250LXNpemU6OXB4O2xldHRlci1zcGFjaW5nOjNweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7ei1pbmRleDoyfQoucGFuZWwtbGFiZWwgc3Bhbntjb2xvcjp2YXIoLS1hY2NlbnQpfQoKLyogRE9BIFRBQiAqLwouZG9hLXBhbmVse2Rpc3BsYXk6ZmxleDtmbGV4LWRpcmVjdGlvbjpjb2x1bW47YWxpZ24taXRlbXM6Y2VudGVyO3BhZGRpbmc6NDBweCAxNnB4IDIwcHg7Z2FwOjE2cHh9Ci5wb2xhci13cmFwe3Bvc2l0aW9uOnJlbGF0aXZlO3dpZHRoOm1pbigzMjBweCw4OHZ3KTtoZWlnaHQ6bWluKDMyMHB4LDg4dncpfQojcG9sYXJ7d2lkdGg6MTAwJTtoZWlnaHQ6MTAwJX0KLmRvYS1yZWFkb3V0e3RleHQtYWxpZ246Y2VudGVyO3dpZHRoOjEwMCV9Ci5kb2EtYW5nbGV7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjQ0cHg7Zm9udC13ZWlnaHQ6OTAwO2NvbG9yOnZhcigtLWFjY2VudCk7bGluZS1oZWlnaHQ6MX0KLmRvYS1sYWJlbHtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzozcHg7bWFyZ2luLXRvcDo0cHh9Ci50ZG9hLWRpc3BsYXl7ZGlzcGxheTpmbGV4O2dhcDoyMHB4O21hcmdpbi10b3A6MTBweDtqdXN0aWZ5LWNvbnRlbnQ6Y2VudGVyfQoudGRvYS1pdGVte3RleHQtYWxpZ246Y2VudGVyfQoudGRvYS12YWx7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjEzcHg7Y29sb3I6dmFyKC0tYWNjZW50Myl9Ci50ZG9hLWxibHtmb250LXNpemU6OHB4O2NvbG9yOnZhcigtLXRleHQtZGltKX0KCi8qIERFVEVDVCAqLwouZGV0ZWN0LXBhbmVse3BhZGRpbmc6NDBweCAxNnB4IDE2cHh9Ci5kZXRlY3Qtc3RhdHVze2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OnNwYWNlLWJldHdlZW47bWFyZ2luLWJvdHRvbToxMnB4fQouZGV0ZWN0LWJhZGdle2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMHB4O2xldHRlci1zcGFjaW5nOjJweDtwYWRkaW5nOjVweCAxMnB4O2JvcmRlcjoxcHggc29saWQgdmFyKC0tdGV4dC1kaW0pO2NvbG9yOnZhcigtLXRleHQtZGltKTt0cmFuc2l0aW9uOmFsbCAuM3N9Ci5kZXRlY3QtYmFkZ2UuZ3Vuc2hvdHtib3JkZXItY29sb3I6dmFyKC0tYWNjZW50Mik7Y29sb3I6dmFyKC0tYWNjZW50Mik7Ym94LXNoYWRvdzowIDAgMjBweCByZ2JhKDI1NSw2MCw2MCwuNSk7YW5pbWF0aW9uOmZsYXNoIC4zcyBlYXNlIGluZmluaXRlIGFsdGVybmF0ZX0KLmRldGVjdC1iYWRnZS5jbGVhcntib3JkZXItY29sb3I6dmFyKC0tYWNjZW50KTtjb2xvcjp2YXIoLS1hY2NlbnQpfQouY29uZmlkZW5jZS1iYXJ7aGVpZ2h0OjRweDtiYWNrZ3JvdW5kOnZhcigtLWRpbSk7Ym9yZGVyLXJhZGl1czoycHg7b3ZlcmZsb3c6aGlkZGVuO21hcmdpbi1ib3R0b206MTBweH0KLmNvbmZpZGVuY2UtZmlsbHtoZWlnaHQ6MTAwJTtiYWNrZ3JvdW5kOmxpbmVhci1ncmFkaWVudCg5MGRlZyx2YXIoLS1hY2NlbnQpLHZhcigtLWFjY2VudDMpKTt3aWR0aDowJTt0cmFuc2l0aW9uOndpZHRoIC40cyBlYXNlO2JvcmRlci1yYWRpdXM6MnB4fQouY29uZi1sYWJlbHtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoycHh9Ci5jb25mLXZhbHtmbG9hdDpyaWdodDtjb2xvcjp2YXIoLS1hY2NlbnQzKX0KI3dhdmVmb3Jte3dpZHRoOjEwMCU7aGVpZ2h0OjY1cHg7ZGlzcGxheTpibG9jaztib3JkZXI6MXB4IHNvbGlkIHZhcigtLWRpbSk7Ym9yZGVyLXJhZGl1czoycHg7bWFyZ2luLXRvcDoxMHB4fQoKLyogTUlDICovCi5taWMtcGFuZWx7cGFkZGluZzo0MHB4IDE2cHggMTZweH0KLm1pYy1hcnJheXtkaXNwbGF5OmZsZXg7Z2FwOjEwcHg7YWxpZ24taXRlbXM6Y2VudGVyO21hcmdpbi1ib3R0b206MTRweH0KLm1pYy11bml0e2ZsZXg6MTtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWRpbSk7cGFkZGluZzoxMHB4O3RleHQtYWxpZ246Y2VudGVyO3RyYW5zaXRpb246YWxsIC4zc30KLm1pYy11bml0LmFjdGl2ZXtib3JkZXItY29sb3I6dmFyKC0tYWNjZW50KTtib3gtc2hhZG93OjAgMCAyMHB4IHJnYmEoMCwyNTUsMTM2LC4zKX0KLm1pYy1uYW1le2ZvbnQtc2l6ZTo5cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pO2xldHRlci1zcGFjaW5nOjJweH0KLm1pYy1sZXZlbHtmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXNpemU6MTVweDtjb2xvcjp2YXIoLS1hY2NlbnQpO21hcmdpbjo0cHggMH0KLm1pYy1iYXJ7aGVpZ2h0OjNweDtiYWNrZ3JvdW5kOnZhcigtLWRpbSk7Ym9yZGVyLXJhZGl1czoycHg7b3ZlcmZsb3c6aGlkZGVufQoubWljLWJhci1maWxse2hlaWdodDoxMDAlO2JhY2tncm91bmQ6dmFyKC0tYWNjZW50KTt3aWR0aDowJTt0cmFuc2l0aW9uOndpZHRoIC4xcztib3JkZXItcmFkaXVzOjJweH0KLm1pYy1hcnJvd3tmb250LXNpemU6MThweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7ZmxleC1zaHJpbms6MH0KLnNwYWNpbmctY29udHJvbHtkaXNwbGF5OmZsZXg7YWxpZ24taXRlbXM6Y2VudGVyO2dhcDoxMHB4O2ZvbnQtc2l6ZToxMHB4O2NvbG9yOnZhcigtLXRleHQtZGltKTttYXJnaW4tYm90dG9tOjEycHh9Ci5zcGFjaW5nLWNvbnRyb2wgaW5wdXRbdHlwZT1yYW5nZV17ZmxleDoxOy13ZWJraXQtYXBwZWFyYW5jZTpub25lO2hlaWdodDoycHg7YmFja2dyb3VuZDp2YXIoLS1kaW0pO291dGxpbmU6bm9uZTtib3JkZXItcmFkaXVzOjJweH0KLnNwYWNpbmctY29udHJvbCBpbnB1dFt0eXBlPXJhbmdlXTo6LXdlYmtpdC1zbGlkZXItdGh1bWJ7LXdlYmtpdC1hcHBlYXJhbmNlOm5vbmU7d2lkdGg6MTRweDtoZWlnaHQ6MTRweDtiYWNrZ3JvdW5kOnZhcigtLWFjY2VudCk7Ym9yZGVyLXJhZGl1czo1MCU7Y3Vyc29yOnBvaW50ZXJ9Ci5zcGFjaW5nLXZhbHtjb2xvcjp2YXIoLS1hY2NlbnQpO21pbi13aWR0aDo1MHB4fQouYnRue3dpZHRoOjEwMCU7cGFkZGluZzoxMnB4O2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMHB4O2xldHRlci1zcGFjaW5nOjNweDtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWFjY2VudCk7YmFja2dyb3VuZDp0cmFuc3BhcmVudDtjb2xvcjp2YXIoLS1hY2NlbnQpO2N1cnNvcjpwb2ludGVyO3RyYW5zaXRpb246YWxsIC4yczt0b3VjaC1hY3Rpb246bWFuaXB1bGF0aW9uO21hcmdpbi1ib3R0b206NnB4fQouYnRuLmFjdGl2ZXtiYWNrZ3JvdW5kOnJnYmEoMCwyNTUsMTM2LC4xKX0KLmJ0bi5kYW5nZXJ7Ym9yZGVyLWNvbG9yOnZhcigtLWFjY2VudDIpO2NvbG9yOnZhcigtLWFjY2VudDIpfQouYnRuLndhcm57Ym9yZGVyLWNvbG9yOnZhcigtLWFjY2VudDMpO2NvbG9yOnZhcigtLWFjY2VudDMpfQouYnRuLm9ue2JhY2tncm91bmQ6cmdiYSgyNTUsMTg0LDAsLjE1KTtib3JkZXItY29sb3I6dmFyKC0tYWNjZW50Myk7Y29sb3I6dmFyKC0tYWNjZW50Myl9Ci5zaW0tcm93e2Rpc3BsYXk6ZmxleDtnYXA6NnB4O21hcmdpbi10b3A6NHB4fQouYnRuLXNte3BhZGRpbmc6MTBweCA0cHg7Zm9udC1zaXplOjhweDtmbGV4OjE7bWFyZ2luLWJvdHRvbTowfQoKLyogTUFQIFRBQiAqLwojbWFwe2hlaWdodDozNTBweDt3aWR0aDoxMDAlO3otaW5kZXg6MX0KLm1hcC1wYW5lbHtwYWRkaW5nOjQwcHggMCAwfQoubWFwLWNvbnRyb2xze3BhZGRpbmc6MTJweCAxNnB4O2Rpc3BsYXk6ZmxleDtnYXA6OHB4O2ZsZXgtd3JhcDp3cmFwfQoubWFwLWJ0bntmbGV4OjE7cGFkZGluZzo4cHg7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjhweDtsZXR0ZXItc3BhY2luZzoycHg7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO2JhY2tncm91bmQ6dmFyKC0tcGFuZWwpO2NvbG9yOnZhcigtLXRleHQtZGltKTtjdXJzb3I6cG9pbnRlcjttaW4td2lkdGg6ODBweDt0b3VjaC1hY3Rpb246bWFuaXB1bGF0aW9ufQoubWFwLWJ0bi5hY3RpdmV7Ym9yZGVyLWNvbG9yOnZhcigtLWFjY2VudCk7Y29sb3I6dmFyKC0tYWNjZW50KX0KLnNob3QtY291bnQtYmFkZ2V7ZGlzcGxheTppbmxpbmUtYmxvY2s7YmFja2dyb3VuZDp2YXIoLS1hY2NlbnQyKTtjb2xvcjojZmZmO2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7cGFkZGluZzoycHggOHB4O2JvcmRlci1yYWRpdXM6MnB4O21hcmdpbi1sZWZ0OjhweH0KCi8qIFRSQUNLRVIgVEFCICovCi50cmFja2VyLXBhbmVse3BhZGRpbmc6MTZweH0KLnRyYWNrZXItZ3JpZHtkaXNwbGF5OmdyaWQ7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmciAxZnI7Z2FwOjhweDttYXJnaW4tYm90dG9tOjEycHh9Ci50cmFja2VyLWNhcmR7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO3BhZGRpbmc6MTJweDt0ZXh0LWFsaWduOmNlbnRlcjtwb3NpdGlvbjpyZWxhdGl2ZTt0cmFuc2l0aW9uOmFsbCAuM3N9Ci50cmFja2VyLWNhcmQuYWN0aXZle2JvcmRlci1jb2xvcjp2YXIoLS1hY2NlbnQyKTtib3gtc2hhZG93OjAgMCAxNXB4IHJnYmEoMjU1LDYwLDYwLC4yKX0KLnRyYWNrZXItY2FyZC5pbmFjdGl2ZXtvcGFjaXR5Oi40fQoudGMtaWR7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjE4cHg7Zm9udC13ZWlnaHQ6OTAwO2NvbG9yOnZhcigtLWFjY2VudDIpfQoudGMtYW5nbGV7Zm9udC1mYW1pbHk6J09yYml0cm9uJyxtb25vc3BhY2U7Zm9udC1zaXplOjI0cHg7Zm9udC13ZWlnaHQ6OTAwO2NvbG9yOnZhcigtLWFjY2VudCl9Ci50Yy10aW1le2ZvbnQtc2l6ZTo4cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pO21hcmdpbi10b3A6NHB4fQoudGMtY29uZntmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLWFjY2VudDMpfQoudHJhY2tlci1zdGF0c3tkaXNwbGF5OmdyaWQ7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOnJlcGVhdCgzLDFmcik7Z2FwOjhweDttYXJnaW4tYm90dG9tOjEycHh9Ci5zdGF0LWNhcmR7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO3BhZGRpbmc6MTBweDt0ZXh0LWFsaWduOmNlbnRlcn0KLnN0YXQtdmFse2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToyMHB4O2NvbG9yOnZhcigtLWFjY2VudCl9Ci5zdGF0LWxibHtmb250LXNpemU6OHB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoxcHg7bWFyZ2luLXRvcDoycHh9Ci5zdGF0LWNhcmQuZGFuZ2VyIC5zdGF0LXZhbHtjb2xvcjp2YXIoLS1hY2NlbnQyKX0KLnN0YXQtY2FyZC53YXJuIC5zdGF0LXZhbHtjb2xvcjp2YXIoLS1hY2NlbnQzKX0KCi8qIExPRyAqLwoubG9nLXBhbmVse3BhZGRpbmc6NDBweCAwIDB9Ci5sb2ctaGVhZGVye3BhZGRpbmc6MCAxNnB4IDEycHg7ZGlzcGxheTpmbGV4O2p1c3RpZnktY29udGVudDpzcGFjZS1iZXR3ZWVuO2FsaWduLWl0ZW1zOmNlbnRlcjtib3JkZXItYm90dG9tOjFweCBzb2xpZCB2YXIoLS1kaW0pfQoubG9nLWNvdW50e2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToyMHB4O2NvbG9yOnZhcigtLWFjY2VudDIpfQoubG9nLWNvdW50LWxibHtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoycHg7ZGlzcGxheTpibG9ja30KLmxvZy1saXN0e21heC1oZWlnaHQ6MzAwcHg7b3ZlcmZsb3cteTphdXRvfQoubG9nLWVudHJ5e3BhZGRpbmc6MTBweCAxNnB4O2JvcmRlci1ib3R0b206MXB4IHNvbGlkIHJnYmEoMjYsMzcsNTMsLjUpO2Rpc3BsYXk6Z3JpZDtncmlkLXRlbXBsYXRlLWNvbHVtbnM6MWZyIGF1dG87Z2FwOjRweDthbmltYXRpb246c2xpZGVJbiAuM3MgZWFzZX0KQGtleWZyYW1lcyBzbGlkZUlue2Zyb217b3BhY2l0eTowO3RyYW5zZm9ybTp0cmFuc2xhdGVYKDhweCl9dG97b3BhY2l0eToxO3RyYW5zZm9ybTp0cmFuc2xhdGVYKDApfX0KLmxvZy1lbnRyeS5ndW5zaG90e2JvcmRlci1sZWZ0OjNweCBzb2xpZCB2YXIoLS1hY2NlbnQyKX0KLmxvZy10eXBle2ZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZToxMHB4O2xldHRlci1zcGFjaW5nOjJweDtjb2xvcjp2YXIoLS1hY2NlbnQyKX0KLmxvZy1kZXRhaWxze2ZvbnQtc2l6ZTo5cHg7Y29sb3I6dmFyKC0tdGV4dC1kaW0pO21hcmdpbi10b3A6MnB4fQoubG9nLXRpbWV7Zm9udC1zaXplOjlweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7dGV4dC1hbGlnbjpyaWdodH0KLmxvZy1hbmdsZXtmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXNpemU6MTFweDtjb2xvcjp2YXIoLS1hY2NlbnQzKX0KCi53cy1iYXJ7cG9zaXRpb246Zml4ZWQ7Ym90dG9tOjA7bGVmdDowO3JpZ2h0OjA7YmFja2dyb3VuZDp2YXIoLS1wYW5lbCk7Ym9yZGVyLXRvcDoxcHggc29saWQgdmFyKC0tYm9yZGVyKTtwYWRkaW5nOjhweCAxNnB4O2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjhweDtmb250LXNpemU6OXB4O2xldHRlci1zcGFjaW5nOjJweDtjb2xvcjp2YXIoLS10ZXh0LWRpbSk7ei1pbmRleDo5OTh9CgovKiBMZWFmbGV0IGRhcmsgb3ZlcnJpZGUgKi8KLmxlYWZsZXQtY29udGFpbmVye2JhY2tncm91bmQ6IzBkMTExNyFpbXBvcnRhbnR9Ci5sZWFmbGV0LXRpbGV7ZmlsdGVyOmludmVydCgxKSBodWUtcm90YXRlKDE4MGRlZykgYnJpZ2h0bmVzcygwLjcpIGNvbnRyYXN0KDEuMil9Cjwvc3R5bGU+CjwvaGVhZD4KPGJvZHk+Cgo8ZGl2IGlkPSJhbGFybS1vdmVybGF5Ij48L2Rpdj4KCjxoZWFkZXI+CiAgPGRpdiBjbGFzcz0ibG9nbyI+CiAgICA8ZGl2IGNsYXNzPSJsb2dvLWljb24iPjwvZGl2PgogICAgPGRpdj4KICAgICAgPGRpdiBjbGFzcz0ibG9nby10ZXh0Ij5BQ09VU1RJQyBTRU5USU5FTCA8c3BhbiBzdHlsZT0iY29sb3I6dmFyKC0tYWNjZW50Myk7Zm9udC1zaXplOjEwcHgiPnYzPC9zcGFuPjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJsb2dvLXN1YiI+RE9BIMK3IE1BUCDCtyBNVUxUSS1UUkFDSyDCtyBBTEFSTTwvZGl2PgogICAgPC9kaXY+CiAgPC9kaXY+CiAgPGRpdiBjbGFzcz0iaGRyLXJpZ2h0Ij4KICAgIDxkaXYgY2xhc3M9InN0YXR1cy1pdGVtIj48c3BhbiBjbGFzcz0ic3RhdHVzLXZhbCIgaWQ9Imhkci10aW1lIj4tLTotLTotLTwvc3Bhbj5VVEM8L2Rpdj4KICAgIDxkaXYgY2xhc3M9InN0YXR1cy1pdGVtIj48c3BhbiBjbGFzcz0ic3RhdHVzLXZhbCIgaWQ9Imhkci1ldmVudHMiPjA8L3NwYW4+U0hPVFM8L2Rpdj4KICAgIDxkaXYgaWQ9InN5c3RlbS1zdGF0dXMiPjxkaXYgY2xhc3M9ImRvdCIgaWQ9InN5cy1kb3QiPjwvZGl2PjxzcGFuIGlkPSJzeXMtbGFiZWwiPlNUQU5EQlk8L3NwYW4+PC9kaXY+CiAgPC9kaXY+CjwvaGVhZGVyPgoKPCEtLSBUQUJTIC0tPgo8ZGl2IGNsYXNzPSJ0YWJzIj4KICA8ZGl2IGNsYXNzPSJ0YWIgYWN0aXZlIiBvbmNsaWNrPSJzd2l0Y2hUYWIoJ2RvYScpIj7wn5OhIERPQTwvZGl2PgogIDxkaXYgY2xhc3M9InRhYiIgb25jbGljaz0ic3dpdGNoVGFiKCdtYXAnKSI+8J+XuiBNQVA8L2Rpdj4KICA8ZGl2IGNsYXNzPSJ0YWIiIG9uY2xpY2s9InN3aXRjaFRhYigndHJhY2tlcicpIj7wn46vIFRSQUNLRVI8L2Rpdj4KICA8ZGl2IGNsYXNzPSJ0YWIiIG9uY2xpY2s9InN3aXRjaFRhYignbG9nJykiPvCfk4sgTE9HPC9kaXY+CjwvZGl2PgoKPCEtLSDilZDilZDilZAgVEFCIDE6IERPQSDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi1kb2EiIGNsYXNzPSJ0YWItY29udGVudCBhY3RpdmUiPgogIDxkaXYgY2xhc3M9InBhbmVsIGRvYS1wYW5lbCI+CiAgICA8ZGl2IGNsYXNzPSJwYW5lbC1sYWJlbCI+PHNwYW4+MDE8L3NwYW4+IC8gUE9MQVIgRE9BPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJwb2xhci13cmFwIj48Y2FudmFzIGlkPSJwb2xhciIgd2lkdGg9IjMyMCIgaGVpZ2h0PSIzMjAiPjwvY2FudmFzPjwvZGl2PgogICAgPGRpdiBjbGFzcz0iZG9hLXJlYWRvdXQiPgogICAgICA8ZGl2IGNsYXNzPSJkb2EtYW5nbGUiIGlkPSJkb2EtYW5nbGUiPi0tLcKwPC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9ImRvYS1sYWJlbCI+RElSRUNUSU9OIE9GIEFSUklWQUw8L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idGRvYS1kaXNwbGF5Ij4KICAgICAgICA8ZGl2IGNsYXNzPSJ0ZG9hLWl0ZW0iPjxkaXYgY2xhc3M9InRkb2EtdmFsIiBpZD0idGRvYS12YWwiPjAuMDAwPC9kaXY+PGRpdiBjbGFzcz0idGRvYS1sYmwiPlRET0EgbXM8L2Rpdj48L2Rpdj4KICAgICAgICA8ZGl2IGNsYXNzPSJ0ZG9hLWl0ZW0iPjxkaXYgY2xhc3M9InRkb2EtdmFsIiBpZD0ic25yLXZhbCI+LS08L2Rpdj48ZGl2IGNsYXNzPSJ0ZG9hLWxibCI+U05SIGRCPC9kaXY+PC9kaXY+CiAgICAgICAgPGRpdiBjbGFzcz0idGRvYS1pdGVtIj48ZGl2IGNsYXNzPSJ0ZG9hLXZhbCIgaWQ9ImRpc3QtdmFsIj4wLjUwPC9kaXY+PGRpdiBjbGFzcz0idGRvYS1sYmwiPk1JQyBtPC9kaXY+PC9kaXY+CiAgICAgIDwvZGl2PgogICAgPC9kaXY+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9InBhbmVsIGRldGVjdC1wYW5lbCI+CiAgICA8ZGl2IGNsYXNzPSJwYW5lbC1sYWJlbCI+PHNwYW4+MDI8L3NwYW4+IC8gQ0xBU1NJRklDQVRJT048L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImRldGVjdC1zdGF0dXMiPgogICAgICA8ZGl2IGNsYXNzPSJkZXRlY3QtYmFkZ2UiIGlkPSJkZXRlY3QtYmFkZ2UiPk1PTklUT1JJTkc8L2Rpdj4KICAgICAgPGRpdiBzdHlsZT0idGV4dC1hbGlnbjpyaWdodDtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKSI+CiAgICAgICAgPGRpdj5MQVNUOiA8c3BhbiBpZD0ibGFzdC1kZXRlY3QiIHN0eWxlPSJjb2xvcjp2YXIoLS10ZXh0KSI+LS08L3NwYW4+PC9kaXY+CiAgICAgICAgPGRpdj5QRUFLOiA8c3BhbiBpZD0icGVhay1kYiIgc3R5bGU9ImNvbG9yOnZhcigtLWFjY2VudDMpIj4tLSBkQjwvc3Bhbj48L2Rpdj4KICAgICAgPC9kaXY+CiAgICA8L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImNvbmYtbGFiZWwiPkNPTkZJREVOQ0UgPHNwYW4gY2xhc3M9ImNvbmYtdmFsIiBpZD0iY29uZi1wY3QiPjAlPC9zcGFuPjwvZGl2PgogICAgPGRpdiBjbGFzcz0iY29uZmlkZW5jZS1iYXIiPjxkaXYgY2xhc3M9ImNvbmZpZGVuY2UtZmlsbCIgaWQ9ImNvbmYtZmlsbCI+PC9kaXY+PC9kaXY+CiAgICA8Y2FudmFzIGlkPSJ3YXZlZm9ybSIgd2lkdGg9IjM0MCIgaGVpZ2h0PSI2NSI+PC9jYW52YXM+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9InBhbmVsIG1pYy1wYW5lbCI+CiAgICA8ZGl2IGNsYXNzPSJwYW5lbC1sYWJlbCI+PHNwYW4+MDM8L3NwYW4+IC8gQVJSQVkgJiBDT05UUk9MUzwvZGl2PgogICAgPGRpdiBjbGFzcz0ibWljLWFycmF5Ij4KICAgICAgPGRpdiBjbGFzcz0ibWljLXVuaXQiIGlkPSJtaWMwIj48ZGl2IGNsYXNzPSJtaWMtbmFtZSI+TUlDIEE8L2Rpdj48ZGl2IGNsYXNzPSJtaWMtbGV2ZWwiIGlkPSJtaWMwLWx2bCI+LeKInjwvZGl2PjxkaXYgY2xhc3M9Im1pYy1iYXIiPjxkaXYgY2xhc3M9Im1pYy1iYXItZmlsbCIgaWQ9Im1pYzAtYmFyIj48L2Rpdj48L2Rpdj48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0ibWljLWFycm93Ij7in7c8L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0ibWljLXVuaXQiIGlkPSJtaWMxIj48ZGl2IGNsYXNzPSJtaWMtbmFtZSI+TUlDIEI8L2Rpdj48ZGl2IGNsYXNzPSJtaWMtbGV2ZWwiIGlkPSJtaWMxLWx2bCI+LeKInjwvZGl2PjxkaXYgY2xhc3M9Im1pYy1iYXIiPjxkaXYgY2xhc3M9Im1pYy1iYXItZmlsbCIgaWQ9Im1pYzEtYmFyIj48L2Rpdj48L2Rpdj48L2Rpdj4KICAgIDwvZGl2PgogICAgPGRpdiBjbGFzcz0ic3BhY2luZy1jb250cm9sIj5TUEFDSU5HIDxpbnB1dCB0eXBlPSJyYW5nZSIgaWQ9InNwYWNpbmctc2xpZGVyIiBtaW49IjAuMSIgbWF4PSIyLjAiIHN0ZXA9IjAuMDUiIHZhbHVlPSIwLjUiPiA8c3BhbiBjbGFzcz0ic3BhY2luZy12YWwiIGlkPSJzcGFjaW5nLXZhbCI+MC41MCBtPC9zcGFuPjwvZGl2PgogICAgPGJ1dHRvbiBjbGFzcz0iYnRuIiBpZD0ic3RhcnQtYnRuIiBvbmNsaWNrPSJ0b2dnbGVMaXN0ZW5pbmcoKSI+4pa2IFNUQVJUIExJU1RFTklORzwvYnV0dG9uPgogICAgPGJ1dHRvbiBjbGFzcz0iYnRuIHdhcm4iIGlkPSJhbGFybS1idG4iIG9uY2xpY2s9InRvZ2dsZUFsYXJtKCkiPvCflJQgQUxBUk06IE9GRjwvYnV0dG9uPgogICAgPGRpdiBjbGFzcz0ic2ltLXJvdyI+CiAgICAgIDxidXR0b24gY2xhc3M9ImJ0bi1zbSBidG4iIG9uY2xpY2s9InNpbUd1bnNob3QoNDUpIj5TSU0gNDXCsDwvYnV0dG9uPgogICAgICA8YnV0dG9uIGNsYXNzPSJidG4tc20gYnRuIiBvbmNsaWNrPSJzaW1HdW5zaG90KDkwKSI+U0lNIDkwwrA8L2J1dHRvbj4KICAgICAgPGJ1dHRvbiBjbGFzcz0iYnRuLXNtIGJ0biIgb25jbGljaz0ic2ltR3Vuc2hvdCgxMzUpIj5TSU0gMTM1wrA8L2J1dHRvbj4KICAgICAgPGJ1dHRvbiBjbGFzcz0iYnRuLXNtIGJ0biBkYW5nZXIiIG9uY2xpY2s9ImNsZWFyQWxsKCkiPkNMUjwvYnV0dG9uPgogICAgPC9kaXY+CiAgPC9kaXY+CjwvZGl2PgoKPCEtLSDilZDilZDilZAgVEFCIDI6IE1BUCDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi1tYXAiIGNsYXNzPSJ0YWItY29udGVudCI+CiAgPGRpdiBjbGFzcz0icGFuZWwgbWFwLXBhbmVsIj4KICAgIDxkaXYgY2xhc3M9InBhbmVsLWxhYmVsIj48c3Bhbj4wMjwvc3Bhbj4gLyBHVU5TSE9UIE1BUCA8c3BhbiBpZD0ibWFwLXNob3QtY291bnQiIGNsYXNzPSJzaG90LWNvdW50LWJhZGdlIj4wIFNIT1RTPC9zcGFuPjwvZGl2PgogICAgPGRpdiBpZD0ibWFwIj48L2Rpdj4KICAgIDxkaXYgY2xhc3M9Im1hcC1jb250cm9scyI+CiAgICAgIDxidXR0b24gY2xhc3M9Im1hcC1idG4gYWN0aXZlIiBpZD0ibWFwLWNlbnRlci1idG4iIG9uY2xpY2s9ImNlbnRlck1hcCgpIj7wn5ONIE1ZIExPQ0FUSU9OPC9idXR0b24+CiAgICAgIDxidXR0b24gY2xhc3M9Im1hcC1idG4iIG9uY2xpY2s9ImNsZWFyTWFwTWFya2VycygpIj7wn5eRIENMRUFSIFBJTlM8L2J1dHRvbj4KICAgICAgPGJ1dHRvbiBjbGFzcz0ibWFwLWJ0biIgb25jbGljaz0ic2ltR3Vuc2hvdChNYXRoLnJhbmRvbSgpKjE4MCkiPvCfkqUgU0lNIFNIT1Q8L2J1dHRvbj4KICAgIDwvZGl2PgogICAgPGRpdiBzdHlsZT0icGFkZGluZzowIDE2cHggMTJweDtmb250LXNpemU6OXB4O2NvbG9yOnZhcigtLXRleHQtZGltKTtsZXR0ZXItc3BhY2luZzoxcHgiPgogICAgICDimqAgTWFwIHBpbnMgc2hvdyBlc3RpbWF0ZWQgZGlyZWN0aW9uIGZyb20geW91ciBsb2NhdGlvbi4gRGlzdGFuY2UgaXMgYXBwcm94aW1hdGUgYmFzZWQgb24gc291bmQgbGV2ZWwuCiAgICA8L2Rpdj4KICA8L2Rpdj4KPC9kaXY+Cgo8IS0tIOKVkOKVkOKVkCBUQUIgMzogVFJBQ0tFUiDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi10cmFja2VyIiBjbGFzcz0idGFiLWNvbnRlbnQiPgogIDxkaXYgc3R5bGU9InBhZGRpbmc6MTZweCAxNnB4IDhweCI+CiAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLXN0YXRzIj4KICAgICAgPGRpdiBjbGFzcz0ic3RhdC1jYXJkIGRhbmdlciI+PGRpdiBjbGFzcz0ic3RhdC12YWwiIGlkPSJzdGF0LXRvdGFsIj4wPC9kaXY+PGRpdiBjbGFzcz0ic3RhdC1sYmwiPlRPVEFMIFNIT1RTPC9kaXY+PC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InN0YXQtY2FyZCB3YXJuIj48ZGl2IGNsYXNzPSJzdGF0LXZhbCIgaWQ9InN0YXQtbGFzdC1hbmdsZSI+LS08L2Rpdj48ZGl2IGNsYXNzPSJzdGF0LWxibCI+TEFTVCBBTkdMRTwvZGl2PjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJzdGF0LWNhcmQiPjxkaXYgY2xhc3M9InN0YXQtdmFsIiBpZD0ic3RhdC1hdmctY29uZiI+LS0lPC9kaXY+PGRpdiBjbGFzcz0ic3RhdC1sYmwiPkFWRyBDT05GPC9kaXY+PC9kaXY+CiAgICA8L2Rpdj4KICAgIDxkaXYgc3R5bGU9ImZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7bGV0dGVyLXNwYWNpbmc6M3B4O2NvbG9yOnZhcigtLXRleHQtZGltKTttYXJnaW4tYm90dG9tOjEwcHgiPlJFQ0VOVCBERVRFQ1RJT05TPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLWdyaWQiIGlkPSJ0cmFja2VyLWdyaWQiPgogICAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLWNhcmQgaW5hY3RpdmUiIGlkPSJ0Yy0wIj48ZGl2IGNsYXNzPSJ0Yy1pZCI+Iy0tPC9kaXY+PGRpdiBjbGFzcz0idGMtYW5nbGUiPi0tLcKwPC9kaXY+PGRpdiBjbGFzcz0idGMtY29uZiI+LS0lPC9kaXY+PGRpdiBjbGFzcz0idGMtdGltZSI+LS08L2Rpdj48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idHJhY2tlci1jYXJkIGluYWN0aXZlIiBpZD0idGMtMSI+PGRpdiBjbGFzcz0idGMtaWQiPiMtLTwvZGl2PjxkaXYgY2xhc3M9InRjLWFuZ2xlIj4tLS3CsDwvZGl2PjxkaXYgY2xhc3M9InRjLWNvbmYiPi0tJTwvZGl2PjxkaXYgY2xhc3M9InRjLXRpbWUiPi0tPC9kaXY+PC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InRyYWNrZXItY2FyZCBpbmFjdGl2ZSIgaWQ9InRjLTIiPjxkaXYgY2xhc3M9InRjLWlkIj4jLS08L2Rpdj48ZGl2IGNsYXNzPSJ0Yy1hbmdsZSI+LS0twrA8L2Rpdj48ZGl2IGNsYXNzPSJ0Yy1jb25mIj4tLSU8L2Rpdj48ZGl2IGNsYXNzPSJ0Yy10aW1lIj4tLTwvZGl2PjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJ0cmFja2VyLWNhcmQgaW5hY3RpdmUiIGlkPSJ0Yy0zIj48ZGl2IGNsYXNzPSJ0Yy1pZCI+Iy0tPC9kaXY+PGRpdiBjbGFzcz0idGMtYW5nbGUiPi0tLcKwPC9kaXY+PGRpdiBjbGFzcz0idGMtY29uZiI+LS0lPC9kaXY+PGRpdiBjbGFzcz0idGMtdGltZSI+LS08L2Rpdj48L2Rpdj4KICAgIDwvZGl2PgoKICAgIDxkaXYgc3R5bGU9ImZvbnQtZmFtaWx5OidPcmJpdHJvbicsbW9ub3NwYWNlO2ZvbnQtc2l6ZTo5cHg7bGV0dGVyLXNwYWNpbmc6M3B4O2NvbG9yOnZhcigtLXRleHQtZGltKTttYXJnaW4tYm90dG9tOjEwcHgiPkRJUkVDVElPTiBISVNUT0dSQU08L2Rpdj4KICAgIDxjYW52YXMgaWQ9Imhpc3RvZ3JhbSIgd2lkdGg9IjM0MCIgaGVpZ2h0PSIxMjAiIHN0eWxlPSJ3aWR0aDoxMDAlO2JvcmRlcjoxcHggc29saWQgdmFyKC0tZGltKTtib3JkZXItcmFkaXVzOjJweCI+PC9jYW52YXM+CiAgPC9kaXY+CjwvZGl2PgoKPCEtLSDilZDilZDilZAgVEFCIDQ6IExPRyDilZDilZDilZAgLS0+CjxkaXYgaWQ9InRhYi1sb2ciIGNsYXNzPSJ0YWItY29udGVudCI+CiAgPGRpdiBjbGFzcz0icGFuZWwgbG9nLXBhbmVsIj4KICAgIDxkaXYgY2xhc3M9InBhbmVsLWxhYmVsIj48c3Bhbj4wNDwvc3Bhbj4gLyBFVkVOVCBMT0c8L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImxvZy1oZWFkZXIiPgogICAgICA8ZGl2PjxzcGFuIGNsYXNzPSJsb2ctY291bnQtbGJsIj5UT1RBTCBERVRFQ1RJT05TPC9zcGFuPjxzcGFuIGNsYXNzPSJsb2ctY291bnQiIGlkPSJsb2ctY291bnQiPjA8L3NwYW4+PC9kaXY+CiAgICAgIDxidXR0b24gb25jbGljaz0iZXhwb3J0Q1NWKCkiIHN0eWxlPSJmb250LWZhbWlseTonT3JiaXRyb24nLG1vbm9zcGFjZTtmb250LXNpemU6OHB4O2xldHRlci1zcGFjaW5nOjJweDtwYWRkaW5nOjRweCAxMHB4O2JvcmRlcjoxcHggc29saWQgdmFyKC0tYWNjZW50KTtiYWNrZ3JvdW5kOnRyYW5zcGFyZW50O2NvbG9yOnZhcigtLWFjY2VudCk7Y3Vyc29yOnBvaW50ZXIiPuKshyBDU1Y8L2J1dHRvbj4KICAgIDwvZGl2PgogICAgPGRpdiBjbGFzcz0ibG9nLWxpc3QiIGlkPSJsb2ctbGlzdCI+PC9kaXY+CiAgPC9kaXY+CjwvZGl2PgoKPGRpdiBjbGFzcz0id3MtYmFyIj4KICA8ZGl2IGNsYXNzPSJkb3QiIGlkPSJ3cy1kb3QiPjwvZGl2PgogIDxzcGFuIGlkPSJ3cy1sYWJlbCI+Q09OTkVDVElORy4uLjwvc3Bhbj4KPC9kaXY+Cgo8c2NyaXB0PgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gU1RBVEUKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmNvbnN0IFNQRUVEPTM0MywgQVBJPXdpbmRvdy5sb2NhdGlvbi5vcmlnaW47CmNvbnN0IFdTX1VSTD0obG9jYXRpb24ucHJvdG9jb2w9PT0naHR0cHM6Jz8nd3NzOic6J3dzOicpKycvLycrbG9jYXRpb24uaG9zdCsnL3dzL2F1ZGlvJzsKY29uc3QgRVZFTlRTX1VSTD0obG9jYXRpb24ucHJvdG9jb2w9PT0naHR0cHM6Jz8nd3NzOic6J3dzOicpKycvLycrbG9jYXRpb24uaG9zdCsnL3dzL2V2ZW50cyc7CmxldCB3cywgZXZXcywgYXVkaW9DdHgsIGFuYWx5c2VyQSwgYW5hbHlzZXJCLCBzdHJlYW07CmxldCBpc0xpc3RlbmluZz1mYWxzZSwgYW5pbUZyYW1lLCBtaWNTcGFjaW5nPS41OwpsZXQgZG9hQW5nbGU9bnVsbCwgdGRvYU1zPTAsIGRldGVjdGluZz1mYWxzZSwgZGV0ZWN0VGltZW91dDsKbGV0IGV2ZW50Q291bnQ9MCwgbGFzdFBpbmc9RGF0ZS5ub3coKTsKY29uc3QgZG9hSGlzdG9yeT1bXSwgSElTVD04LCBwYXJ0aWNsZXM9W107CmxldCBhbGFybUVuYWJsZWQ9ZmFsc2UsIGFsYXJtQ3R4PW51bGw7CmxldCB1c2VyTGF0PW51bGwsIHVzZXJMbmc9bnVsbDsKbGV0IG1hcE9iaj1udWxsLCBtYXBNYXJrZXJzPVtdLCB1c2VyTWFya2VyPW51bGw7CmxldCBhbGxFdmVudHM9W107CmNvbnN0IGhpc3RvZ3JhbURhdGE9bmV3IEFycmF5KDE4KS5maWxsKDApOyAvLyAxOCBiaW5zIG9mIDEwwrAKCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBUQUJTCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkApmdW5jdGlvbiBzd2l0Y2hUYWIobmFtZSl7CiAgZG9jdW1lbnQucXVlcnlTZWxlY3RvckFsbCgnLnRhYicpLmZvckVhY2goKHQsaSk9PnsKICAgIGNvbnN0IG5hbWVzPVsnZG9hJywnbWFwJywndHJhY2tlcicsJ2xvZyddOwogICAgdC5jbGFzc0xpc3QudG9nZ2xlKCdhY3RpdmUnLCBuYW1lc1tpXT09PW5hbWUpOwogIH0pOwogIGRvY3VtZW50LnF1ZXJ5U2VsZWN0b3JBbGwoJy50YWItY29udGVudCcpLmZvckVhY2goYz0+Yy5jbGFzc0xpc3QucmVtb3ZlKCdhY3RpdmUnKSk7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3RhYi0nK25hbWUpLmNsYXNzTGlzdC5hZGQoJ2FjdGl2ZScpOwogIGlmKG5hbWU9PT0nbWFwJykgc2V0VGltZW91dCgoKT0+bWFwT2JqJiZtYXBPYmouaW52YWxpZGF0ZVNpemUoKSwxMDApOwogIGlmKG5hbWU9PT0ndHJhY2tlcicpIGRyYXdIaXN0b2dyYW0oKTsKfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIE1BUCBJTklUCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkApmdW5jdGlvbiBpbml0TWFwKCl7CiAgbWFwT2JqPUwubWFwKCdtYXAnLHt6b29tQ29udHJvbDp0cnVlfSkuc2V0VmlldyhbMCwwXSwyKTsKICBMLnRpbGVMYXllcignaHR0cHM6Ly97c30udGlsZS5vcGVuc3RyZWV0bWFwLm9yZy97en0ve3h9L3t5fS5wbmcnLHsKICAgIGF0dHJpYnV0aW9uOifCqSBPcGVuU3RyZWV0TWFwJyxtYXhab29tOjE5CiAgfSkuYWRkVG8obWFwT2JqKTsKICAvLyBHZXQgdXNlciBsb2NhdGlvbgogIGlmKG5hdmlnYXRvci5nZW9sb2NhdGlvbil7CiAgICBuYXZpZ2F0b3IuZ2VvbG9jYXRpb24uZ2V0Q3VycmVudFBvc2l0aW9uKHBvcz0+ewogICAgICB1c2VyTGF0PXBvcy5jb29yZHMubGF0aXR1ZGU7IHVzZXJMbmc9cG9zLmNvb3Jkcy5sb25naXR1ZGU7CiAgICAgIG1hcE9iai5zZXRWaWV3KFt1c2VyTGF0LHVzZXJMbmddLDE1KTsKICAgICAgdXNlck1hcmtlcj1MLmNpcmNsZU1hcmtlcihbdXNlckxhdCx1c2VyTG5nXSx7CiAgICAgICAgcmFkaXVzOjEwLGNvbG9yOicjMDBmZjg4JyxmaWxsQ29sb3I6JyMwMGZmODgnLGZpbGxPcGFjaXR5Oi44LHdlaWdodDoyCiAgICAgIH0pLmFkZFRvKG1hcE9iaikuYmluZFBvcHVwKCfwn5ONIFlPVVIgTE9DQVRJT04gKE1JQyBBUlJBWSknKTsKICAgIH0sKCk9Pnt9KTsKICB9Cn0KaW5pdE1hcCgpOwoKZnVuY3Rpb24gY2VudGVyTWFwKCl7CiAgaWYodXNlckxhdCYmdXNlckxuZykgbWFwT2JqLnNldFZpZXcoW3VzZXJMYXQsdXNlckxuZ10sMTUpOwp9CgpmdW5jdGlvbiBhZGRNYXBNYXJrZXIoYW5nbGUsIGNvbmZpZGVuY2UsIGV2ZW50SWQpewogIGlmKCF1c2VyTGF0fHwhdXNlckxuZykgcmV0dXJuOwogIC8vIEVzdGltYXRlIGRpc3RhbmNlIGZyb20gY29uZmlkZW5jZS9kYiAocm91Z2ggaGV1cmlzdGljOiAyMC01MDBtKQogIGNvbnN0IGRpc3QgPSA1MCArICgxLWNvbmZpZGVuY2UpKjIwMDsKICBjb25zdCByYWQ9KGFuZ2xlLTkwKSpNYXRoLlBJLzE4MDsgLy8gY29udmVydCB0byBtYXAgYmVhcmluZwogIGNvbnN0IGxhdE9mZj1kaXN0LzExMTAwMCpNYXRoLmNvcyhyYWQpOwogIGNvbnN0IGxuZ09mZj1kaXN0LygxMTEwMDAqTWF0aC5jb3ModXNlckxhdCpNYXRoLlBJLzE4MCkpKk1hdGguc2luKHJhZCk7CiAgY29uc3QgbGF0PXVzZXJMYXQrbGF0T2ZmLCBsbmc9dXNlckxuZytsbmdPZmY7CiAgY29uc3QgbWFya2VyPUwuY2lyY2xlTWFya2VyKFtsYXQsbG5nXSx7CiAgICByYWRpdXM6OCtjb25maWRlbmNlKjYsCiAgICBjb2xvcjonI2ZmM2MzYycsZmlsbENvbG9yOicjZmYzYzNjJywKICAgIGZpbGxPcGFjaXR5OjAuNitjb25maWRlbmNlKi4zLHdlaWdodDoyCiAgfSkuYWRkVG8obWFwT2JqKQogICAgLmJpbmRQb3B1cChg8J+SpSBTSE9UICMke2V2ZW50SWR9PGJyPkRpcmVjdGlvbjogJHtNYXRoLnJvdW5kKGFuZ2xlKX3CsDxicj5Db25maWRlbmNlOiAke01hdGgucm91bmQoY29uZmlkZW5jZSoxMDApfSVgKTsKICAvLyBEcmF3IGRpcmVjdGlvbiBsaW5lCiAgY29uc3QgbGluZT1MLnBvbHlsaW5lKFtbdXNlckxhdCx1c2VyTG5nXSxbbGF0LGxuZ11dLHsKICAgIGNvbG9yOidyZ2JhKDI1NSw2MCw2MCwwLjQpJyx3ZWlnaHQ6MSxkYXNoQXJyYXk6JzQsNicKICB9KS5hZGRUbyhtYXBPYmopOwogIG1hcE1hcmtlcnMucHVzaChtYXJrZXIsbGluZSk7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ21hcC1zaG90LWNvdW50JykudGV4dENvbnRlbnQ9bWFwTWFya2Vycy5maWx0ZXIoKF8saSk9PmklMj09PTApLmxlbmd0aCsnIFNIT1RTJzsKICBtYXBPYmoucGFuVG8oW2xhdCxsbmddKTsKfQoKZnVuY3Rpb24gY2xlYXJNYXBNYXJrZXJzKCl7CiAgbWFwTWFya2Vycy5mb3JFYWNoKG09Pm1hcE9iai5yZW1vdmVMYXllcihtKSk7CiAgbWFwTWFya2Vycz1bXTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbWFwLXNob3QtY291bnQnKS50ZXh0Q29udGVudD0nMCBTSE9UUyc7Cn0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBBTEFSTQovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKZnVuY3Rpb24gdG9nZ2xlQWxhcm0oKXsKICBhbGFybUVuYWJsZWQ9IWFsYXJtRW5hYmxlZDsKICBjb25zdCBidG49ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2FsYXJtLWJ0bicpOwogIGJ0bi50ZXh0Q29udGVudD1hbGFybUVuYWJsZWQ/J/CflJQgQUxBUk06IE9OJzon8J+UlCBBTEFSTTogT0ZGJzsKICBidG4uY2xhc3NMaXN0LnRvZ2dsZSgnb24nLGFsYXJtRW5hYmxlZCk7Cn0KCmZ1bmN0aW9uIHRyaWdnZXJBbGFybVNvdW5kKCl7CiAgaWYoIWFsYXJtRW5hYmxlZCkgcmV0dXJuOwogIHRyeXsKICAgIGlmKCFhbGFybUN0eCkgYWxhcm1DdHg9bmV3KHdpbmRvdy5BdWRpb0NvbnRleHR8fHdpbmRvdy53ZWJraXRBdWRpb0NvbnRleHQpKCk7CiAgICAvLyBUaHJlZSBzaGFycCBiZWVwcwogICAgWzAsLjMsLjZdLmZvckVhY2goZGVsYXk9PnsKICAgICAgY29uc3Qgb3NjPWFsYXJtQ3R4LmNyZWF0ZU9zY2lsbGF0b3IoKTsKICAgICAgY29uc3QgZ2Fpbj1hbGFybUN0eC5jcmVhdGVHYWluKCk7CiAgICAgIG9zYy5jb25uZWN0KGdhaW4pOyBnYWluLmNvbm5lY3QoYWxhcm1DdHguZGVzdGluYXRpb24pOwogICAgICBvc2MuZnJlcXVlbmN5LnZhbHVlPTg4MDsKICAgICAgb3NjLnR5cGU9J3NxdWFyZSc7CiAgICAgIGdhaW4uZ2Fpbi5zZXRWYWx1ZUF0VGltZSgwLGFsYXJtQ3R4LmN1cnJlbnRUaW1lK2RlbGF5KTsKICAgICAgZ2Fpbi5nYWluLmxpbmVhclJhbXBUb1ZhbHVlQXRUaW1lKC4zLGFsYXJtQ3R4LmN1cnJlbnRUaW1lK2RlbGF5Ky4wMik7CiAgICAgIGdhaW4uZ2Fpbi5saW5lYXJSYW1wVG9WYWx1ZUF0VGltZSgwLGFsYXJtQ3R4LmN1cnJlbnRUaW1lK2RlbGF5Ky4xOCk7CiAgICAgIG9zYy5zdGFydChhbGFybUN0eC5jdXJyZW50VGltZStkZWxheSk7CiAgICAgIG9zYy5zdG9wKGFsYXJtQ3R4LmN1cnJlbnRUaW1lK2RlbGF5Ky4yKTsKICAgIH0pOwogICAgLy8gRmxhc2ggb3ZlcmxheQogICAgY29uc3Qgb3ZlcmxheT1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnYWxhcm0tb3ZlcmxheScpOwogICAgb3ZlcmxheS5jbGFzc0xpc3QuYWRkKCdhY3RpdmUnKTsKICAgIHNldFRpbWVvdXQoKCk9Pm92ZXJsYXkuY2xhc3NMaXN0LnJlbW92ZSgnYWN0aXZlJyksMjAwMCk7CiAgfWNhdGNoKGUpe30KfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIFdFQlNPQ0tFVAovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKZnVuY3Rpb24gY29ubmVjdFdTKCl7CiAgd3M9bmV3IFdlYlNvY2tldChXU19VUkwpOwogIHdzLm9ub3Blbj0oKT0+e3NldCgnd3MtZG90JywnZG90IGFjdGl2ZScpO3NldCgnd3MtbGFiZWwnLCdXUzogQ09OTkVDVEVEJyl9OwogIHdzLm9uY2xvc2U9KCk9PntzZXQoJ3dzLWRvdCcsJ2RvdCcpO3NldCgnd3MtbGFiZWwnLCdXUzogUkVDT05ORUNUSU5HLi4uJyk7c2V0VGltZW91dChjb25uZWN0V1MsMzAwMCl9OwogIHdzLm9uZXJyb3I9KCk9PntzZXQoJ3dzLWRvdCcsJ2RvdCB3YXJuJyk7c2V0KCd3cy1sYWJlbCcsJ1dTOiBFUlJPUicpfTsKICB3cy5vbm1lc3NhZ2U9ZT0+ewogICAgY29uc3QgZD1KU09OLnBhcnNlKGUuZGF0YSk7CiAgICBpZihkLmRvYSE9bnVsbCl7ZG9hSGlzdG9yeS5wdXNoKGQuZG9hKTtpZihkb2FIaXN0b3J5Lmxlbmd0aD5ISVNUKWRvYUhpc3Rvcnkuc2hpZnQoKTtkb2FBbmdsZT1kb2FIaXN0b3J5LnJlZHVjZSgoYSxiKT0+YStiLDApL2RvYUhpc3RvcnkubGVuZ3RofQogICAgaWYoZC50ZG9hX21zIT1udWxsKXRkb2FNcz1kLnRkb2FfbXM7CiAgICBpZihkLnNuciE9bnVsbClkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc25yLXZhbCcpLnRleHRDb250ZW50PWQuc25yLnRvRml4ZWQoMSk7CiAgICBpZihkLmRiX2EhPW51bGwpe2RvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdwZWFrLWRiJykudGV4dENvbnRlbnQ9ZC5kYl9hLnRvRml4ZWQoMSkrJyBkQic7dXBkYXRlTWljQmFyKDAsZC5kYl9hKTt1cGRhdGVNaWNCYXIoMSxkLmRiX2IpfQogICAgdXBkYXRlQ29uZihkLmNvbmZpZGVuY2V8fDApOyB1cGRhdGVSZWFkb3V0KCk7CiAgICBpZihkLmlzX2d1bnNob3QpIHRyaWdnZXJEZXRlY3QoZG9hQW5nbGUsZC5jb25maWRlbmNlKTsKICB9Owp9CmNvbm5lY3RXUygpOwoKLy8gZGV0ZWN0aW9ucyBmcm9tIGV2ZXJ5IHNlbnNvciBhbmQgL2FwaS9zaW11bGF0ZSBhcnJpdmUgb24gdGhlIHZpZXdlciBmZWVkCmZ1bmN0aW9uIGNvbm5lY3RFdmVudHMoKXsKICBldldzPW5ldyBXZWJTb2NrZXQoRVZFTlRTX1VSTCk7CiAgZXZXcy5vbmNsb3NlPSgpPT5zZXRUaW1lb3V0KGNvbm5lY3RFdmVudHMsMzAwMCk7CiAgZXZXcy5vbm1lc3NhZ2U9ZT0+ewogICAgY29uc3QgZD1KU09OLnBhcnNlKGUuZGF0YSk7CiAgICBpZighYWRkRXZlbnQoZCkpcmV0dXJuOyAvLyBhbHJlYWR5IGxvZ2dlZCBmcm9tIG91ciBvd24gc2ltdWxhdGUgcmVwbHkKICAgIGRvYUFuZ2xlPWQuZG9hOyB0ZG9hTXM9ZC50ZG9hX21zOyB1cGRhdGVSZWFkb3V0KCk7CiAgICBpZighZGV0ZWN0aW5nKSB0cmlnZ2VyRGV0ZWN0KGQuZG9hLGQuY29uZmlkZW5jZSk7CiAgfTsKfQpjb25uZWN0RXZlbnRzKCk7CgpmdW5jdGlvbiBzZXQoaWQsY2xzKXtjb25zdCBlbD1kb2N1bWVudC5nZXRFbGVtZW50QnlJZChpZCk7aWYoZWwpZWwuY2xhc3NOYW1lPWNsc30Kc2V0SW50ZXJ2YWwoKCk9PmRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdoZHItdGltZScpLnRleHRDb250ZW50PW5ldyBEYXRlKCkudG9VVENTdHJpbmcoKS5zcGxpdCgnICcpWzRdLDEwMDApOwpkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3BhY2luZy1zbGlkZXInKS5hZGRFdmVudExpc3RlbmVyKCdpbnB1dCcsZnVuY3Rpb24oKXsKICBtaWNTcGFjaW5nPXBhcnNlRmxvYXQodGhpcy52YWx1ZSk7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3NwYWNpbmctdmFsJykudGV4dENvbnRlbnQ9bWljU3BhY2luZy50b0ZpeGVkKDIpKycgbSc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2Rpc3QtdmFsJykudGV4dENvbnRlbnQ9bWljU3BhY2luZy50b0ZpeGVkKDIpOwp9KTsKCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBBVURJTwovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKYXN5bmMgZnVuY3Rpb24gdG9nZ2xlTGlzdGVuaW5nKCl7aXNMaXN0ZW5pbmc/c3RvcExpc3RlbmluZygpOmF3YWl0IHN0YXJ0TGlzdGVuaW5nKCl9CmFzeW5jIGZ1bmN0aW9uIHN0YXJ0TGlzdGVuaW5nKCl7CiAgdHJ5ewogICAgYXVkaW9DdHg9bmV3KHdpbmRvdy5BdWRpb0NvbnRleHR8fHdpbmRvdy53ZWJraXRBdWRpb0NvbnRleHQpKHtzYW1wbGVSYXRlOjQ0MTAwfSk7CiAgICBzdHJlYW09YXdhaXQgbmF2aWdhdG9yLm1lZGlhRGV2aWNlcy5nZXRVc2VyTWVkaWEoe2F1ZGlvOntlY2hvQ2FuY2VsbGF0aW9uOmZhbHNlLG5vaXNlU3VwcHJlc3Npb246ZmFsc2UsYXV0b0dhaW5Db250cm9sOmZhbHNlfX0pOwogICAgY29uc3Qgc3JjPWF1ZGlvQ3R4LmNyZWF0ZU1lZGlhU3RyZWFtU291cmNlKHN0cmVhbSk7CiAgICBhbmFseXNlckE9YXVkaW9DdHguY3JlYXRlQW5hbHlzZXIoKTthbmFseXNlckEuZmZ0U2l6ZT0yMDQ4O2FuYWx5c2VyQS5zbW9vdGhpbmdUaW1lQ29uc3RhbnQ9LjI7CiAgICBhbmFseXNlckI9YXVkaW9DdHguY3JlYXRlQW5hbHlzZXIoKTthbmFseXNlckIuZmZ0U2l6ZT0yMDQ4O2FuYWx5c2VyQi5zbW9vdGhpbmdUaW1lQ29uc3RhbnQ9LjI7CiAgICBjb25zdCBkZWxheT1hdWRpb0N0eC5jcmVhdGVEZWxheSguMDUpOwogICAgc3JjLmNvbm5lY3QoYW5hbHlzZXJBKTtzcmMuY29ubmVjdChkZWxheSk7ZGVsYXkuY29ubmVjdChhbmFseXNlckIpOwogICAgaXNMaXN0ZW5pbmc9dHJ1ZTsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGFydC1idG4nKS50ZXh0Q29udGVudD0n4pagIFNUT1AgTElTVEVOSU5HJzsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGFydC1idG4nKS5jbGFzc0xpc3QuYWRkKCdhY3RpdmUnKTsKICAgIHNldCgnc3lzLWRvdCcsJ2RvdCBhY3RpdmUnKTtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3lzLWxhYmVsJykudGV4dENvbnRlbnQ9J01PTklUT1JJTkcnOwogICAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ21pYzAnKS5jbGFzc0xpc3QuYWRkKCdhY3RpdmUnKTtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbWljMScpLmNsYXNzTGlzdC5hZGQoJ2FjdGl2ZScpOwogICAgYXVkaW9Mb29wKCk7CiAgfWNhdGNoKGUpe2FsZXJ0KCdNaWMgYWNjZXNzIGRlbmllZC4gVXNlIFNJTSBidXR0b25zLicpfQp9CmZ1bmN0aW9uIHN0b3BMaXN0ZW5pbmcoKXsKICBpc0xpc3RlbmluZz1mYWxzZTtpZihhbmltRnJhbWUpY2FuY2VsQW5pbWF0aW9uRnJhbWUoYW5pbUZyYW1lKTsKICBzdHJlYW0/LmdldFRyYWNrcygpLmZvckVhY2godD0+dC5zdG9wKCkpO2F1ZGlvQ3R4Py5jbG9zZSgpOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGFydC1idG4nKS50ZXh0Q29udGVudD0n4pa2IFNUQVJUIExJU1RFTklORyc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3N0YXJ0LWJ0bicpLmNsYXNzTGlzdC5yZW1vdmUoJ2FjdGl2ZScpOwogIHNldCgnc3lzLWRvdCcsJ2RvdCcpO2RvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzeXMtbGFiZWwnKS50ZXh0Q29udGVudD0nU1RBTkRCWSc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ21pYzAnKS5jbGFzc0xpc3QucmVtb3ZlKCdhY3RpdmUnKTtkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbWljMScpLmNsYXNzTGlzdC5yZW1vdmUoJ2FjdGl2ZScpOwp9CmZ1bmN0aW9uIGF1ZGlvTG9vcCgpewogIGlmKCFpc0xpc3RlbmluZylyZXR1cm47CiAgYW5pbUZyYW1lPXJlcXVlc3RBbmltYXRpb25GcmFtZShhdWRpb0xvb3ApOwogIGNvbnN0IGRBPW5ldyBGbG9hdDMyQXJyYXkoMjA0OCksZEI9bmV3IEZsb2F0MzJBcnJheSgyMDQ4KTsKICBhbmFseXNlckEuZ2V0RmxvYXRUaW1lRG9tYWluRGF0YShkQSk7YW5hbHlzZXJCLmdldEZsb2F0VGltZURvbWFpbkRhdGEoZEIpOwogIGRyYXdXYXZlZm9ybShkQSk7CiAgaWYod3M/LnJlYWR5U3RhdGU9PT0xKXtsYXN0UGluZz1EYXRlLm5vdygpO3dzLnNlbmQoSlNPTi5zdHJpbmdpZnkoe21pY19hOkFycmF5LmZyb20oZEEpLG1pY19iOkFycmF5LmZyb20oZEIpLG1pY19zcGFjaW5nOm1pY1NwYWNpbmcsc2FtcGxlX3JhdGU6NDQxMDB9KSl9Cn0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBTSU1VTEFUSU9OCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAphc3luYyBmdW5jdGlvbiBzaW1HdW5zaG90KGFuZ2xlKXsKICB0cnl7CiAgICBjb25zdCByPWF3YWl0IGZldGNoKGAke0FQSX0vYXBpL3NpbXVsYXRlP2FuZ2xlPSR7YW5nbGV9Jm1pY19zcGFjaW5nPSR7bWljU3BhY2luZ31gLHttZXRob2Q6J1BPU1QnfSk7CiAgICBjb25zdCBkPWF3YWl0IHIuanNvbigpOwogICAgY29uc3Qgc2ltPW5ldyBGbG9hdDMyQXJyYXkoMjA0OCk7CiAgICBmb3IobGV0IGk9MDtpPDIwNDg7aSsrKXtzaW1baV09KE1hdGgucmFuZG9tKCktLjUpKi4wNDtpZihpPjQwMCYmaTw2MDApc2ltW2ldPShNYXRoLnJhbmRvbSgpLS41KSouODUqTWF0aC5leHAoLShpLTUwMCkvODApfQogICAgZHJhd1dhdmVmb3JtKHNpbSk7CiAgICBpZihhZGRFdmVudChkKSl7ZG9hQW5nbGU9ZC5kb2E7IHRkb2FNcz1kLnRkb2FfbXM7IHRyaWdnZXJEZXRlY3QoZC5kb2EsZC5jb25maWRlbmNlKTsgdXBkYXRlUmVhZG91dCgpfQogIH1jYXRjaChlKXsKICAgIGNvbnN0IGNvcz1NYXRoLmNvcyhhbmdsZSpNYXRoLlBJLzE4MCk7CiAgICBkb2FBbmdsZT1hbmdsZTsgdGRvYU1zPW1pY1NwYWNpbmcqY29zL1NQRUVEKjEwMDA7CiAgICB0cmlnZ2VyRGV0ZWN0KGFuZ2xlLC44OCk7IHVwZGF0ZVJlYWRvdXQoKTsKICAgIGFkZEV2ZW50KHtkb2E6YW5nbGUsdGRvYV9tczp0ZG9hTXMsY29uZmlkZW5jZTouODgsZGJfYTotMjIsdGltZXN0YW1wX2lzbzpuZXcgRGF0ZSgpLnRvVVRDU3RyaW5nKCkuc3BsaXQoJyAnKVs0XSxzaW11bGF0ZWQ6dHJ1ZX0pOwogIH0KfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIERFVEVDVElPTgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKZnVuY3Rpb24gdHJpZ2dlckRldGVjdChhbmdsZSxjb25mKXsKICBkZXRlY3Rpbmc9dHJ1ZTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnZGV0ZWN0LWJhZGdlJykuY2xhc3NOYW1lPSdkZXRlY3QtYmFkZ2UgZ3Vuc2hvdCc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2RldGVjdC1iYWRnZScpLnRleHRDb250ZW50PSfimqAgR1VOU0hPVCc7CiAgc2V0KCdzeXMtZG90JywnZG90IGFsZXJ0Jyk7IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzeXMtbGFiZWwnKS50ZXh0Q29udGVudD0nQUxFUlQnOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdsYXN0LWRldGVjdCcpLnRleHRDb250ZW50PW5ldyBEYXRlKCkudG9VVENTdHJpbmcoKS5zcGxpdCgnICcpWzRdOwogIHVwZGF0ZUNvbmYoY29uZik7CiAgdHJpZ2dlckFsYXJtU291bmQoKTsKICBjbGVhclRpbWVvdXQoZGV0ZWN0VGltZW91dCk7CiAgZGV0ZWN0VGltZW91dD1zZXRUaW1lb3V0KCgpPT57CiAgICBkZXRlY3Rpbmc9ZmFsc2U7CiAgICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnZGV0ZWN0LWJhZGdlJykuY2xhc3NOYW1lPWlzTGlzdGVuaW5nPydkZXRlY3QtYmFkZ2UgY2xlYXInOidkZXRlY3QtYmFkZ2UnOwogICAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2RldGVjdC1iYWRnZScpLnRleHRDb250ZW50PSdNT05JVE9SSU5HJzsKICAgIHNldCgnc3lzLWRvdCcsaXNMaXN0ZW5pbmc/J2RvdCBhY3RpdmUnOidkb3QnKTsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzeXMtbGFiZWwnKS50ZXh0Q29udGVudD1pc0xpc3RlbmluZz8nTU9OSVRPUklORyc6J1NUQU5EQlknOwogICAgdXBkYXRlQ29uZigwKTsKICB9LDQwMDApOwp9CgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gRVZFTlQgTUFOQUdFTUVOVAovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKZnVuY3Rpb24gYWRkRXZlbnQoZCl7CiAgaWYoZC5pZCE9bnVsbCYmYWxsRXZlbnRzLnNvbWUoZT0+ZS5pZD09PWQuaWQpKSByZXR1cm4gZmFsc2U7CiAgZXZlbnRDb3VudCsrOwogIGFsbEV2ZW50cy51bnNoaWZ0KGQpOwogIGlmKGFsbEV2ZW50cy5sZW5ndGg+MjAwKSBhbGxFdmVudHMucG9wKCk7CgogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdsb2ctY291bnQnKS50ZXh0Q29udGVudD1ldmVudENvdW50OwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdoZHItZXZlbnRzJykudGV4dENvbnRlbnQ9ZXZlbnRDb3VudDsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3RhdC10b3RhbCcpLnRleHRDb250ZW50PWV2ZW50Q291bnQ7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3N0YXQtbGFzdC1hbmdsZScpLnRleHRDb250ZW50PShkLmRvYSE9bnVsbD9NYXRoLnJvdW5kKGQuZG9hKSsnwrAnOictLScpOwoKICAvLyBBdmcgY29uZmlkZW5jZQogIGNvbnN0IGF2Z0NvbmY9YWxsRXZlbnRzLnJlZHVjZSgocyxlKT0+cysoZS5jb25maWRlbmNlfHwwKSwwKS9hbGxFdmVudHMubGVuZ3RoOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGF0LWF2Zy1jb25mJykudGV4dENvbnRlbnQ9TWF0aC5yb3VuZChhdmdDb25mKjEwMCkrJyUnOwoKICAvLyBIaXN0b2dyYW0KICBpZihkLmRvYSE9bnVsbCl7CiAgICBjb25zdCBiaW49TWF0aC5taW4oMTcsTWF0aC5mbG9vcihkLmRvYS8xMCkpOwogICAgaGlzdG9ncmFtRGF0YVtiaW5dKys7CiAgICBkcmF3SGlzdG9ncmFtKCk7CiAgfQoKICAvLyBUcmFja2VyIGNhcmRzIChzaG93IGxhc3QgNCkKICBjb25zdCByZWNlbnQ9YWxsRXZlbnRzLnNsaWNlKDAsNCk7CiAgcmVjZW50LmZvckVhY2goKGV2LGkpPT57CiAgICBjb25zdCBjYXJkPWRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd0Yy0nK2kpOwogICAgaWYoIWNhcmQpIHJldHVybjsKICAgIGNhcmQuY2xhc3NOYW1lPSd0cmFja2VyLWNhcmQgYWN0aXZlJzsKICAgIGNhcmQuaW5uZXJIVE1MPWA8ZGl2IGNsYXNzPSJ0Yy1pZCI+IyR7ZXZlbnRDb3VudC1pfTwvZGl2PjxkaXYgY2xhc3M9InRjLWFuZ2xlIj4ke2V2LmRvYSE9bnVsbD9NYXRoLnJvdW5kKGV2LmRvYSkrJ8KwJzonLS0nfTwvZGl2PjxkaXYgY2xhc3M9InRjLWNvbmYiPiR7TWF0aC5yb3VuZCgoZXYuY29uZmlkZW5jZXx8MCkqMTAwKX0lPC9kaXY+PGRpdiBjbGFzcz0idGMtdGltZSI+JHtldi50aW1lc3RhbXBfaXNvfHwnLS0nfTwvZGl2PmA7CiAgICBzZXRUaW1lb3V0KCgpPT5jYXJkLmNsYXNzTGlzdC5yZW1vdmUoJ2FjdGl2ZScpLDMwMDApOwogIH0pOwogIGZvcihsZXQgaT1yZWNlbnQubGVuZ3RoO2k8NDtpKyspIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd0Yy0nK2kpLmNsYXNzTmFtZT0ndHJhY2tlci1jYXJkIGluYWN0aXZlJzsKCiAgLy8gTWFwIHBpbgogIGlmKGQuZG9hIT1udWxsKSBhZGRNYXBNYXJrZXIoZC5kb2EsIGQuY29uZmlkZW5jZXx8MC41LCBldmVudENvdW50KTsKCiAgLy8gTG9nIGVudHJ5CiAgY29uc3QgbGlzdD1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbG9nLWxpc3QnKSwgZT1kb2N1bWVudC5jcmVhdGVFbGVtZW50KCdkaXYnKTsKICBlLmNsYXNzTmFtZT0nbG9nLWVudHJ5IGd1bnNob3QnOwogIGUuaW5uZXJIVE1MPWA8ZGl2PjxkaXYgY2xhc3M9ImxvZy10eXBlIj5HVU5TSE9UJHtkLnNpbXVsYXRlZD8nIFtTSU1dJzonJ308L2Rpdj48ZGl2IGNsYXNzPSJsb2ctZGV0YWlscyI+Q09ORjoke01hdGgucm91bmQoKGQuY29uZmlkZW5jZXx8MCkqMTAwKX0lIMK3IFRET0E6JHsoZC50ZG9hX21zfHwwKS50b0ZpeGVkKDMpfW1zIMK3ICR7ZC5kYl9hIT1udWxsP2QuZGJfYS50b0ZpeGVkKDEpKycgZEInOicnfTwvZGl2PjwvZGl2PjxkaXY+PGRpdiBjbGFzcz0ibG9nLWFuZ2xlIj4ke2QuZG9hIT1udWxsP01hdGgucm91bmQoZC5kb2EpKyfCsCc6Jy0tJ308L2Rpdj48ZGl2IGNsYXNzPSJsb2ctdGltZSI+JHtkLnRpbWVzdGFtcF9pc298fCctLSd9PC9kaXY+PC9kaXY+YDsKICBsaXN0LnByZXBlbmQoZSk7CiAgcmV0dXJuIHRydWU7Cn0KCmZ1bmN0aW9uIGNsZWFyQWxsKCl7CiAgZmV0Y2goYCR7QVBJfS9hcGkvZXZlbnRzYCx7bWV0aG9kOidERUxFVEUnfSkuY2F0Y2goKCk9Pnt9KTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbG9nLWxpc3QnKS5pbm5lckhUTUw9Jyc7CiAgZXZlbnRDb3VudD0wOyBhbGxFdmVudHM9W107CiAgaGlzdG9ncmFtRGF0YS5maWxsKDApOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdsb2ctY291bnQnKS50ZXh0Q29udGVudD0nMCc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2hkci1ldmVudHMnKS50ZXh0Q29udGVudD0nMCc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3N0YXQtdG90YWwnKS50ZXh0Q29udGVudD0nMCc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3N0YXQtbGFzdC1hbmdsZScpLnRleHRDb250ZW50PSctLSc7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3N0YXQtYXZnLWNvbmYnKS50ZXh0Q29udGVudD0nLS0lJzsKICBmb3IobGV0IGk9MDtpPDQ7aSsrKXtjb25zdCBjPWRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd0Yy0nK2kpO2lmKGMpe2MuY2xhc3NOYW1lPSd0cmFja2VyLWNhcmQgaW5hY3RpdmUnO2MuaW5uZXJIVE1MPSc8ZGl2IGNsYXNzPSJ0Yy1pZCI+Iy0tPC9kaXY+PGRpdiBjbGFzcz0idGMtYW5nbGUiPi0tLcKwPC9kaXY+PGRpdiBjbGFzcz0idGMtY29uZiI+LS0lPC9kaXY+PGRpdiBjbGFzcz0idGMtdGltZSI+LS08L2Rpdj4nfX0KICBjbGVhck1hcE1hcmtlcnMoKTsKICBkcmF3SGlzdG9ncmFtKCk7Cn0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBDU1YgRVhQT1JUCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkApmdW5jdGlvbiBleHBvcnRDU1YoKXsKICBjb25zdCByb3dzPVtbJ0lEJywnVGltZScsJ0RPQSAoZGVnKScsJ1RET0EgKG1zKScsJ0NvbmZpZGVuY2UnLCdQZWFrIGRCJywnU2ltdWxhdGVkJ11dOwogIGFsbEV2ZW50cy5mb3JFYWNoKChlLGkpPT5yb3dzLnB1c2goW2FsbEV2ZW50cy5sZW5ndGgtaSxlLnRpbWVzdGFtcF9pc298fCcnLGUuZG9hIT1udWxsP2UuZG9hLnRvRml4ZWQoMSk6JycsZS50ZG9hX21zIT1udWxsP2UudGRvYV9tcy50b0ZpeGVkKDQpOicnLGUuY29uZmlkZW5jZSE9bnVsbD9lLmNvbmZpZGVuY2UudG9GaXhlZCgzKTonJyxlLmRiX2EhPW51bGw/ZS5kYl9hLnRvRml4ZWQoMSk6JycsZS5zaW11bGF0ZWQ/J3llcyc6J25vJ10pKTsKICBjb25zdCBjc3Y9cm93cy5tYXAocj0+ci5qb2luKCcsJykpLmpvaW4oJ1xuJyk7CiAgY29uc3QgYT1kb2N1bWVudC5jcmVhdGVFbGVtZW50KCdhJyk7CiAgYS5ocmVmPSdkYXRhOnRleHQvY3N2O2NoYXJzZXQ9dXRmLTgsJytlbmNvZGVVUklDb21wb25lbnQoY3N2KTsKICBhLmRvd25sb2FkPSdhY291c3RpY19zZW50aW5lbF9sb2cuY3N2JzsgYS5jbGljaygpOwp9CgovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKLy8gVUkgSEVMUEVSUwovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKZnVuY3Rpb24gdXBkYXRlQ29uZih2KXtjb25zdCBwPU1hdGgucm91bmQodioxMDApO2RvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdjb25mLWZpbGwnKS5zdHlsZS53aWR0aD1wKyclJztkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnY29uZi1wY3QnKS50ZXh0Q29udGVudD1wKyclJ30KZnVuY3Rpb24gdXBkYXRlTWljQmFyKGksZGIpe2RvY3VtZW50LmdldEVsZW1lbnRCeUlkKGBtaWMke2l9LWx2bGApLnRleHRDb250ZW50PWlzRmluaXRlKGRiKT9kYi50b0ZpeGVkKDEpOict4oieJztkb2N1bWVudC5nZXRFbGVtZW50QnlJZChgbWljJHtpfS1iYXJgKS5zdHlsZS53aWR0aD1NYXRoLm1heCgwLE1hdGgubWluKDEwMCwoZGIrNjApKjEuNSkpKyclJ30KZnVuY3Rpb24gdXBkYXRlUmVhZG91dCgpe2RvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdkb2EtYW5nbGUnKS50ZXh0Q29udGVudD1kb2FBbmdsZSE9PW51bGw/TWF0aC5yb3VuZChkb2FBbmdsZSkrJ8KwJzonLS0twrAnO2RvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd0ZG9hLXZhbCcpLnRleHRDb250ZW50PXRkb2FNcy50b0ZpeGVkKDMpfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIEhJU1RPR1JBTQovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKZnVuY3Rpb24gZHJhd0hpc3RvZ3JhbSgpewogIGNvbnN0IGNhbnZhcz1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnaGlzdG9ncmFtJyk7CiAgaWYoIWNhbnZhcykgcmV0dXJuOwogIGNvbnN0IFc9Y2FudmFzLm9mZnNldFdpZHRofHwzNDAsIEg9MTIwOwogIGNhbnZhcy53aWR0aD1XOwogIGNvbnN0IGN0eD1jYW52YXMuZ2V0Q29udGV4dCgnMmQnKTsKICBjdHguZmlsbFN0eWxlPScjMDgwYjBmJzsgY3R4LmZpbGxSZWN0KDAsMCxXLEgpOwogIGNvbnN0IG1heFZhbD1NYXRoLm1heCguLi5oaXN0b2dyYW1EYXRhLDEpOwogIGNvbnN0IGJ3PVcvMTg7CiAgaGlzdG9ncmFtRGF0YS5mb3JFYWNoKCh2LGkpPT57CiAgICBjb25zdCBiaD0odi9tYXhWYWwpKihILTIwKTsKICAgIGNvbnN0IHg9aSpidywgeT1ILWJoLTE1OwogICAgY29uc3QgZ3JhZD1jdHguY3JlYXRlTGluZWFyR3JhZGllbnQoMCx5LDAsSC0xNSk7CiAgICBncmFkLmFkZENvbG9yU3RvcCgwLCcjZmYzYzNjJyk7IGdyYWQuYWRkQ29sb3JTdG9wKDEsJ3JnYmEoMjU1LDYwLDYwLDAuMiknKTsKICAgIGN0eC5maWxsU3R5bGU9dj4wP2dyYWQ6J3JnYmEoMjYsMzcsNTMsMC41KSc7CiAgICBjdHguZmlsbFJlY3QoeCsxLHksYnctMixiaCk7CiAgICBjdHguZmlsbFN0eWxlPSdyZ2JhKDc0LDk2LDExMiwwLjgpJzsKICAgIGN0eC5mb250PSc3cHggU2hhcmUgVGVjaCBNb25vJzsKICAgIGN0eC50ZXh0QWxpZ249J2NlbnRlcic7CiAgICBjdHguZmlsbFRleHQoKGkqMTApKyfCsCcseCtidy8yLEgtMyk7CiAgfSk7CiAgY3R4LnN0cm9rZVN0eWxlPSdyZ2JhKDI2LDM3LDUzLDAuOCknOyBjdHgubGluZVdpZHRoPTAuNTsKICBjdHguYmVnaW5QYXRoKCk7IGN0eC5tb3ZlVG8oMCxILTE1KTsgY3R4LmxpbmVUbyhXLEgtMTUpOyBjdHguc3Ryb2tlKCk7Cn0KCi8vIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAovLyBXQVZFRk9STQovLyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKY29uc3Qgd0M9ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3dhdmVmb3JtJyksd1g9d0MuZ2V0Q29udGV4dCgnMmQnKTsKZnVuY3Rpb24gZHJhd1dhdmVmb3JtKGRhdGEpewogIGNvbnN0IFc9d0Mub2Zmc2V0V2lkdGh8fDM0MCxIPTY1OyB3Qy53aWR0aD1XOwogIHdYLmZpbGxTdHlsZT0nIzA4MGIwZic7IHdYLmZpbGxSZWN0KDAsMCxXLEgpOwogIHdYLmJlZ2luUGF0aCgpOyB3WC5zdHJva2VTdHlsZT1kZXRlY3Rpbmc/JyNmZjNjM2MnOicjMDBmZjg4Jzsgd1gubGluZVdpZHRoPTE7CiAgd1guc2hhZG93Qmx1cj1kZXRlY3Rpbmc/ODo0OyB3WC5zaGFkb3dDb2xvcj1kZXRlY3Rpbmc/JyNmZjNjM2MnOicjMDBmZjg4JzsKICBjb25zdCBzdGVwPU1hdGguZmxvb3IoZGF0YS5sZW5ndGgvVyk7CiAgZm9yKGxldCBpPTA7aTxXO2krKyl7Y29uc3QgeT1ILzIrKGRhdGFbaSpzdGVwXXx8MCkqMjg7aT09PTA/d1gubW92ZVRvKGkseSk6d1gubGluZVRvKGkseSl9CiAgd1guc3Ryb2tlKCk7IHdYLnNoYWRvd0JsdXI9MDsKICB3WC5iZWdpblBhdGgoKTsgd1guc3Ryb2tlU3R5bGU9J3JnYmEoMjYsMzcsNTMsLjgpJzsgd1gubGluZVdpZHRoPS41OyB3WC5tb3ZlVG8oMCxILzIpOyB3WC5saW5lVG8oVyxILzIpOyB3WC5zdHJva2UoKTsKfQoKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCi8vIFBPTEFSIFBMT1QKLy8g4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCmNvbnN0IHBDPWRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdwb2xhcicpLHBYPXBDLmdldENvbnRleHQoJzJkJyk7CmZ1bmN0aW9uIHN6KCl7cmV0dXJuIHBDLm9mZnNldFdpZHRofHwzMjB9CmZ1bmN0aW9uIGRyYXdHcmlkKCl7CiAgY29uc3QgUz1zeigpLGN4PVMvMixjeT1TLzIscj1TLzItMjI7CiAgcFguY2xlYXJSZWN0KDAsMCxTLFMpOyBwQy53aWR0aD1TOyBwQy5oZWlnaHQ9UzsKICBwWC5maWxsU3R5bGU9J3JnYmEoOCwxMSwxNSwuOTUpJzsgcFguZmlsbFJlY3QoMCwwLFMsUyk7CiAgZm9yKGxldCBpPTE7aTw9NDtpKyspe3BYLmJlZ2luUGF0aCgpO3BYLmFyYyhjeCxjeSxyKmkvNCwwLE1hdGguUEkqMik7cFguc3Ryb2tlU3R5bGU9YHJnYmEoMjYsMzcsNTMsJHtpPT09ND8uODouNH0pYDtwWC5saW5lV2lkdGg9aT09PTQ/MS41Oi41O3BYLnN0cm9rZSgpfQogIGZvcihsZXQgYT0wO2E8MzYwO2ErPTMwKXsKICAgIGNvbnN0IHJhZD0oYS05MCkqTWF0aC5QSS8xODA7CiAgICBwWC5iZWdpblBhdGgoKTtwWC5tb3ZlVG8oY3gsY3kpO3BYLmxpbmVUbyhjeCtyKk1hdGguY29zKHJhZCksY3krcipNYXRoLnNpbihyYWQpKTtwWC5zdHJva2VTdHlsZT0ncmdiYSgyNiwzNyw1MywuNiknO3BYLmxpbmVXaWR0aD0uNTtwWC5zdHJva2UoKTsKICAgIHBYLmZpbGxTdHlsZT0ncmdiYSg3NCw5NiwxMTIsLjgpJztwWC5mb250PWAke01hdGgubWF4KDcsUy80OCl9cHggU2hhcmUgVGVjaCBNb25vYDtwWC50ZXh0QWxpZ249J2NlbnRlcic7cFgudGV4dEJhc2VsaW5lPSdtaWRkbGUnOwogICAgcFguZmlsbFRleHQoYSsnwrAnLGN4KyhyKzEzKSpNYXRoLmNvcyhyYWQpLGN5KyhyKzEzKSpNYXRoLnNpbihyYWQpKTsKICB9Cn0KZnVuY3Rpb24gcmVuZGVyUG9sYXIoKXsKICBjb25zdCBTPXN6KCksY3g9Uy8yLGN5PVMvMixyPVMvMi0yMjsKICBkcmF3R3JpZCgpOwogIGNvbnN0IG5vdz1EYXRlLm5vdygpLzEwMDAsIHN3ZWVwPShub3cqLjQlMSkqTWF0aC5QSSoyLU1hdGguUEkvMjsKICBwWC5zYXZlKCk7cFguZ2xvYmFsQWxwaGE9LjEyO3BYLmJlZ2luUGF0aCgpO3BYLm1vdmVUbyhjeCxjeSk7cFguYXJjKGN4LGN5LHIsc3dlZXAtLjgsc3dlZXApO3BYLmNsb3NlUGF0aCgpO3BYLmZpbGxTdHlsZT0ncmdiYSgwLDI1NSwxMzYsLjMpJztwWC5maWxsKCk7cFgucmVzdG9yZSgpOwogIHBYLnNhdmUoKTtwWC5nbG9iYWxBbHBoYT0uNTtwWC5iZWdpblBhdGgoKTtwWC5tb3ZlVG8oY3gsY3kpO3BYLmxpbmVUbyhjeCtyKk1hdGguY29zKHN3ZWVwKSxjeStyKk1hdGguc2luKHN3ZWVwKSk7cFguc3Ryb2tlU3R5bGU9JyMwMGZmODgnO3BYLmxpbmVXaWR0aD0xO3BYLnN0cm9rZSgpO3BYLnJlc3RvcmUoKTsKCiAgLy8gRHJhdyBhbGwgcmVjZW50IHNob3RzIGFzIGZhZGluZyBsaW5lcwogIGFsbEV2ZW50cy5zbGljZSgwLDYpLmZvckVhY2goKGV2LGkpPT57CiAgICBpZihldi5kb2E9PW51bGwpIHJldHVybjsKICAgIGNvbnN0IHJhZD1ldi5kb2EqTWF0aC5QSS8xODAtTWF0aC5QSS8yOwogICAgY29uc3QgYWxwaGE9TWF0aC5tYXgoMC4xLCg2LWkpLzYqMC40KTsKICAgIHBYLmJlZ2luUGF0aCgpO3BYLm1vdmVUbyhjeCxjeSk7cFgubGluZVRvKGN4K3IqTWF0aC5jb3MocmFkKSxjeStyKk1hdGguc2luKHJhZCkpOwogICAgcFguc3Ryb2tlU3R5bGU9YHJnYmEoMjU1LDYwLDYwLCR7YWxwaGF9KWA7cFgubGluZVdpZHRoPTE7cFguc3Ryb2tlKCk7CiAgfSk7CgogIGZvcihsZXQgaT1wYXJ0aWNsZXMubGVuZ3RoLTE7aT49MDtpLS0pewogICAgY29uc3QgcD1wYXJ0aWNsZXNbaV07cC5yYWRpdXMrPTIuNTtwLmxpZmUtPS4wMjU7CiAgICBpZihwLmxpZmU8PTApe3BhcnRpY2xlcy5zcGxpY2UoaSwxKTtjb250aW51ZX0KICAgIHBYLmJlZ2luUGF0aCgpO3BYLmFyYyhjeCtwLnJhZGl1cypNYXRoLmNvcyhwLmFuZ2xlK3Auc3ByZWFkKSxjeStwLnJhZGl1cypNYXRoLnNpbihwLmFuZ2xlK3Auc3ByZWFkKSwyLDAsTWF0aC5QSSoyKTsKICAgIHBYLmZpbGxTdHlsZT1gcmdiYSgyNTUsNjAsNjAsJHtwLmxpZmUqLjh9KWA7cFguZmlsbCgpOwogIH0KCiAgaWYoZG9hQW5nbGUhPT1udWxsKXsKICAgIGNvbnN0IHJhZD1kb2FBbmdsZSpNYXRoLlBJLzE4MC1NYXRoLlBJLzI7CiAgICBjb25zdCBnPXBYLmNyZWF0ZUxpbmVhckdyYWRpZW50KGN4LGN5LGN4K3IqTWF0aC5jb3MocmFkKSxjeStyKk1hdGguc2luKHJhZCkpOwogICAgZy5hZGRDb2xvclN0b3AoMCwncmdiYSgyNTUsNjAsNjAsMCknKTtnLmFkZENvbG9yU3RvcCgxLGRldGVjdGluZz8ncmdiYSgyNTUsNjAsNjAsLjk1KSc6J3JnYmEoMCwyNTUsMTM2LC43NSknKTsKICAgIHBYLmJlZ2luUGF0aCgpO3BYLm1vdmVUbyhjeCxjeSk7cFgubGluZVRvKGN4K3IqTWF0aC5jb3MocmFkKSxjeStyKk1hdGguc2luKHJhZCkpOwogICAgcFguc3Ryb2tlU3R5bGU9ZztwWC5saW5lV2lkdGg9ZGV0ZWN0aW5nPzM6MS41O3BYLnN0cm9rZSgpOwogICAgY29uc3Qgc3A9MTUqTWF0aC5QSS8xODA7CiAgICBwWC5iZWdpblBhdGgoKTtwWC5tb3ZlVG8oY3gsY3kpO3BYLmFyYyhjeCxjeSxyLHJhZC1zcCxyYWQrc3ApO3BYLmNsb3NlUGF0aCgpOwogICAgcFguZmlsbFN0eWxlPWRldGVjdGluZz8ncmdiYSgyNTUsNjAsNjAsLjA3KSc6J3JnYmEoMCwyNTUsMTM2LC4wNCknO3BYLmZpbGwoKTsKICAgIHBYLmJlZ2luUGF0aCgpO3BYLmFyYyhjeCtyKk1hdGguY29zKHJhZCksY3krcipNYXRoLnNpbihyYWQpLGRldGVjdGluZz82OjQsMCxNYXRoLlBJKjIpOwogICAgcFguZmlsbFN0eWxlPWRldGVjdGluZz8nI2ZmM2MzYyc6JyMwMGZmODgnO3BYLmZpbGwoKTsKICAgIGlmKGRldGVjdGluZylmb3IobGV0IGk9MDtpPDM7aSsrKXBhcnRpY2xlcy5wdXNoKHthbmdsZTpyYWQscmFkaXVzOjAsbGlmZToxLHNwcmVhZDooTWF0aC5yYW5kb20oKS0uNSkqLjM1fSk7CiAgfQogIHJlcXVlc3RBbmltYXRpb25GcmFtZShyZW5kZXJQb2xhcik7Cn0KcmVuZGVyUG9sYXIoKTsKZHJhd0hpc3RvZ3JhbSgpOwo8L3NjcmlwdD4KPC9ib2R5Pgo8L2h0bWw+Cg==").decode("utf-8")
 
 @app.get("/", response_class=HTMLResponse)
 async def root(): return HTML
 
 @app.get("/api/health")
-async def health(): return {"status": "ok", "version": "3.0", "uptime": time.time()}
+async def health(): return {"status": "ok", "version": "3.0", "uptime": round(time.time() - metrics.started, 1),
+                             "frames": metrics.counters["frames"], "frames_gated": metrics.counters["frames_gated"]}
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(metrics.render({
+        "sensors_connected": len(lanes), "viewers_connected": len(manager.active),
+        "lane_depth": sum(len(l.items) for l in lanes), "dsp_queue_depth": len(dsp.pending),
+        "viewer_queue_depth": sum(len(s.queue) for s in manager.active), "event_last_id": store.last_id(),
+        "uptime_seconds": round(time.time() - metrics.started, 1)}), media_type="text/plain; version=0.0.4")
+
+profiler = None   # the one running SamplingProfiler, if any
+
+async def profile(seconds: float = 5.0, hz: int = 100):
+    """Sample every thread for ``seconds``; returns collapsed stacks for flamegraph tools."""
+    global profiler
+    if profiler is not None: raise HTTPException(409, "a profile is already running")
+    profiler = SamplingProfiler(max(1, min(hz, 1000)))
+    profiler.start()
+    try: await asyncio.sleep(max(0.1, min(seconds, PROFILE_MAX_SECONDS)))
+    finally: out = profiler.stop(); profiler = None
+    return out
+
+if PROFILE_ENABLED: app.get("/api/profile", response_class=PlainTextResponse)(profile)
 
 @app.get("/api/events")
-async def get_events(): return {"events": events, "count": len(events)}
+def get_events(since_id: int | None = None, cursor: int | None = None,
+               start: float | None = None, end: float | None = None,
+               doa_min: float | None = None, doa_max: float | None = None,
+               min_confidence: float | None = None, limit: int = 100):
+    # a plain def: FastAPI runs it in the threadpool, so a deep page never stalls the sensor loop
+    page, nxt = store.query(since_id, cursor, start, end, doa_min, doa_max, min_confidence, limit)
+    return {"events": page, "count": len(page), "last_id": store.last_id(), "next_cursor": nxt}
 
 @app.delete("/api/events")
-async def clear_events(): events.clear(); return {"status": "cleared"}
+async def clear_events():
+    store.clear(); await state.publish({"type": "clear"})
+    return {"status": "cleared"}
+
+def _archive_path(p):
+    root = os.path.realpath(ARCHIVE_DIR)
+    full = os.path.realpath(os.path.join(root, p))
+    if os.path.commonpath([root, full]) != root or not os.path.isfile(full):
+        raise HTTPException(404, f"no recording {p!r} in archive")
+    return full
+
+@app.post("/api/analyze")
+async def analyze(path: list[str] = Query([]), file: UploadFile | None = File(None),
+                  mic_spacing: float = Query(0.5, gt=0), frame: int = Query(2048, gt=0),
+                  hop: int | None = Query(None, gt=0), start: float | None = None,
+                  sample_rate: int | None = Query(None, gt=0), channels: int | None = Query(None, gt=0),
+                  dtype: str | None = None):
+    """Analyse archive recordings (``path``, relative to ARCHIVE_DIR) or one uploaded file."""
+    paths, names, tmp = [_archive_path(p) for p in path], list(path), None
+    if not paths and file is None: raise HTTPException(400, "give at least one path or upload a file")
+    if dtype is not None and dtype not in RAW_DTYPES:
+        raise HTTPException(400, f"dtype must be one of {', '.join(RAW_DTYPES)}")
+    kw = dict(spacing=mic_spacing, frame=frame, hop=hop, start=start,
+              sample_rate=sample_rate, channels=channels, dtype=dtype)
+    loop = asyncio.get_running_loop()
+    try:
+        if file is not None:
+            tmp = tempfile.NamedTemporaryFile(suffix=os.path.splitext(file.filename or "")[1], delete=False)
+            with tmp: await loop.run_in_executor(None, shutil.copyfileobj, file.file, tmp, 1 << 20)
+            paths.append(tmp.name); names.append(file.filename or "upload")
+        files, found = await loop.run_in_executor(None, functools.partial(analyze_files, paths, **kw))
+    except ValueError as e:
+        msg = str(e)
+        for full, name in zip(paths, names): msg = msg.replace(full, name)   # never echo server paths
+        raise HTTPException(400, msg)
+    finally:
+        if tmp is not None: os.unlink(tmp.name)
+    for f, name in zip(files, names): f["path"] = name
+    return {"files": files, "events": found, "count": len(found)}
 
 @app.post("/api/simulate")
 async def simulate(angle: float = 90.0, mic_spacing: float = 0.5):
@@ -70,7 +763,6 @@ async def simulate(angle: float = 90.0, mic_spacing: float = 0.5):
     tdoa_ms = (mic_spacing * cos_theta) / SPEED_OF_SOUND * 1000
     confidence = 0.85 + 0.12 * abs(math.sin(math.radians(angle)))
     event = {
-        "id": len(events) + 1,
         "timestamp": time.time(),
         "timestamp_iso": time.strftime("%H:%M:%S", time.gmtime()),
         "doa": round(angle, 1),
@@ -80,60 +772,497 @@ async def simulate(angle: float = 90.0, mic_spacing: float = 0.5):
         "snr": 42.0,
         "simulated": True
     }
-    if len(events) < MAX_EVENTS: events.append(event)
-    await manager.broadcast({**event, "is_gunshot": True})
+    event = store.add(event)
+    await state.publish({"type": "event", "event": event})
     return event
 
+def in_sector(doa, lo, hi):
+    if doa is None: return lo is None and hi is None
+    if lo is not None and hi is not None and lo > hi: return doa >= lo or doa <= hi   # wraps through 0
+    return (lo is None or doa >= lo) and (hi is None or doa <= hi)
+
+class Subscriber:
+    """One viewer socket: a bounded queue of pre-serialized messages drained by its own writer task."""
+    def __init__(self, ws, policy=VIEWER_POLICY, depth=VIEWER_QUEUE, min_confidence=0.0, doa_min=None, doa_max=None):
+        if policy not in VIEWER_POLICIES: raise ValueError(f"unknown policy {policy!r}")
+        self.ws, self.policy, self.depth = ws, policy, depth
+        self.min_confidence, self.doa_min, self.doa_max = min_confidence, doa_min, doa_max
+        self.queue, self.wake, self.dropped, self.closed = deque(), asyncio.Event(), 0, False
+
+    def wants(self, data):
+        return (data.get("confidence") or 0.0) >= self.min_confidence and \
+            in_sector(data.get("doa"), self.doa_min, self.doa_max)
+
+    def offer(self, text):
+        """Queue a message; returns False if the client has to be disconnected instead."""
+        if len(self.queue) >= self.depth:
+            if self.policy == "disconnect": return False
+            n = len(self.queue) if self.policy == "coalesce" else 1
+            if n > 1: self.queue.clear()
+            else: self.queue.popleft()
+            self.dropped += n; metrics.counters["viewer_dropped"] += n
+        self.queue.append(text); self.wake.set()
+        return True
+
+    async def run(self):
+        while not self.closed:
+            if not self.queue:
+                self.wake.clear(); await self.wake.wait(); continue
+            await self.ws.send_text(self.queue.popleft())
+
 class ConnectionManager:
-    def __init__(self): self.active = []
-    async def connect(self, ws): await ws.accept(); self.active.append(ws)
-    def disconnect(self, ws):
-        if ws in self.active: self.active.remove(ws)
+    """Detection fan-out to viewer sockets; each message is serialized once for every client."""
+    def __init__(self): self.active, self.closing = set(), set()
+
+    async def connect(self, ws, **filters):
+        sub = Subscriber(ws, **filters)
+        await ws.accept()
+        self.active.add(sub)
+        sub.task = asyncio.create_task(self._write(sub))
+        return sub
+
+    async def _write(self, sub):
+        try: await sub.run()
+        except Exception: pass
+        finally: self.disconnect(sub)
+
+    def disconnect(self, sub):
+        self.active.discard(sub)
+        sub.closed = True; sub.wake.set()
+
+    async def _kick(self, sub):
+        self.disconnect(sub)
+        try: await sub.ws.close(code=1013)   # try again later
+        except Exception: pass
+
     async def broadcast(self, data):
-        dead = []
-        for w in self.active:
-            try: await w.send_json(data)
-            except: dead.append(w)
-        for w in dead: self.disconnect(w)
+        text = json.dumps(data)
+        for sub in list(self.active):
+            if sub.wants(data) and not sub.offer(text):
+                task = asyncio.create_task(self._kick(sub))   # held until done so it is not collected mid-close
+                self.closing.add(task); task.add_done_callback(self.closing.discard)
 
 manager = ConnectionManager()
 
+class DSPExecutor:
+    """Runs frame analysis off the event loop, micro-batching frames that share an FFT plan across connections."""
+    def __init__(self, mode=DSP_MODE, workers=DSP_WORKERS, window=DSP_BATCH_WINDOW, max_batch=DSP_MAX_BATCH):
+        self.mode, self.workers, self.window, self.max_batch = mode, workers, window, max_batch
+        self.pool, self.task, self.pending = None, None, deque()
+        self.batches = self.frames = 0
+
+    def _start(self):
+        if self.mode == "process": self.pool = ProcessPoolExecutor(self.workers, initializer=_pool_init)
+        else: self.pool = ThreadPoolExecutor(self.workers)
+        self.slots = asyncio.Semaphore(self.workers)
+        self.wake = asyncio.Event()
+        self.task = asyncio.get_running_loop().create_task(self._dispatch())
+
+    def submit(self, chans, spacing, sr, geometry=None):
+        if self.task is None: self._start()
+        fut = asyncio.get_running_loop().create_future()
+        self.pending.append((fut, chans, spacing, sr, geometry, time.perf_counter())); self.wake.set()
+        return fut
+
+    async def _dispatch(self):
+        while True:
+            await self.wake.wait(); self.wake.clear()
+            if self.window: await asyncio.sleep(self.window)
+            groups = {}
+            while self.pending:
+                job = self.pending.popleft()
+                if not job[0].cancelled(): groups.setdefault((job[1].shape,) + job[2:5], []).append(job)
+            for jobs in groups.values():
+                for i in range(0, len(jobs), self.max_batch):
+                    await self.slots.acquire()
+                    asyncio.get_running_loop().create_task(self._run(jobs[i:i+self.max_batch]))
+
+    async def _run(self, jobs):
+        loop = asyncio.get_running_loop()
+        spacing, sr, geometry = jobs[0][2:5]
+        shm, t0 = None, time.perf_counter()
+        for j in jobs: metrics.observe("dsp_queue", t0 - j[5])
+        try:
+            if self.mode == "process":
+                shape = (len(jobs),) + jobs[0][1].shape
+                shm = shared_memory.SharedMemory(create=True, size=max(1, 4 * math.prod(shape)))
+                X = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+                for i, j in enumerate(jobs): X[i] = j[1]
+                del X
+                results, stages = await loop.run_in_executor(self.pool, _analyze_shm, shm.name, shape,
+                                                             spacing, sr, geometry)
+                metrics.merge(stages)
+            else:
+                X = np.stack([j[1] for j in jobs])
+                results = await loop.run_in_executor(self.pool, analyze_frames, X, spacing, sr, geometry)
+            for j, r in zip(jobs, results):
+                if not j[0].done(): j[0].set_result(r)
+            self.batches += 1; self.frames += len(jobs)
+            metrics.observe("dsp_batch", time.perf_counter() - t0); metrics.counters["dsp_batches"] += 1
+        except Exception as e:
+            for j in jobs:
+                if not j[0].done(): j[0].set_exception(e)
+        finally:
+            if shm is not None: shm.close(); shm.unlink()
+            self.slots.release()
+
+    def shutdown(self):
+        if self.task is not None: self.task.cancel()
+        if self.pool is not None: self.pool.shutdown(wait=False, cancel_futures=True)
+        self.pool = self.task = None
+
+dsp = DSPExecutor()
+
+class FrameLane:
+    """Bounded per-connection window of in-flight frames; drops the oldest when a sensor falls behind.
+
+    Level-only replies for gated frames are dropped before any onset analysis, so a slow
+    client loses meter updates rather than detections.
+    """
+    def __init__(self, depth=DSP_QUEUE_DEPTH):
+        self.depth, self.items, self.dropped = depth, deque(), 0
+        self.ready, self.error = asyncio.Event(), None
+
+    def push(self, meta, fut, level_only=False):
+        if len(self.items) >= self.depth:
+            i = next((k for k, item in enumerate(self.items) if item[2]), 0)
+            old = self.items[i][1]; del self.items[i]
+            old.cancel(); self.dropped += 1; metrics.counters["frames_dropped"] += 1
+        self.items.append((meta, fut, level_only)); self.ready.set()
+
+    def close(self, exc): self.error = exc; self.ready.set()
+
+    async def pop(self):
+        while not self.items:
+            if self.error is not None: raise self.error
+            self.ready.clear(); await self.ready.wait()
+        meta, fut, _ = self.items.popleft()
+        return meta, fut
+
+class OnsetGate:
+    """Per-connection streaming front end: a ring buffer plus recursive STA/LTA and peak-envelope stats.
+
+    Frames without an onset never reach the DSP executor; each onset yields one frame-length
+    window centred on it, so a shot straddling two frames is analysed whole.
+    """
+    def __init__(self):
+        self.ring, self.frames, self.gated, self.onsets = None, 0, 0, 0
+
+    def _reset(self, C, n, sr):
+        self.ring, self.n, self.sr, self.pos, self.hold = np.zeros((C, 2 * n), np.float32), n, sr, 0, 0
+        self.a_s, self.a_l, self.a_p = (math.exp(-1.0 / (t * sr)) for t in (ONSET_SHORT_S, ONSET_LONG_S, ONSET_PEAK_S))
+        a = np.array([self.a_s, self.a_l, self.a_p, self.a_p ** 2])[:, None]
+        self.p_s, self.p_l, self.p_p = a[:3] ** np.arange(1, EMA_BLOCK + 1)   # in-block powers for the full recursion
+        self.tail = a ** np.arange(n - 1, -1, -1)                              # weight of each sample at frame end
+        self.sta = self.lta = None
+        self.env, self.pending = 0.0, deque()
+
+    def feed(self, chans, sr):
+        """Push one (channels, samples) frame; returns (level stats, [(window, onset info), ...])."""
+        C, n = chans.shape
+        if self.ring is None or self.ring.shape[0] != C or n != self.n or sr != self.sr: self._reset(C, n, sr)
+        cap, i = self.ring.shape[1], self.pos % self.ring.shape[1]
+        k = min(n, cap - i)
+        self.ring[:, i:i+k] = chans[:, :k]; self.ring[:, :n-k] = chans[:, k:]
+        power = np.einsum("ij,ij->i", chans[:2], chans[:2], dtype=np.float64) / n   # mean square of A and B
+        x2 = np.square(chans[0], dtype=np.float64)
+        if self.lta is None: self.sta = self.lta = float(power[0])
+        if max(self.sta, float(x2.max())) < ONSET_MIN_RMS ** 2:
+            # the STA never exceeds its inputs, so no sample can trigger: only carry the end values forward
+            s, l = self.tail[:2] @ x2
+            self.sta = self.tail[0, 0] * self.a_s * self.sta + (1 - self.a_s) * s
+            self.lta = self.tail[1, 0] * self.a_l * self.lta + (1 - self.a_l) * l
+            self.env = max(self.tail[2, 0] * self.a_p * self.env, math.sqrt(float((x2 * self.tail[3]).max())))
+            hot = np.empty(0, np.intp)
+        else:
+            sta, lta = _ema(x2, self.a_s, self.sta, self.p_s), _ema(x2, self.a_l, self.lta, self.p_l)
+            env = _peak_env(np.abs(chans[0]).astype(np.float64), self.a_p, self.env, self.p_p)
+            self.sta, self.lta, self.env = sta[-1], lta[-1], env[-1]
+            ratio = sta / (lta + 1e-12)
+            hot = np.flatnonzero((ratio >= ONSET_RATIO) & (sta >= ONSET_MIN_RMS ** 2)) + self.pos
+        while True:
+            hot = hot[hot >= self.hold]
+            if not hot.size: break
+            j = hot[0] - self.pos
+            self.pending.append((int(hot[0]), {"sta_lta": float(ratio[j]), "crest": float(env[j] / math.sqrt(sta[j]))}))
+            self.hold = hot[0] + n // 2; self.onsets += 1
+        self.pos += n
+        windows = []
+        while self.pending and self.pending[0][0] + n - n // 2 <= self.pos:
+            p, info = self.pending.popleft()
+            start = max(p - n // 2, self.pos - cap)
+            idx = np.arange(start, start + n) % cap
+            windows.append((self.ring[:, idx], info))
+        self.frames += 1; metrics.frame()
+        if not windows: self.gated += 1; metrics.counters["frames_gated"] += 1
+        metrics.counters["onsets"] += len(windows)
+        r_a, r_b = math.sqrt(float(power[0])), math.sqrt(float(power[1]))
+        return {"rms_a": r_a, "rms_b": r_b, "db_a": 20 * math.log10(max(r_a, 1e-10)),
+                "db_b": 20 * math.log10(max(r_b, 1e-10))}, windows
+
+def _claim(claims, key, ttl):
+    now = time.monotonic()
+    if claims.get(key, 0.0) > now: return False
+    claims[key] = now + ttl
+    return True
+
+class LocalState:
+    """In-process pub/sub and cooldown claims: the single-worker default.
+
+    A backend is anything with these four coroutines; a Redis one would map publish to
+    PUBLISH/SUBSCRIBE and claim to SET key NX PX ttl.
+    """
+    shared = False
+    def __init__(self): self.claims = {}
+    async def start(self): pass
+    async def stop(self): pass
+    async def publish(self, data): await on_state_message(data)
+    async def claim(self, key, ttl): return _claim(self.claims, key, ttl)
+
+class UnixBrokerState(LocalState):
+    """Shares pub/sub and claims between worker processes through run_broker on a Unix socket.
+
+    The first worker that finds no broker spawns one, which exits once every worker has gone,
+    so a redeploy starts a fresh broker. To run it as its own service instead, start
+    ``python main.py broker PATH`` before the workers. While the broker is unreachable the
+    worker falls back to local delivery and local claims.
+    """
+    shared = True
+    def __init__(self, path):
+        super().__init__()
+        self.path, self.writer, self.task, self.rid, self.waiting, self.spawned = path, None, None, 0, {}, 0.0
+
+    async def start(self): self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None: self.task.cancel()
+        if self.writer is not None: self.writer.close()
+
+    def _spawn_broker(self):
+        import fcntl   # POSIX only, like the unix socket itself
+        if time.monotonic() - self.spawned < 2.0: return
+        self.spawned = time.monotonic()
+        with open(self.path + ".lock", "a") as lock:
+            try: fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError: return   # a broker holds the path and is still starting up
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), "broker", self.path,
+                          "--idle-exit", str(BROKER_IDLE_EXIT)], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    async def _run(self):
+        while True:
+            try: reader, writer = await asyncio.open_unix_connection(self.path)
+            except OSError:
+                self._spawn_broker(); await asyncio.sleep(0.2); continue
+            self.writer = writer
+            try:
+                async for line in reader:
+                    msg = json.loads(line)
+                    if msg["op"] == "pub":
+                        try: await on_state_message(msg["data"])
+                        except Exception as e:   # our bug, not the broker's: report it and keep relaying
+                            asyncio.get_running_loop().call_exception_handler(
+                                {"message": "state message handler failed", "exception": e})
+                    elif msg["op"] == "claimed":
+                        fut = self.waiting.pop(msg["rid"], None)
+                        if fut is not None and not fut.done(): fut.set_result(msg["ok"])
+            except (OSError, asyncio.IncompleteReadError, ValueError, KeyError): pass   # broker gone or garbled: reconnect
+            finally:
+                self.writer = None
+                for fut in self.waiting.values():
+                    if not fut.done(): fut.set_result(None)
+                self.waiting.clear()
+            await asyncio.sleep(0.2)
+
+    async def publish(self, data):
+        if self.writer is None: return await on_state_message(data)
+        self.writer.write(json.dumps({"op": "pub", "data": data}).encode() + b"\n")
+
+    async def claim(self, key, ttl):
+        if self.writer is not None:
+            self.rid += 1; rid = self.rid
+            fut = self.waiting[rid] = asyncio.get_running_loop().create_future()
+            self.writer.write(json.dumps({"op": "claim", "rid": rid, "key": key, "ttl": ttl}).encode() + b"\n")
+            try: ok = await asyncio.wait_for(fut, BROKER_CLAIM_TIMEOUT)
+            except asyncio.TimeoutError: ok = None; self.waiting.pop(rid, None)
+            if ok is not None: return ok
+        return _claim(self.claims, key, ttl)
+
+async def run_broker(path, idle_exit=None):
+    """Relay published messages to every worker and arbitrate claims; one broker per socket path.
+
+    With ``idle_exit`` (how workers spawn it) the broker exits that many seconds after its last
+    worker disconnects; without it, it runs until killed, as a standalone service.
+    """
+    import fcntl
+    lock = open(path + ".lock", "w")
+    try: fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError: return   # another broker already owns this path
+    if os.path.exists(path): os.unlink(path)
+    peers, claims, idle_since = set(), {}, [time.monotonic()]
+
+    def send(w, data):
+        # a worker that stops reading is dropped rather than buffered without bound; it reconnects
+        if w.transport.get_write_buffer_size() > BROKER_PEER_BUFFER: peers.discard(w); w.close()
+        else: w.write(data)
+
+    async def serve(reader, writer):
+        peers.add(writer)
+        try:
+            async for line in reader:
+                msg = json.loads(line)
+                if msg["op"] == "pub":
+                    for w in list(peers): send(w, line)   # forwarded as received, never re-encoded
+                elif msg["op"] == "claim":
+                    ok = _claim(claims, msg["key"], msg["ttl"])
+                    send(writer, json.dumps({"op": "claimed", "rid": msg["rid"], "ok": ok}).encode() + b"\n")
+        except Exception: pass
+        finally:
+            peers.discard(writer); writer.close()
+            if not peers: idle_since[0] = time.monotonic()
+
+    server = await asyncio.start_unix_server(serve, path)
+    async with server:
+        if idle_exit is None: await server.serve_forever()
+        while peers or time.monotonic() - idle_since[0] < idle_exit:
+            await asyncio.sleep(min(idle_exit, 1.0))
+    os.unlink(path)
+
+def make_state(spec=STATE_BACKEND):
+    if spec == "local": return LocalState()
+    if spec.startswith("unix:"): return UnixBrokerState(spec[5:])
+    raise ValueError(f"unknown SENTINEL_STATE {spec!r}")
+
+state = make_state()
+
+async def on_state_message(data):
+    # every worker, including the publisher, sees each message exactly once
+    if data["type"] == "event":
+        store.remember(data["event"])
+        await manager.broadcast({**data["event"], "is_gunshot": True})
+    elif data["type"] == "clear": store.recent.clear()
+
+async def _read_frames(websocket, lane, gate):
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            msg = await websocket.receive()
+            if msg["type"] == "websocket.disconnect": raise WebSocketDisconnect(msg.get("code", 1000))
+            t0 = time.perf_counter()
+            try: chans, spacing, sr, seq, binary, geometry = decode_frame(msg)
+            except ValueError as e:   # a malformed frame is the sensor's bug: say so rather than 1011
+                await websocket.close(code=1007, reason=str(e)[:120]); raise WebSocketDisconnect(1007)
+            if chans.shape[1] == 0: continue
+            t1 = time.perf_counter()
+            level, windows = gate.feed(chans, sr)
+            metrics.observe("decode", t1 - t0); metrics.observe("gate", time.perf_counter() - t1)
+            for window, info in windows:
+                lane.push((seq, binary, info, t0), dsp.submit(window, spacing, sr, geometry))
+            if not windows:
+                done = loop.create_future(); done.set_result(None)
+                lane.push((seq, binary, level, t0), done, level_only=True)
+    except Exception as e: lane.close(e)
+
+lanes = set()   # one FrameLane per connected sensor
+
+async def _reply(websocket, result, seq, binary, t_recv):
+    t0 = time.perf_counter()
+    if binary: await websocket.send_bytes(encode_result(result, seq))
+    else: await websocket.send_json(result)
+    t1 = time.perf_counter()
+    metrics.observe("send", t1 - t0); metrics.observe("frame_total", t1 - t_recv)
+
 @app.websocket("/ws/audio")
 async def audio_ws(websocket: WebSocket):
-    await manager.connect(websocket)
-    cooldown = 0
+    await websocket.accept()
+    lane, gate = FrameLane(), OnsetGate()
+    lanes.add(lane)
+    reader = asyncio.create_task(_read_frames(websocket, lane, gate))
     try:
         while True:
-            frame = json.loads(await websocket.receive_text())
-            mic_a = np.array(frame.get("mic_a", []), dtype=np.float32)
-            mic_b = np.array(frame.get("mic_b", []), dtype=np.float32)
-            spacing = float(frame.get("mic_spacing", 0.5))
-            sr = int(frame.get("sample_rate", SAMPLE_RATE))
-            if len(mic_a) == 0: continue
-            max_lag = int((spacing / SPEED_OF_SOUND) * sr) + 10
-            lag, gcc_peak = gcc_phat(mic_a, mic_b, max_lag=max_lag)
-            doa = tdoa_to_doa(lag, spacing)
-            tdoa_ms = (lag / sr) * 1000.0
-            rms_a, rms_b = rms(mic_a), rms(mic_b)
-            db_a, db_b = db(mic_a), db(mic_b)
+            (seq, binary, info, t_recv), fut = await lane.pop()
+            try: r = await fut
+            except asyncio.CancelledError: continue
+            if r is None:
+                # gated frame: levels only, no localisation
+                result = {"doa": None, "tdoa_ms": None,
+                          "rms_a": round(info["rms_a"],5), "rms_b": round(info["rms_b"],5),
+                          "db_a": round(info["db_a"],1), "db_b": round(info["db_b"],1),
+                          "snr": round(info["db_a"]+60,1), "gcc_peak": None,
+                          "is_gunshot": False, "confidence": 0.0, "timestamp": time.time(),
+                          "gated": True, "gated_frames": gate.gated}
+                await _reply(websocket, result, seq, binary, t_recv)
+                continue
+            doa, tdoa_ms, db_a = r["doa"], r["tdoa_ms"], r["db_a"]
             is_gs, conf = False, 0.0
-            if cooldown == 0:
-                is_gs, conf = classify(mic_a, mic_b, GUNSHOT_RMS_THRESHOLD)
-                if is_gs:
-                    cooldown = COOLDOWN_FRAMES
-                    ev = {"id": len(events)+1, "timestamp": time.time(),
-                          "timestamp_iso": time.strftime("%H:%M:%S", time.gmtime()),
-                          "doa": round(doa,1), "tdoa_ms": round(tdoa_ms,4),
-                          "confidence": round(conf,3), "db_a": round(db_a,1)}
-                    if len(events) < MAX_EVENTS: events.append(ev)
-            else: cooldown -= 1
-            await websocket.send_json({
-                "doa": round(doa,2), "tdoa_ms": round(tdoa_ms,4),
-                "rms_a": round(rms_a,5), "rms_b": round(rms_b,5),
-                "db_a": round(db_a,1), "db_b": round(db_b,1),
-                "snr": round(db_a+60,1), "gcc_peak": round(gcc_peak,4),
+            if r["is_gunshot"] and await state.claim("detection", COOLDOWN_SECONDS):
+                is_gs, conf = True, r["confidence"]
+                ev = {"timestamp": time.time(),
+                      "timestamp_iso": time.strftime("%H:%M:%S", time.gmtime()),
+                      "doa": round_deg(doa,1), "tdoa_ms": round(tdoa_ms,4),
+                      "confidence": round(conf,3), "db_a": round(db_a,1)}
+                if "elevation" in r: ev["elevation"] = round(r["elevation"],1)
+                ev = store.add(ev)
+                await state.publish({"type": "event", "event": ev})
+            result = {
+                "doa": round_deg(doa,2), "tdoa_ms": round(tdoa_ms,4),
+                "rms_a": round(r["rms_a"],5), "rms_b": round(r["rms_b"],5),
+                "db_a": round(db_a,1), "db_b": round(r["db_b"],1),
+                "snr": round(db_a+60,1), "gcc_peak": round(r["gcc_peak"],4),
                 "is_gunshot": is_gs, "confidence": round(conf,3),
-                "timestamp": time.time()
-            })
-    except WebSocketDisconnect: manager.disconnect(websocket)
-    except Exception: manager.disconnect(websocket)
+                "timestamp": time.time(),
+                "gated": False, "gated_frames": gate.gated,
+                "sta_lta": round(info["sta_lta"],2), "crest": round(info["crest"],2)
+            }
+            if "elevation" in r:
+                result.update(azimuth=round_deg(r["azimuth"],2), elevation=round(r["elevation"],2),
+                              srp_peak=round(r["srp_peak"],4), channels=r["channels"])
+            await _reply(websocket, result, seq, binary, t_recv)
+    except WebSocketDisconnect: pass
+    except Exception:
+        try: await websocket.close(code=1011)
+        except Exception: pass
+    finally: reader.cancel(); lanes.discard(lane)
+
+@app.websocket("/ws/events")
+async def events_ws(websocket: WebSocket, policy: str = VIEWER_POLICY, min_confidence: float = 0.0,
+                    doa_min: float | None = None, doa_max: float | None = None):
+    if policy not in VIEWER_POLICIES: await websocket.close(code=1008); return
+    sub = await manager.connect(websocket, policy=policy, min_confidence=min_confidence,
+                                doa_min=doa_min, doa_max=doa_max)
+    try:
+        while not sub.closed: await websocket.receive_text()   # viewers only listen; this notices the close
+    except Exception: pass
+    finally: manager.disconnect(sub)
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Acoustic Sentinel tools")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    br = sub.add_parser("broker", help="run the multi-worker state broker")
+    br.add_argument("path")
+    br.add_argument("--idle-exit", type=float, default=None, help="exit this many seconds after the last worker leaves")
+    an = sub.add_parser("analyze", help="scan recorded WAV/raw PCM files for gunshots")
+    an.add_argument("files", nargs="+")
+    an.add_argument("--spacing", type=float, default=0.5, help="mic spacing in metres (2-channel / linear arrays)")
+    an.add_argument("--frame", type=int, default=2048)
+    an.add_argument("--hop", type=int, default=None, help="default: frame / 2")
+    an.add_argument("--start", type=float, default=None, help="epoch time of the first sample")
+    an.add_argument("--workers", type=int, default=None)
+    an.add_argument("--rate", type=int, help="raw PCM sample rate")
+    an.add_argument("--channels", type=int, help="raw PCM channel count")
+    an.add_argument("--dtype", help="raw PCM sample type, e.g. <i2 or <f4")
+    an.add_argument("-o", "--out", help="write the event table as JSON here instead of stdout")
+    args = ap.parse_args()
+    if args.cmd == "broker": asyncio.run(run_broker(args.path, args.idle_exit))
+    elif args.cmd == "analyze":
+        files, found = analyze_files(args.files, workers=args.workers, spacing=args.spacing, frame=args.frame,
+                                     hop=args.hop, start=args.start, sample_rate=args.rate,
+                                     channels=args.channels, dtype=args.dtype)
+        for f in files: print(f"{f['path']}: {f['duration_s']:.1f}s, {f['frames']} frames, {f['events']} events",
+                              file=sys.stderr)
+        out = json.dumps({"events": found, "count": len(found)}, indent=1)
+        if args.out:
+            with open(args.out, "w") as fh: fh.write(out)
+        else: print(out)
@@ -0,0 +1,4 @@
+import os, sys
+
+os.environ.setdefault("SENTINEL_EVENT_DB", ":memory:")   # tests never touch the real event log
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+@pytest.fixture
+def raw(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "ARCHIVE_DIR", str(tmp_path))
+    (np.random.default_rng(0).standard_normal((8000, 2)) * 0.01).astype("<f4").tofile(tmp_path / "quiet.pcm")
+    return str(tmp_path / "quiet.pcm")
+
+@pytest.mark.parametrize("kw, msg", [
+    ({"dtype": "c16"}, "dtype"), ({"dtype": "O"}, "dtype"), ({"sample_rate": -5}, "sample_rate"),
+    ({"channels": 1}, "channels"), ({"spacing": 0.0}, "mic_spacing"), ({"spacing": float("nan")}, "mic_spacing"),
+])
+def test_analyze_file_rejects_bad_parameters(raw, kw, msg):
+    with pytest.raises(ValueError, match=msg):
+        main.analyze_file(raw, **{"dtype": "<f4", "sample_rate": 16000, "channels": 2, **kw})
+
+@pytest.mark.parametrize("query, status", [
+    ("dtype=garbage", 400), ("dtype=c16", 400), ("sample_rate=-5", 422), ("channels=0", 422), ("mic_spacing=0", 422),
+    ("", 200),
+])
+def test_analyze_endpoint_validates(raw, query, status):
+    with TestClient(main.app) as client:
+        r = client.post(f"/api/analyze?path=quiet.pcm&dtype=%3Cf4&sample_rate=16000&channels=2&{query}")
+    assert r.status_code == status
+    if status == 200: assert r.json()["files"][0]["path"] == "quiet.pcm"
+
+def test_upload_is_analysed_and_removed(raw, monkeypatch, tmp_path):
+    monkeypatch.setattr(main.tempfile, "tempdir", str(tmp_path / "uploads")); (tmp_path / "uploads").mkdir()
+    with TestClient(main.app) as client, open(raw, "rb") as f:
+        r = client.post("/api/analyze?dtype=%3Cf4&sample_rate=16000&channels=2", files={"file": ("take.pcm", f)})
+    assert r.status_code == 200 and r.json()["files"][0]["path"] == "take.pcm"
+    assert not list((tmp_path / "uploads").iterdir())
@@ -0,0 +1,12 @@
+import numpy as np
+import pytest
+
+import main
+
+@pytest.mark.parametrize("n, spacing, sr", [(1024, 0.5, 44100), (2048, 0.3, 16000)])
+def test_classify_matches_live_path(n, spacing, sr):
+    rng = np.random.default_rng(n)
+    burst = np.zeros(n); burst[n // 4:] = rng.standard_normal(n - n // 4) * np.exp(-np.arange(n - n // 4) / (n / 8))
+    a, b = burst + rng.standard_normal(n) * 0.01, np.roll(burst, 3) + rng.standard_normal(n) * 0.01
+    live = main.analyze_batch(a[None], b[None], spacing, sr)[0]
+    assert main.classify(a, b, main.GUNSHOT_RMS_THRESHOLD, spacing, sr) == (live["is_gunshot"], live["confidence"])
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+import main
+
+@pytest.fixture
+def store(tmp_path):
+    s, rng = main.EventStore(str(tmp_path / "events.db"), ring=8), random.Random(5)
+    for i in range(300):   # clocks jitter, so time order is not quite id order
+        s.remember(s.add({"timestamp": 1000 + i + rng.uniform(-3, 3), "doa": rng.uniform(0, 360),
+                          "confidence": rng.random()}))
+    return s
+
+def every_page(store, **kw):
+    out, cursor = [], None
+    while True:
+        page, cursor = store.query(cursor=cursor, **kw)
+        assert len(page) <= kw.get("limit", 100)
+        out += page
+        if cursor is None: return [e["id"] for e in out]
+
+def expected(store, start=None, end=None, doa_min=None, doa_max=None, min_confidence=None, **_):
+    rows = [main.EventStore._row(r) for r in store.db.execute("SELECT id, data FROM events")]
+    keep = lambda e: ((start is None or e["timestamp"] >= start) and (end is None or e["timestamp"] < end)
+        and (min_confidence is None or e["confidence"] >= min_confidence)
+        and ((e["doa"] >= doa_min or e["doa"] <= doa_max) if doa_min is not None and doa_max is not None
+             and doa_min > doa_max else (doa_min is None or e["doa"] >= doa_min) and (doa_max is None or e["doa"] <= doa_max)))
+    key = (lambda e: (e["timestamp"], e["id"])) if start is not None or end is not None else (lambda e: e["id"])
+    return [e["id"] for e in sorted(filter(keep, rows), key=key, reverse=True)]
+
+@pytest.mark.parametrize("kw", [
+    {}, {"limit": 7}, {"start": 1100}, {"end": 1050, "limit": 9}, {"start": 1020, "end": 1200, "min_confidence": 0.5},
+    {"min_confidence": 0.97}, {"min_confidence": 0.2, "limit": 13}, {"doa_min": 90, "doa_max": 180},
+    {"doa_min": 350, "doa_max": 10}, {"doa_min": 300, "doa_max": 60, "min_confidence": 0.3, "limit": 5},
+])
+def test_pages_cover_the_filter_once(store, kw):
+    assert every_page(store, **kw) == expected(store, **kw)
+
+def test_since_id_pages_forward(store):
+    page, nxt = store.query(since_id=250, limit=20)
+    assert [e["id"] for e in page] == list(range(251, 271)) and nxt == 270
+    page, nxt = store.query(since_id=290, min_confidence=0.0)
+    assert [e["id"] for e in page] == list(range(291, 301)) and nxt == 300
+    assert store.query(since_id=300) == ([], 300)
+
+def test_limit_is_clamped(store):
+    assert len(store.query(limit=0)[0]) == 1
+    assert len(store.query(limit=10 ** 6)[0]) == 300   # EVENT_PAGE_MAX is above the log size
+
+@pytest.mark.parametrize("kw", [{"start": 1290}, {"end": 1010}, {"min_confidence": 0.99}, {"doa_min": 10, "doa_max": 11}])
+def test_selective_filters_search_an_index(store, kw):
+    sent = []   # statements with their parameters bound
+    store.reader().set_trace_callback(sent.append)
+    store.query(**kw)
+    sql = next(q for q in sent if q.startswith("SELECT id, data"))
+    plan = " ".join(r[3] for r in store.reader().execute("EXPLAIN QUERY PLAN " + sql))
+    assert "SEARCH" in plan and "SCAN events" not in plan
+
+def statements(store):
+    sent = []
+    store.reader().set_trace_callback(sent.append)
+    return sent
+
+def test_current_ring_answers_without_sql(tmp_path):
+    s = main.EventStore(str(tmp_path / "events.db"), ring=8)
+    for i in range(5): s.remember(s.add({"timestamp": i}))
+    sent = statements(s)
+    assert [e["id"] for e in s.query()[0]] == [5, 4, 3, 2, 1]
+    assert [e["id"] for e in s.query(since_id=3)[0]] == [4, 5]
+    assert not any(q.startswith("SELECT id, data") for q in sent)
+
+def test_ring_defers_to_other_writers(tmp_path):
+    # two workers on one log without a broker: neither ring sees the other's events
+    a, b = (main.EventStore(str(tmp_path / "events.db"), ring=8) for _ in range(2))
+    a.open(); b.open()
+    for i in range(6): (a if i % 2 else b).remember((a if i % 2 else b).add({"timestamp": i}))
+    for s in (a, b):
+        assert [e["id"] for e in s.query()[0]] == [6, 5, 4, 3, 2, 1]
+        assert [e["id"] for e in s.query(since_id=2)[0]] == [3, 4, 5, 6]
+    b.remember(b.add({"timestamp": 6}))   # a's ring now ends one short
+    assert [e["id"] for e in a.query(limit=2)[0]] == [7, 6]
+    b.clear()                             # a cleared log, a ring that still holds events
+    c = main.EventStore(str(tmp_path / "events.db"), ring=8)
+    c.remember(c.add({"timestamp": 7}))
+    assert [e["id"] for e in a.query()[0]] == [8] and [e["id"] for e in b.query()[0]] == [8]
+    c.clear()
+    assert a.query() == ([], None) and a.query(since_id=0) == ([], 0)
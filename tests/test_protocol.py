@@ -0,0 +1,85 @@
+import json, math
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from fastapi.websockets import WebSocketDisconnect
+
+import main
+
+def binary(pcm, code, flags=0, seq=7, sr=48000, spacing=0.3, geometry=None):
+    hdr = main.FRAME_HDR.pack(main.FRAME_MAGIC, main.FRAME_VERSION, code, pcm.shape[1], flags, seq, sr, spacing)
+    pos = b"" if geometry is None else np.asarray(geometry, "<f4").tobytes()
+    return {"bytes": hdr + pos + pcm.astype(main.FRAME_DTYPES[code]).tobytes()}
+
+def test_int16_round_trip():
+    pcm = np.array([[0, 16384], [-32768, 32767], [100, -100]], dtype=np.int16)   # (samples, channels)
+    chans, spacing, sr, seq, reply, geometry = main.decode_frame(binary(pcm, 0, main.FLAG_BINARY_RESULT))
+    assert chans.shape == (2, 3) and chans.dtype == np.float32
+    np.testing.assert_allclose(chans, pcm.T / 32768)
+    assert (spacing, sr, seq, reply, geometry) == (pytest.approx(0.3), 48000, 7, True, None)
+
+def test_float32_round_trip():
+    pcm = np.random.default_rng(0).standard_normal((64, 3)).astype(np.float32)
+    chans, *_ , reply, geometry = main.decode_frame(binary(pcm, 1))
+    np.testing.assert_array_equal(chans, pcm.T)
+    assert not reply and geometry is None
+
+def test_geometry_round_trip():
+    pos = [(0.0, 0.0, 0.0), (0.25, 0.0, 0.0), (0.0, 0.25, 0.5)]
+    pcm = np.zeros((16, 3), dtype=np.float32)
+    chans, spacing, _, _, _, geometry = main.decode_frame(binary(pcm, 1, main.FLAG_GEOMETRY, spacing=0.0, geometry=pos))
+    assert chans.shape == (3, 16) and geometry == tuple(pos) and spacing == 0.0   # arrays need no spacing
+
+def test_legacy_json():
+    frame = {"mic_a": [0.1, 0.2], "mic_b": [0.3, 0.4], "mic_spacing": 0.4, "sample_rate": 16000, "seq": 3}
+    chans, spacing, sr, seq, reply, geometry = main.decode_frame({"text": json.dumps(frame)})
+    np.testing.assert_allclose(chans, [[0.1, 0.2], [0.3, 0.4]])
+    assert (spacing, sr, seq, reply, geometry) == (0.4, 16000, 3, False, None)
+    chans, spacing, sr, *_ = main.decode_frame({"text": json.dumps({"mic_a": [0.0], "mic_b": [0.0]})})
+    assert (spacing, sr) == (0.5, main.SAMPLE_RATE)
+
+def test_json_channels_geometry():
+    frame = {"channels": [[0.0] * 4] * 3, "geometry": [[0, 0], [0.2, 0], [0, 0.2, 0.1]]}
+    chans, *_, geometry = main.decode_frame({"text": json.dumps(frame)})
+    assert chans.shape == (3, 4) and geometry == ((0, 0, 0), (0.2, 0, 0), (0, 0.2, 0.1))
+
+@pytest.mark.parametrize("msg", [
+    {"bytes": b"AS"},                                                            # short
+    binary(np.zeros((4, 2)), 1, sr=0),
+    binary(np.zeros((4, 2)), 1, spacing=0.0),
+    binary(np.zeros((4, 2)), 1, spacing=math.nan),
+    {"bytes": binary(np.zeros((4, 2)), 1)["bytes"] + b"\0"},                    # partial trailing sample
+    binary(np.zeros((0, 3)), 1, main.FLAG_GEOMETRY, geometry=[(0, 0, 0)] * 2),  # geometry cut short
+    {"text": "[1, 2]"},
+    {"text": "not json"},
+    {"text": json.dumps({"mic_a": [0.1], "mic_b": [0.1], "sample_rate": -5})},
+    {"text": json.dumps({"mic_a": [0.1], "mic_b": [0.1], "mic_spacing": None})},
+    {"text": json.dumps({"channels": [[0.1], [0.1]], "geometry": [1, 2]})},
+])
+def test_bad_frames_raise_value_error(msg):
+    with pytest.raises(ValueError): main.decode_frame(msg)
+
+def result(**extra):
+    return {"doa": 45.0, "tdoa_ms": 1.03, "rms_a": 0.2, "rms_b": 0.19, "db_a": -14.0, "db_b": -14.4, "snr": 46.0,
+            "gcc_peak": 0.8, "confidence": 0.9, "is_gunshot": True, "timestamp": 1700000000.25, **extra}
+
+def test_encode_result():
+    out = main.encode_result(result(), (1 << 32) + 5)
+    assert len(out) == main.RESULT_HDR.size
+    magic, seq, doa, tdoa, *levels, peak, conf, gunshot, ts = main.RESULT_HDR.unpack(out)
+    assert (magic, seq, gunshot, ts) == (main.RESULT_MAGIC, 5, 1, 1700000000.25)   # seq wraps like the header's
+    np.testing.assert_allclose([doa, tdoa, *levels, peak, conf], [45.0, 1.03, 0.2, 0.19, -14.0, -14.4, 46.0, 0.8, 0.9],
+                               rtol=1e-6)
+
+def test_encode_result_gated_and_array():
+    out = main.encode_result(result(doa=None, tdoa_ms=None, gcc_peak=None, elevation=12.5, srp_peak=0.7, channels=4), 1)
+    head = main.RESULT_HDR.unpack_from(out)
+    assert math.isnan(head[2]) and math.isnan(head[3]) and math.isnan(head[9])
+    assert main.ARRAY_TAIL.unpack_from(out, main.RESULT_HDR.size) == (12.5, pytest.approx(0.7), 4.0)
+
+def test_bad_frame_closes_with_1007():
+    with TestClient(main.app) as client, client.websocket_connect("/ws/audio") as ws:
+        ws.send_bytes(binary(np.zeros((4, 2)), 1, sr=0)["bytes"])
+        with pytest.raises(WebSocketDisconnect) as e: ws.receive_bytes()
+    assert e.value.code == 1007 and "sample_rate" in e.value.reason